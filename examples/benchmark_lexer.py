@@ -0,0 +1,66 @@
+"""
+Compare the default scanner with the `fast=True` one on a large file
+
+usage: python examples/benchmark_lexer.py [--copies N] [--rounds N]
+"""
+
+import os
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable
+
+from kola.lexer import FileLexer
+from kola.parser import Parser
+
+
+SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "example0.kola")
+
+
+def syntax_check(path: str, fast: bool) -> None:
+    # the statements are only scanned, no command is called
+    Parser(FileLexer(path, fast=fast), {}, diagnostics=[]).check()
+
+
+def iterate_tokens(path: str, fast: bool) -> None:
+    # every token is built with its line number
+    for _ in FileLexer(path, fast=fast):
+        pass
+
+
+def best_time(func: Callable[[str, bool], None], path: str, fast: bool, rounds: int) -> float:
+    times = []
+    for _ in range(rounds):
+        start = perf_counter()
+        func(path, fast)
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--copies", type=int, default=10000, help="copies of example0.kola in the test file")
+    parser.add_argument("--rounds", type=int, default=3, help="runs of each case, the best one is reported")
+    args = parser.parse_args()
+
+    with open(SOURCE, encoding="utf-8") as f:
+        text = f.read()
+    if not text.endswith("\n"):
+        text += "\n"
+    with TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.kola")
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(args.copies):
+                f.write(text)
+        size = os.path.getsize(path) / (1 << 20)
+        tokens = sum(1 for _ in FileLexer(path, fast=True))
+        print(f"{size:.1f} MB, {tokens} tokens, best of {args.rounds} runs")
+
+        for name, func in [("syntax check", syntax_check), ("FileLexer iteration", iterate_tokens)]:
+            default = best_time(func, path, False, args.rounds)
+            fast = best_time(func, path, True, args.rounds)
+            print(f"{name:<20} default {default:.2f}s  fast {fast:.2f}s  ({default / fast:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
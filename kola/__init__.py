@@ -3,8 +3,8 @@ simple python module for KoiLang parsing
 """
 
 from .lexer import BaseLexer, FileLexer, StringLexer
-from .parser import Parser
-from .writer import BaseWriter, FileWriter, StringWriter, BaseWriterItem, FormatItem, ComplexArg, WriterItemLike
+from .parser import CommandBatch, Parser, validate
+from .writer import BaseWriter, FileWriter, StringWriter, AsyncStreamWriter, TeeWriter, BaseWriterItem, FormatItem, ComplexArg, WriterItemLike
 from .klvm import KoiLang, Environment, kola_command, kola_text, kola_number, kola_annotation, kola_env_enter, kola_env_exit, kola_env_class
 from .version import __version__, __version_num__
 from .exception import KoiLangError, KoiLangSyntaxError, KoiLangCommandError
@@ -27,9 +27,13 @@ __all__ = [
     "FileLexer",
     "StringLexer",
     "Parser",
+    "CommandBatch",
+    "validate",
     "BaseWriter",
     "FileWriter",
     "StringWriter",
+    "AsyncStreamWriter",
+    "TeeWriter",
     "BaseWriterItem",
     "FormatItem",
     "ComplexArg",
@@ -1,9 +1,11 @@
 #ifndef _INCLUDE_HELPER_
 #define _INCLUDE_HELPER_ 
 
+#include <errno.h>
 #include <stdint.h>
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 #include <Python.h>
 
 #ifdef MS_WINDOWS
@@ -23,18 +25,101 @@ typedef void* yyscan_t;
 #define LFLAG_DISABLED      (1 << 0)
 #define LFLAG_ISANNOTATION  (1 << 1)
 #define LFLAG_NOLSTRIP        (1 << 2)
+#define LFLAG_TEXTPART      (1 << 3)
+
+/* Input hook used by YY_INPUT, returns bytes read, 0 on EOF and -1 on error */
+typedef int (*kola_input_func)(void* ctx, char* buf, int max_size, FILE* fp, int interactive);
 
 typedef struct lexer_extra {
     const char* filename;
     uint8_t command_threshold;
     uint8_t flag;
+    size_t max_text_size;   /* split longer text into parts, 0 for no limit */
+    kola_input_func input;
+    void* input_ctx;
+    /* line tracking of the fast scanner */
+    size_t input_total;     /* bytes read from input */
+    size_t input_lines;     /* newlines read from input */
+    size_t buffer_offset;   /* input offset of the scanner buffer */
+    size_t buffer_lines;    /* newlines before the scanner buffer */
+    size_t cursor_offset;
+    size_t cursor_lines;
+    /* column tracking, the text before the cursor is already searched */
+    const char* column_base;    /* scanner buffer of the cursor */
+    const char* column_line;    /* start of the last line found */
+    const char* column_cursor;  /* NULL after the buffer content moves */
 } LexerData;
 
+static __inline size_t kola_count_lines(const char* s, size_t len) {
+    const char* end = s + len;
+    size_t n = 0;
+    while ((s = (const char*)memchr(s, '\n', (size_t)(end - s))) != NULL) {
+        ++n;
+        ++s;
+    }
+    return n;
+}
+
+/* cut point of UTF-8 text not after `limit`, which never splits a character */
+static __inline int kola_utf8_boundary(const char* s, int len, int limit) {
+    int i = limit < len ? limit : len;
+    int start = i - 1, size;
+    unsigned char c;
+
+    /* find the beginning of the last character before the cut point */
+    while (start > 0 && ((unsigned char)s[start] & 0xC0) == 0x80 && i - start < 4) --start;
+    c = (unsigned char)s[start];
+    size = c < 0xC0 ? 1 : c < 0xE0 ? 2 : c < 0xF0 ? 3 : 4;
+    if (start + size <= i) return i;
+    if (start > 0) return start;
+    /* the limit is inside the first character */
+    return size < len ? size : len;
+}
+
+static __inline void kola_track_input(LexerData* data, const char* base, const char* buf, int n) {
+    /* data before `buf` is the unmatched text kept from the last buffer */
+    size_t kept = (size_t)(buf - base);
+    data->buffer_offset = data->input_total - kept;
+    data->buffer_lines = data->input_lines - kola_count_lines(base, kept);
+    if (n > 0) {
+        data->input_total += (size_t)n;
+        data->input_lines += kola_count_lines(buf, (size_t)n);
+    }
+}
+
+/* Same as the default YY_INPUT of flex */
+static __inline int kola_read_raw(FILE* fp, char* buf, int max_size, int interactive) {
+    int n;
+    if (interactive) {
+        int c = '*';
+        for (n = 0; n < max_size && (c = getc(fp)) != EOF && c != '\n'; ++n)
+            buf[n] = (char) c;
+        if (c == '\n')
+            buf[n++] = (char) c;
+        if (c == EOF && ferror(fp))
+            return -1;
+        return n;
+    }
+    errno = 0;
+    while ((n = (int) fread(buf, 1, (size_t) max_size, fp)) == 0 && ferror(fp)) {
+        if (errno != EINTR)
+            return -1;
+        errno = 0;
+        clearerr(fp);
+    }
+    return n;
+}
+
 #define YY_EXTRA_TYPE LexerData*
 
+enum TextEncoding {
+    ENC_UTF8, ENC_ASCII, ENC_OTHER
+};
+
 enum TokenSyn {
     CMD=1, CMD_N, TEXT, LITERAL, STRING, NUM, NUM_H,
-    NUM_B, NUM_F, CLN, CMA, SLP, SRP, ANNOTATION
+    NUM_B, NUM_F, CLN, CMA, SLP, SRP, ANNOTATION,
+    TEXT_PART, ANNOTATION_PART
 };
 
 static const uint8_t yy_goto[7][8] = {
@@ -49,6 +134,44 @@ static const uint8_t yy_goto[7][8] = {
 
 #ifdef Py_PYTHON_H
 
+#ifndef PY_VECTORCALL_ARGUMENTS_OFFSET
+#define PY_VECTORCALL_ARGUMENTS_OFFSET ((size_t)1 << (8 * sizeof(size_t) - 1))
+#endif
+
+/* call with a C argument vector and a tuple of keyword names (or NULL) */
+#if PY_VERSION_HEX >= 0x03090000
+#define kola_vectorcall(callable, args, nargsf, kwnames) \
+    PyObject_Vectorcall(callable, (PyObject* const*)(args), nargsf, kwnames)
+#elif PY_VERSION_HEX >= 0x03080000
+#define kola_vectorcall(callable, args, nargsf, kwnames) \
+    _PyObject_Vectorcall(callable, (PyObject* const*)(args), nargsf, kwnames)
+#else
+static PyObject* kola_vectorcall(PyObject* callable, PyObject** args, size_t nargsf, PyObject* kwnames) {
+    Py_ssize_t i, nargs = (Py_ssize_t)(nargsf & ~PY_VECTORCALL_ARGUMENTS_OFFSET);
+    Py_ssize_t nkw = kwnames ? PyTuple_GET_SIZE(kwnames) : 0;
+    PyObject *tuple, *kwds = NULL, *result = NULL;
+
+    tuple = PyTuple_New(nargs);
+    if (tuple == NULL) return NULL;
+    for (i = 0; i < nargs; ++i) {
+        Py_INCREF(args[i]);
+        PyTuple_SET_ITEM(tuple, i, args[i]);
+    }
+    if (nkw) {
+        kwds = PyDict_New();
+        if (kwds == NULL) goto end;
+        for (i = 0; i < nkw; ++i) {
+            if (PyDict_SetItem(kwds, PyTuple_GET_ITEM(kwnames, i), args[nargs + i])) goto end;
+        }
+    }
+    result = PyObject_Call(callable, tuple, kwds);
+end:
+    Py_DECREF(tuple);
+    Py_XDECREF(kwds);
+    return result;
+}
+#endif
+
 #define get_type_qualname(obj) (Py_TYPE(obj)->tp_name)
 
 static __inline const char* get_type_name(PyObject* obj) {
@@ -157,6 +280,8 @@ static void __inline kola_set_errcause(PyObject* exc_type, int errorno,
     
     PyObject *exc, *val, *tb;
     PyErr_Fetch(&exc, &val, &tb);
+    // the value is only an exception instance after normalization
+    PyErr_NormalizeException(&exc, &val, &tb);
     if (cause == Py_None) {
         PyException_SetContext(val, NULL);
     } else {
@@ -252,9 +377,82 @@ static __inline const char* unicode2string(PyObject* __s, Py_ssize_t* s_len) {
     return s;
 }
 
+/*
+ * Convert an integer token fitting in a machine word.
+ *
+ * Return -1 for longer tokens, which are left to PyLong_FromString.
+ */
+static __inline int parse_int64(const char* s, Py_ssize_t len, int base, long long* out) {
+    const char* p = s;
+    const char* end = s + len;
+    int negative = 0;
+    int max_digits;
+    unsigned long long v = 0;
+
+    if (p < end && *p == '-') {
+        negative = 1;
+        p++;
+    }
+    switch (base) {
+    case 16:
+        p += 2;     // skip '0x'
+        max_digits = 15;
+        break;
+    case 2:
+        p += 2;     // skip '0b'
+        max_digits = 62;
+        break;
+    default:
+        max_digits = 18;
+    }
+    if (end - p > max_digits || p >= end) {
+        return -1;
+    }
+    for (; p < end; p++) {
+        char c = *p;
+        int d;
+        if (c >= '0' && c <= '9') {
+            d = c - '0';
+        } else if (c >= 'a' && c <= 'f') {
+            d = c - 'a' + 10;
+        } else if (c >= 'A' && c <= 'F') {
+            d = c - 'A' + 10;
+        } else {
+            return -1;
+        }
+        v = v * base + d;
+    }
+    *out = negative ? -(long long)v : (long long)v;
+    return 0;
+}
+
+/*
+ * Convert an integer token to a Python int.
+ *
+ * Tokens fitting in a machine word are converted directly, and longer
+ * ones fall back to PyLong_FromString. The token must be NUL terminated.
+ */
+static __inline PyObject* parse_integer(const char* s, Py_ssize_t len, int base) {
+    long long v;
+    if (parse_int64(s, len, base, &v) < 0) {
+        return PyLong_FromString(s, NULL, base);
+    }
+    return PyLong_FromLongLong(v);
+}
+
+/* Convert a float token to a Python float without an intermediate string object. */
+static __inline PyObject* parse_float(const char* s) {
+    double v = PyOS_string_to_double(s, NULL, NULL);
+    if (v == -1.0 && PyErr_Occurred()) {
+        return NULL;
+    }
+    return PyFloat_FromDouble(v);
+}
+
 // from cpython:string_parser.decode_unicode_with_escapes
 PyObject* decode_escapes(const char* s, Py_ssize_t len);
 PyObject* filter_text(PyObject* string);
+PyObject* decode_text(const char* s, Py_ssize_t len, int kind, const char* encoding);
 #endif
 
 #ifdef __cplusplus
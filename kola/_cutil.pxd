@@ -71,25 +71,54 @@ cdef extern from "_cutil.h":
         SLP
         SRP
         ANNOTATION
+        TEXT_PART
+        ANNOTATION_PART
     const uint8_t yy_goto[7][8]
 
+    enum TextEncoding:
+        ENC_UTF8
+        ENC_ASCII
+        ENC_OTHER
+
     const int LFLAG_DISABLED
     const int LFLAG_ISANNOTATION
     const int LFLAG_NOLSTRIP
     
+    ctypedef int (*kola_input_func)(void* ctx, char* buf, int max_size, FILE* fp, int interactive) noexcept nogil
     ctypedef struct LexerData:
         const char* filename
         uint8_t command_threshold
         uint8_t flag
+        size_t max_text_size
+        kola_input_func input
+        void* input_ctx
+        size_t input_total
+        size_t input_lines
+        size_t buffer_offset
+        size_t buffer_lines
+        size_t cursor_offset
+        size_t cursor_lines
+        const char* column_base
+        const char* column_line
+        const char* column_cursor
     ctypedef void* yyscan_t
 
+    int kola_read_raw(FILE* fp, char* buf, int max_size, bint interactive) nogil
     void kola_set_error(object exc_type, int errorno, const char* filename, int lineno, const char* text) except *
     void kola_set_errcause(object exc_type, int errorno, const char* filename, int lineno, const char* text, object cause) except *
 
+    const char* get_format(int code) nogil
     FILE* kola_open(object raw_path, PyObject** out, const char* mod) except NULL
 
+    const size_t PY_VECTORCALL_ARGUMENTS_OFFSET
+    object kola_vectorcall(object callable, PyObject** args, size_t nargsf, PyObject* kwnames)
+
     const char* get_type_name(object obj) nogil
     const char* get_type_qualname(object obj) nogil
     const char* unicode2string(str __s, Py_ssize_t* s_len) except NULL
+    int parse_int64(const char* string, Py_ssize_t len, int base, long long* out) noexcept nogil
+    object parse_integer(const char* string, Py_ssize_t len, int base)
+    object parse_float(const char* string)
     str decode_escapes(const char* string, Py_ssize_t len)
     str filter_text(str string)
+    str decode_text(const char* string, Py_ssize_t len, int kind, const char* encoding)
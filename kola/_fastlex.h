@@ -0,0 +1,30 @@
+#ifndef _INCLUDE_FASTLEX_
+#define _INCLUDE_FASTLEX_
+
+#include "_cutil.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* API of the fast scanner compiled from lex.fast.c */
+struct yy_buffer_state;
+
+int kolafast_lex(yyscan_t yyscanner);
+int kolafast_lex_init_extra(LexerData* yy_user_defined, yyscan_t* ptr_yy_globals);
+int kolafast_lex_destroy(yyscan_t yyscanner);
+int kolafast_lex_check(yyscan_t yyscanner);
+void kolafast_lex_reset(yyscan_t yyscanner);
+int kolafast_lex_lineno(yyscan_t yyscanner);
+int kolafast_lex_column(yyscan_t yyscanner);
+void kolafast_restart(FILE* input_file, yyscan_t yyscanner);
+void kolafast_pop_buffer_state(yyscan_t yyscanner);
+struct yy_buffer_state* kolafast__scan_bytes(const char* bytes, int len, yyscan_t yyscanner);
+int kolafast_get_leng(yyscan_t yyscanner);
+char* kolafast_get_text(yyscan_t yyscanner);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
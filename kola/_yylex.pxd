@@ -13,6 +13,8 @@ cdef extern from "lex.yy.c":
     int yylex_destroy(yyscan_t yyscanner) nogil
     void yyrestart(FILE* input_file, yyscan_t yyscanner) nogil
     bint yylex_check(yyscan_t yyscanner) nogil
+    void yylex_reset(yyscan_t yyscanner) nogil
+    int yylex_column(yyscan_t yyscanner) nogil
 
     # Accessor  methods (get/set functions) to struct members.
     int yyget_lineno(yyscan_t yyscanner) nogil
@@ -30,4 +32,19 @@ cdef extern from "lex.yy.c":
     void yypop_buffer_state(yyscan_t yyscanner) nogil
     YY_BUFFER_STATE yy_create_buffer(FILE* file, int size, yyscan_t yyscanner) nogil
     YY_BUFFER_STATE yy_scan_buffer(char* base, Py_ssize_t size, yyscan_t yyscanner) nogil
-    YY_BUFFER_STATE yy_scan_bytes(const char* text, int len, yyscan_t yyscanner) nogil
\ No newline at end of file
+    YY_BUFFER_STATE yy_scan_bytes(const char* text, int len, yyscan_t yyscanner) nogil
+
+cdef extern from "_fastlex.h":
+    # scanner generated with full tables and no yylineno
+    int kolafast_lex(yyscan_t yyscanner) nogil
+    int kolafast_lex_init_extra(YY_EXTRA_TYPE yy_user_defined, yyscan_t* ptr_yy_globals) nogil
+    int kolafast_lex_destroy(yyscan_t yyscanner) nogil
+    bint kolafast_lex_check(yyscan_t yyscanner) nogil
+    void kolafast_lex_reset(yyscan_t yyscanner) nogil
+    int kolafast_lex_lineno(yyscan_t yyscanner) nogil
+    int kolafast_lex_column(yyscan_t yyscanner) nogil
+    void kolafast_restart(FILE* input_file, yyscan_t yyscanner) nogil
+    void kolafast_pop_buffer_state(yyscan_t yyscanner) nogil
+    YY_BUFFER_STATE kolafast__scan_bytes(const char* text, int len, yyscan_t yyscanner) nogil
+    int kolafast_get_leng(yyscan_t yyscanner) nogil
+    char* kolafast_get_text(yyscan_t yyscanner) nogil
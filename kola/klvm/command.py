@@ -1,7 +1,12 @@
+import types
+from array import array
 from functools import partialmethod
+from inspect import Parameter, signature
 from types import MethodType
-from typing import Any, Callable, Dict, Generator, Iterable, Tuple, Union, overload
-from typing_extensions import Self, Protocol, runtime_checkable
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple, Union, overload
+from typing_extensions import Annotated, Literal, Self, Protocol, get_args, get_origin, get_type_hints, runtime_checkable
+
+from ..parser import CommandBatch, TextParts
 
 
 class CommandCaller(Protocol):
@@ -13,8 +18,341 @@ class CommandLike(Protocol):
     def __kola_command__(self) -> Generator[Tuple[str, Callable], None, None]: ...
 
 
+ArgumentValidator = Callable[[tuple, Dict[str, Any]], None]
+
+
+def _no_check(args: tuple, kwargs: Dict[str, Any]) -> None:  # pragma: no cover
+    pass
+
+
+def compile_validator(name: str, func: Callable) -> ArgumentValidator:
+    """compile the signature of a command function into a fast argument checker
+
+    The first parameter of the function, which is the bound command set, is skipped.
+    The checker raises the same `TypeError` as `Signature.bind` does, but
+    common calls only cost a few comparisons.
+
+    :param name: command name used in error messages
+    :type name: str
+    :param func: the command function
+    :type func: Callable
+    :return: the checker accepting positional and keyword arguments
+    :rtype: ArgumentValidator
+    """
+    try:
+        params = list(signature(func).parameters.values())[1:]
+    except (TypeError, ValueError):  # pragma: no cover
+        return _no_check
+
+    positional: Dict[str, int] = {}
+    posonly = set()
+    kwonly = set()
+    kwonly_required = set()
+    n_required = 0
+    var_pos = var_kw = False
+    for p in params:
+        if p.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+            positional[p.name] = len(positional)
+            if p.kind == Parameter.POSITIONAL_ONLY:
+                posonly.add(p.name)
+            if p.default is Parameter.empty:
+                n_required += 1
+        elif p.kind == Parameter.VAR_POSITIONAL:
+            var_pos = True
+        elif p.kind == Parameter.KEYWORD_ONLY:
+            kwonly.add(p.name)
+            if p.default is Parameter.empty:
+                kwonly_required.add(p.name)
+        else:
+            var_kw = True
+    max_pos = -1 if var_pos else len(positional)
+    keywords = frozenset(positional.keys() - posonly | kwonly)
+    pos_names = tuple(positional)
+
+    def validator(args: tuple, kwargs: Dict[str, Any]) -> None:
+        n = len(args)
+        if not kwargs and not kwonly_required and n_required <= n and (max_pos < 0 or n <= max_pos):
+            return
+        if max_pos >= 0 and n > max_pos:
+            raise TypeError(f"{name}() takes {max_pos} positional arguments but {n} were given")
+        for k in kwargs:
+            if k in keywords:
+                if positional.get(k, n) < n:
+                    raise TypeError(f"{name}() got multiple values for argument '{k}'")
+            elif not var_kw:
+                raise TypeError(f"{name}() got an unexpected keyword argument '{k}'")
+        if n >= n_required and not kwonly_required:
+            return
+        missing = [i for i in pos_names[n:n_required] if i in posonly or i not in kwargs]
+        missing.extend(i for i in kwonly_required if i not in kwargs)
+        if missing:
+            raise TypeError(f"{name}() missing required arguments: {', '.join(map(repr, missing))}")
+    return validator
+
+
+class ArgumentSchema(Protocol):
+    def __call__(
+        self, __args: tuple, __kwargs: Dict[str, Any], skip: Tuple[type, ...] = ...
+    ) -> Tuple[tuple, Dict[str, Any]]: ...
+
+
+Converter = Callable[[Any], Any]
+
+_UnionType = getattr(types, "UnionType", Union)
+
+
+def _to_int(value: Any) -> int:
+    if type(value) is int:
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return int(value)
+    raise TypeError(f"expected int, got {type(value).__name__}")
+
+
+def _to_float(value: Any) -> float:
+    if type(value) is float:
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    raise TypeError(f"expected float, got {type(value).__name__}")
+
+
+def _to_str(value: Any) -> str:
+    if type(value) is str:
+        return value
+    if isinstance(value, (str, int, float)):
+        # numbers written where a literal is expected
+        return str(value)
+    if isinstance(value, TextParts):
+        # a chunked text is given to the command as is
+        return value
+    raise TypeError(f"expected str, got {type(value).__name__}")
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if type(value) is int and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    raise TypeError(f"expected bool, got {value!r}")
+
+
+_SIMPLE_CONVERTERS: Dict[Any, Converter] = {int: _to_int, float: _to_float, str: _to_str, bool: _to_bool}
+_EXACT_TYPES = frozenset((int, float, str, bool, list, dict))
+
+
+def _list_converter(item: Optional[Converter]) -> Converter:
+    def converter(value: Any) -> list:
+        # `k(a)` is the written form of a one-item list, and positional values are never lists
+        if not isinstance(value, list):
+            value = [value]
+        if item is not None:
+            value = [item(i) for i in value]
+        return value
+    return converter
+
+
+def _dict_converter(item: Optional[Converter]) -> Converter:
+    def converter(value: Any) -> dict:
+        if not isinstance(value, dict):
+            raise TypeError(f"expected dict, got {type(value).__name__}")
+        if item is not None:
+            value = {k: item(v) for k, v in value.items()}
+        return value
+    return converter
+
+
+def _array_converter(typecode: str) -> Converter:
+    def converter(value: Any) -> array:
+        if isinstance(value, array):
+            return value
+        if isinstance(value, list):
+            return array(typecode, value)
+        raise TypeError(f"expected array, got {type(value).__name__}")
+    return converter
+
+
+def _literal_converter(choices: tuple) -> Converter:
+    def converter(value: Any) -> Any:
+        if value not in choices:
+            raise ValueError(f"expected one of {', '.join(map(repr, choices))}, got {value!r}")
+        return value
+    return converter
+
+
+def _union_converter(members: tuple) -> Optional[Converter]:
+    exact = []
+    converters = []
+    for i in members:
+        if i is type(None) or i in _SIMPLE_CONVERTERS:
+            exact.append(i)
+        conv = _compile_converter(i)
+        if conv is None and i is not type(None):
+            # a member not checked makes the whole union unchecked
+            return None
+        if conv is not None:
+            converters.append(conv)
+    exact_types = tuple(exact)
+    names = " or ".join("None" if i is type(None) else getattr(i, "__name__", repr(i)) for i in members)
+
+    def converter(value: Any) -> Any:
+        if type(value) in exact_types:
+            return value
+        for conv in converters:
+            try:
+                return conv(value)
+            except (TypeError, ValueError):
+                pass
+        raise TypeError(f"expected {names}, got {value!r}")
+    return converter
+
+
+def _compile_converter(annotation: Any) -> Optional[Converter]:
+    """converter of an annotation, or None if the annotation is not checked"""
+    if annotation in _SIMPLE_CONVERTERS:
+        return _SIMPLE_CONVERTERS[annotation]
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _compile_converter(get_args(annotation)[0])
+    elif origin is Literal:
+        return _literal_converter(get_args(annotation))
+    elif origin is Union or origin is _UnionType:
+        return _union_converter(get_args(annotation))
+    elif annotation is list or origin is list:
+        args = get_args(annotation)
+        return _list_converter(_compile_converter(args[0]) if args else None)
+    elif annotation is dict or origin is dict:
+        args = get_args(annotation)
+        return _dict_converter(_compile_converter(args[1]) if args else None)
+    return None
+
+
+def compile_schema(name: str, func: Callable, arrays: Optional[Dict[str, str]] = None) -> Optional[ArgumentSchema]:
+    """compile the annotations of a command function into an argument checker and converter
+
+    Simple types (`int`, `float`, `str`, `bool`, `list`, `dict` and their generic forms),
+    `Literal` choices and unions of them are checked, and numbers are converted
+    where another type is expected, like an `int` given for a `float` or a number
+    for a `str`. A single value given for a `list` is wrapped in a one-item list,
+    and the `TextParts` of a chunked text are passed as is. Other annotations
+    are not checked. The arity is checked like `compile_validator` does.
+    Values of the types given as `skip` to the schema are left unchecked.
+
+    :param name: command name used in error messages
+    :type name: str
+    :param func: the command function
+    :type func: Callable
+    :param arrays: typecodes of the parameters only accepting typed arrays, defaults to None
+    :type arrays: Optional[Dict[str, str]], optional
+    :return: the schema returning the converted arguments, or None if nothing is checked
+    :rtype: Optional[ArgumentSchema]
+    """
+    try:
+        params = list(signature(func).parameters.values())[1:]
+    except (TypeError, ValueError):  # pragma: no cover
+        return None
+    try:
+        hints = get_type_hints(func, include_extras=True)
+    except Exception:
+        # unresolved forward references are not checked
+        hints = {k: v for k, v in getattr(func, "__annotations__", {}).items() if not isinstance(v, str)}
+
+    # (name, type passed as is, converter) of each parameter
+    positional: List[Tuple[str, Any, Optional[Converter]]] = []
+    keywords: Dict[str, Tuple[Any, Converter]] = {}
+    var_pos: Optional[Tuple[Any, Converter]] = None
+    var_kw: Optional[Tuple[Any, Converter]] = None
+    for p in params:
+        if arrays is not None and p.name in arrays:
+            conv = _array_converter(arrays[p.name])
+            exact = array
+        else:
+            annotation = hints.get(p.name)
+            conv = _compile_converter(annotation) if p.name in hints else None
+            exact = annotation if annotation in _EXACT_TYPES else None
+        if p.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+            positional.append((p.name, exact, conv))
+        if conv is None:
+            continue
+        if p.kind == Parameter.VAR_POSITIONAL:
+            var_pos = (exact, conv)
+        elif p.kind == Parameter.VAR_KEYWORD:
+            var_kw = (exact, conv)
+        elif p.kind != Parameter.POSITIONAL_ONLY:
+            keywords[p.name] = (exact, conv)
+    if arrays is not None and any(p.kind == Parameter.VAR_KEYWORD for p in params):
+        # arrays given to the `**kwargs` of the function
+        for k, v in arrays.items():
+            keywords.setdefault(k, (array, _array_converter(v)))
+    if var_pos is None and var_kw is None and not keywords and all(i[2] is None for i in positional):
+        return None
+    validator = compile_validator(name, func)
+    n_pos = len(positional)
+
+    def schema(args: tuple, kwargs: Dict[str, Any], skip: Tuple[type, ...] = ()) -> Tuple[tuple, Dict[str, Any]]:
+        validator(args, kwargs)
+        new_args = None
+        new_kwargs = None
+        pname = None
+        try:
+            for i, (pname, exact, conv) in enumerate(positional[:len(args)]):
+                value = args[i]
+                if conv is None or type(value) is exact or (skip and isinstance(value, skip)):
+                    continue
+                v = conv(value)
+                if v is not value:
+                    if new_args is None:
+                        new_args = list(args)
+                    new_args[i] = v
+            if var_pos is not None and len(args) > n_pos:
+                pname = "*"
+                exact, conv = var_pos
+                for i in range(n_pos, len(args)):
+                    value = args[i]
+                    if type(value) is not exact and not (skip and isinstance(value, skip)):
+                        if new_args is None:
+                            new_args = list(args)
+                        new_args[i] = conv(value)
+            for pname, value in kwargs.items():
+                exact, conv = keywords.get(pname, var_kw) or (None, None)
+                if conv is None or type(value) is exact or (skip and isinstance(value, skip)):
+                    continue
+                v = conv(value)
+                if v is not value:
+                    if new_kwargs is None:
+                        new_kwargs = kwargs.copy()
+                    new_kwargs[pname] = v
+        except (TypeError, ValueError) as e:
+            raise type(e)(f"{name}() argument '{pname}': {e}") from None
+        return (
+            args if new_args is None else tuple(new_args),
+            kwargs if new_kwargs is None else new_kwargs
+        )
+    return schema
+
+
+_NOT_COMPILED: Any = object()
+
+
+def _to_batch(args: tuple, kwargs: Dict[str, Any]) -> CommandBatch:
+    if len(args) == 1 and not kwargs:
+        items = args[0]
+        if isinstance(items, CommandBatch):
+            return items
+        if isinstance(items, Iterable) and not isinstance(items, (str, bytes, TextParts)):
+            # an iterable of `(args, kwargs)` tuples
+            return CommandBatch(items)
+    # the arguments of a single statement
+    return CommandBatch([(args, kwargs)])
+
+
 class Command(object):
-    __slots__ = ["__name__", "__func__", "suppression", "virtual", "alias", "extra_data"]
+    __slots__ = [
+        "__name__", "__func__", "suppression", "virtual", "batch", "arrays", "alias", "extra_data",
+        "_validator", "_schema"
+    ]
 
     def __init__(
         self,
@@ -24,6 +362,8 @@ class Command(object):
         alias: Union[Iterable[str], str] = (),
         suppression: bool = False,
         virtual: bool = False,
+        batch: bool = False,
+        arrays: Optional[Dict[str, str]] = None,
         **kwds: Any
     ) -> None:
         self.__name__ = __name
@@ -31,7 +371,19 @@ class Command(object):
         self.alias = (alias,) if isinstance(alias, str) else tuple(alias)
         self.suppression = suppression
         self.virtual = virtual
+        # called once with a CommandBatch for a run of consecutive statements,
+        # other calls are turned into a CommandBatch first
+        self.batch = batch
+        # keyword lists parsed into array.array, by typecode 'd' or 'q', other values are rejected
+        if arrays is not None:
+            arrays = dict(arrays)
+            for k, v in arrays.items():
+                if v not in ("d", "q"):
+                    raise ValueError(f"unsupported array typecode {v!r} for argument {k!r}")
+        self.arrays = arrays
         self.extra_data = kwds
+        self._validator: Optional[ArgumentValidator] = None
+        self._schema: Optional[ArgumentSchema] = _NOT_COMPILED
     
     @overload
     def set_data(self, __name: str, value: Any) -> Self: ...
@@ -54,13 +406,41 @@ class Command(object):
     def from_command(cls, command: "Command", **kwds: Any) -> Self:
         data = command.extra_data.copy()
         data.update(kwds)
-        return cls(
+        self = cls(
             command.__name__,
             command.__func__,
             alias=command.alias,
+            batch=command.batch,
+            arrays=command.arrays,
             **data
         )
+        # same function, so the compiled checkers are shared
+        self._validator = command._validator
+        self._schema = command._schema
+        return self
     
+    @property
+    def validator(self) -> ArgumentValidator:
+        """argument checker compiled from the command function, built on first use"""
+        if self._validator is None:
+            self._validator = compile_validator(self.__name__, self.__func__)
+        return self._validator
+
+    @property
+    def schema(self) -> Optional[ArgumentSchema]:
+        """argument checker and converter compiled from the annotations, None if nothing is checked"""
+        if self._schema is _NOT_COMPILED:
+            self.compile()
+        return self._schema
+
+    def compile(self) -> None:
+        """
+        Compile the argument schema, which is done when the command set class is created.
+
+        The items of batch commands are not checked.
+        """
+        self._schema = None if self.batch else compile_schema(self.__name__, self.__func__, self.arrays)
+
     @property
     def __wrapped__(self) -> Callable:  # pragma: no cover
         return self.__func__
@@ -80,6 +460,9 @@ class Command(object):
         return MethodType(self, ins)
 
     def __call__(self, vmobj: Any, *args: Any, **kwds: Any) -> Any:
+        if self.batch:
+            args = (_to_batch(args, kwds),)
+            kwds = {}
         caller = getattr(vmobj, "__kola_caller__", None)
         if caller is None:  # pragma: no cover
             return self.__func__(vmobj, *args, **kwds)
@@ -12,6 +12,10 @@ class CommandSetMeta(ABCMeta):
     """
     __command_field__: Set[CommandLike]
     __virtual_table__: Dict[str, str]
+    # bumped whenever a command is registered after the class creation
+    __command_revision__: int = 0
+    # set for classes customizing `__getitem__` but not `__kola_lookup__`
+    __kola_getitem__: bool = False
 
     def __new__(cls, name: str, bases: Tuple[Type, ...], attr: Dict[str, Any], **kwds: Any) -> Self:
         command_field = set()
@@ -21,15 +25,23 @@ class CommandSetMeta(ABCMeta):
                 virtual_table.update(i.__virtual_table__)
         for k, v in attr.items():
             if isinstance(v, Command):
+                # argument schemas are compiled once here instead of on the first call
+                v.compile()
                 if v.virtual:
                     virtual_table[k] = v.__name__
             elif k in virtual_table:
                 attr[k] = v = Command(virtual_table[k], v, virtual=True)
+                v.compile()
             elif not isinstance(v, CommandLike):
                 continue
             command_field.add(v)
         attr["__command_field__"] = command_field
         attr["__virtual_table__"] = virtual_table
+        if "__kola_lookup__" in attr:
+            attr["__kola_getitem__"] = False
+        elif "__getitem__" in attr:
+            # the parser looks commands up with the customized `__getitem__` then
+            attr["__kola_getitem__"] = True
         return super().__new__(cls, name, bases, attr, **kwds)
 
     def generate_raw_commands(self) -> Dict[str, Any]:
@@ -57,7 +69,9 @@ class CommandSetMeta(ABCMeta):
                 else:
                     name = wrapped_func.__name__
                 cmd = Command(name, wrapped_func, **kwds)
+                cmd.compile()
                 self.__command_field__.add(cmd)
+                CommandSetMeta.__command_revision__ += 1
                 return cmd
             if callable(__func_or_name):
                 return wrapper(__func_or_name)
@@ -122,10 +136,20 @@ class CommandSet(object, metaclass=CommandSetMeta):
         :return: command return value
         :rtype: Any
         """
+        schema = command.schema
+        if schema is not None:
+            args, kwargs = schema(args, kwargs)
         return command.__func__(self, *args, **kwargs)
 
+    def __kola_lookup__(self, __key: str) -> Optional[Callable]:
+        """hook function used by the parser to find a command
+
+        Unlike `__getitem__`, it returns None for unknown commands instead of raising.
+        """
+        return self.get(__key)
+
     def __getitem__(self, __key: str) -> Callable:
-        cmd = self.get(__key)
+        cmd = self.__kola_lookup__(__key)
         if cmd is None:
             raise KeyError(f"unknown command '{__key}'")
         return cmd
@@ -11,6 +11,8 @@ from .mask import Mask, ClassTypeMask
 class CommandSetMeta(ABCMeta):
     __command_field__: Set[CommandLike]
     __virtual_table__: Dict[str, str]
+    __command_revision__: int
+    __kola_getitem__: bool
 
     def __new__(cls, name: str, bases: Tuple[type, ...], attr: Dict[str, Any], **kwds: Any) -> Self: ...
     def generate_raw_commands(self) -> Dict[str, Any]: ...
@@ -56,4 +58,5 @@ class CommandSet(metaclass=CommandSetMeta):
     @classmethod
     def mask(cls, type: Union["Mask.MType", str] = "") -> ClassTypeMask: ...
     def __kola_caller__(self, command: Command, args: tuple, kwargs: Dict[str, Any], **kwds) -> Any: ...
+    def __kola_lookup__(self, __key: str) -> Optional[Callable]: ...
     def __getitem__(self, __key: str) -> Callable: ...
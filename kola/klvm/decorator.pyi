@@ -1,4 +1,5 @@
-from typing import Any, Callable, Iterable, Optional, Type, overload, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Type, overload, Union
+from typing_extensions import Literal
 
 from .command import Command
 from .commandset import CommandSet
@@ -15,6 +16,8 @@ def kola_command(
     envs: Union[Iterable[str], str] = ...,
     alias: Union[Iterable[str], str] = ...,
     virtual: bool = False,
+    batch: bool = False,
+    arrays: Optional[Dict[str, Literal["d", "q"]]] = None,
     **kwds: Any
 ) -> Callable[[Callable[..., Any]], Command]: ...
 @overload
@@ -25,6 +28,7 @@ def kola_text(
     envs: Union[Iterable[str], str] = ...,
     alias: Union[Iterable[str], str] = ...,
     virtual: bool = False,
+    batch: bool = False,
     **kwds: Any
 ) -> Callable[[Callable[..., Any]], Command]: ...
 @overload
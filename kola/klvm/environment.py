@@ -182,12 +182,12 @@ class Environment(CommandSet, metaclass=EnvironmentMeta):
                     EnvironmentAutopop.from_command(c).__kola_command__()
                 )
 
-    def __getitem__(self, __key: str) -> Callable:
+    def __kola_lookup__(self, __key: str) -> Optional[Callable]:
         cmd_set = self
         cmd = cmd_set.get(__key)
         while cmd is None:
             if not isinstance(cmd_set, Environment):
-                raise KeyError(f"unknown command '{__key}'")
+                return None
             cmd_set = cmd_set.back
             cmd = cmd_set.get(__key)
         return cmd
@@ -74,6 +74,9 @@ class CallerHandler(AbstractHandler):
         bound_instance: Optional[CommandSet] = None,
         **kwds: Any
     ) -> Any:
+        schema = command.schema
+        if schema is not None:
+            args, kwargs = schema(args, kwargs)
         ret = command.__func__(bound_instance or self.owner, *args, **kwargs)
         super().__call__(command, args, kwargs, bound_instance=bound_instance, ret_value=ret, **kwds)
         return ret
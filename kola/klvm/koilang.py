@@ -4,8 +4,9 @@ from contextlib import contextmanager, suppress
 from functools import partial
 from threading import Lock
 from types import TracebackType, new_class
-from typing import (Any, Callable, Dict, Generator, List, Optional, Tuple,
-                    Type, TypeVar, Union, overload)
+from typing import (Any, Callable, Dict, FrozenSet, Generator, List, Optional,
+                    Set, Tuple, Type, TypeVar, Union, overload)
+from weakref import WeakKeyDictionary
 from typing_extensions import Literal, Self
 
 from ..exception import KoiLangError
@@ -19,6 +20,32 @@ from .environment import Environment
 _T_EnvCls = TypeVar("_T_EnvCls", bound=Type[Environment])
 _T_Handler = TypeVar("_T_Handler", bound=Type["AbstractHandler"])
 
+# max number of idle string parsers kept by each virtual machine
+_PARSER_POOL_SIZE = 4
+
+
+# statements ignored by the parsers of each class, with the command revision it was computed at
+_ignored_cache: "WeakKeyDictionary[type, Tuple[int, FrozenSet[str]]]" = WeakKeyDictionary()
+
+
+def _reachable_commands(cmd_set_cls: CommandSetMeta) -> Set[str]:
+    """
+    collect names of the commands in a command set class and all environments reachable from it
+    """
+    names = set()
+    visited = set()
+    stack = [cmd_set_cls]
+    while stack:
+        cls = stack.pop()
+        if cls in visited:
+            continue
+        visited.add(cls)
+        names.update(cls.generate_raw_commands())
+        for base in cls.__mro__:
+            if isinstance(base, CommandSetMeta):
+                stack.extend(i for i in base.__command_field__ if isinstance(i, CommandSetMeta))
+    return names
+
 
 class KoiLangMeta(CommandSetMeta):
     """
@@ -78,6 +105,7 @@ class KoiLangMeta(CommandSetMeta):
 
     def register_environment(self, env_class: _T_EnvCls) -> _T_EnvCls:
         self.__command_field__.add(env_class)
+        CommandSetMeta.__command_revision__ += 1
         return env_class
     
     def register_handler(self, handler: _T_Handler) -> _T_Handler:
@@ -111,13 +139,14 @@ class KoiLang(CommandSet, metaclass=KoiLangMeta):
     `KoiLang` class is the top-level interface of 'kola' package.
     Just create a subclass to define your own markup language based on KoiLang.
     """
-    __slots__ = ["_handler", "_lock", "__top", "__exec_level"]
+    __slots__ = ["_handler", "_lock", "__top", "__exec_level", "__parser_pool"]
 
     def __init__(self) -> None:
         super().__init__()
         self._lock = Lock()
         self.__top = self
         self.__exec_level = 0
+        self.__parser_pool: List[Parser] = []
         self._handler = build_handlers(self.__class__.__command_handlers__, self)
     
     def push_prepare(self, __env_type: Type[Environment]) -> Environment:
@@ -170,8 +199,55 @@ class KoiLang(CommandSet, metaclass=KoiLangMeta):
             raise ValueError("cannot remove all handlers")
         self._handler = hdl
 
-    def __parse(self, __lexer: BaseLexer, *, close_lexer: bool = True) -> None:
-        parser = Parser(__lexer, self)
+    def __ignored_statements(self) -> FrozenSet[str]:
+        cls = self.__class__
+        if cls.__kola_lookup__ is not KoiLang.__kola_lookup__ or cls.__kola_getitem__:
+            return frozenset()
+        revision = CommandSetMeta.__command_revision__
+        cache = _ignored_cache.get(cls)
+        if cache is not None and cache[0] == revision:
+            return cache[1]
+        # annotations without handler can be dropped by the lexer
+        if "@annotation" in _reachable_commands(cls):
+            ignore = frozenset()
+        else:
+            ignore = frozenset(("@annotation",))
+        _ignored_cache[cls] = (revision, ignore)
+        return ignore
+
+    def __acquire_parser(self, __lexer: Union[BaseLexer, str], pipeline: int = 0, with_ret: bool = False) -> Parser:
+        # every statement gives a result when they are returned
+        ignore = frozenset() if with_ret else self.__ignored_statements()
+        if not isinstance(__lexer, str):
+            return Parser(__lexer, self, ignore=ignore, pipeline=pipeline)
+        # string parsers are reused to save the setup cost of small documents
+        pool = self.__parser_pool
+        while pool:
+            parser = pool.pop()
+            # parsers made before a command registration may skip statements now handled
+            if parser.ignore == ignore:
+                break
+        else:
+            return Parser(
+                StringLexer(
+                    __lexer,
+                    encoding=self.__class__.__text_encoding__,
+                    command_threshold=self.__class__.__command_threshold__,
+                    no_lstrip=not self.__class__.__text_lstrip__
+                ), self, ignore=ignore, pipeline=pipeline
+            )
+        parser.lexer.reset(__lexer)
+        if pipeline:
+            parser.lexer.start_pipeline(pipeline)
+        parser.reset()
+        return parser
+    
+    def __release_parser(self, __parser: Parser) -> None:
+        if len(self.__parser_pool) < _PARSER_POOL_SIZE:
+            self.__parser_pool.append(__parser)
+
+    def __parse(self, __lexer: Union[BaseLexer, str], *, close_lexer: bool = True, pipeline: int = 0) -> None:
+        parser = self.__acquire_parser(__lexer, pipeline)
         try:
             with self.exec_block():
                 while True:
@@ -185,10 +261,18 @@ class KoiLang(CommandSet, metaclass=KoiLangMeta):
                         break
         finally:
             if close_lexer:
-                __lexer.close()
+                parser.lexer.close()
+            if isinstance(__lexer, str):
+                self.__release_parser(parser)
     
-    def __parse_and_ret(self, __lexer: BaseLexer, *, close_lexer: bool = True) -> Generator[Any, None, None]:
-        parser = Parser(__lexer, self)
+    def __parse_and_ret(
+        self,
+        __lexer: Union[BaseLexer, str],
+        *,
+        close_lexer: bool = True,
+        pipeline: int = 0
+    ) -> Generator[Any, None, None]:
+        parser = self.__acquire_parser(__lexer, pipeline, with_ret=True)
         try:
             with self.exec_block():
                 while True:
@@ -201,20 +285,37 @@ class KoiLang(CommandSet, metaclass=KoiLangMeta):
                         break
         finally:
             if close_lexer:
-                __lexer.close()
+                parser.lexer.close()
+            if isinstance(__lexer, str):
+                self.__release_parser(parser)
 
     @overload
-    def parse(self, lexer: Union[BaseLexer, str], *, with_ret: Literal[False] = False, close_lexer: bool = True) -> None: ...
+    def parse(
+        self,
+        lexer: Union[BaseLexer, str],
+        *,
+        with_ret: Literal[False] = False,
+        close_lexer: bool = True,
+        pipeline: int = 0
+    ) -> None: ...
     @overload  # noqa: E301
     def parse(
         self,
         lexer: Union[BaseLexer, str],
         *,
         with_ret: Literal[True],
-        close_lexer: bool = True
+        close_lexer: bool = True,
+        pipeline: int = 0
     ) -> Generator[Any, None, None]: ...
     
-    def parse(self, lexer: Union[BaseLexer, str], *, with_ret: bool = False, close_lexer: bool = True) -> Any:
+    def parse(
+        self,
+        lexer: Union[BaseLexer, str],
+        *,
+        with_ret: bool = False,
+        close_lexer: bool = True,
+        pipeline: int = 0
+    ) -> Any:
         """parse kola text
 
         :param lexer: Lexer object or legal KoiLang string
@@ -223,6 +324,8 @@ class KoiLang(CommandSet, metaclass=KoiLangMeta):
         :type with_ret: bool, optional
         :param close_lexer: whether or not to close the lexer, defaults to True
         :type close_lexer: bool, optional
+        :param pipeline: if positive, scan up to that many blocks of tokens in another thread, defaults to 0
+        :type pipeline: int, optional
         :raises ValueError: when a KoiLang string given without trying to close it
         :return: return a generator if `with_ret` set
         :rtype: Generator[Any, None, None] or None
@@ -230,16 +333,10 @@ class KoiLang(CommandSet, metaclass=KoiLangMeta):
         if isinstance(lexer, str):
             if not close_lexer:  # pragma: no cover
                 raise ValueError("inner string lexer must be closed at the end of parsing")
-            lexer = StringLexer(
-                lexer,
-                encoding=self.__class__.__text_encoding__,
-                command_threshold=self.__class__.__command_threshold__,
-                no_lstrip=not self.__class__.__text_lstrip__
-            )
         if with_ret:
-            return self.__parse_and_ret(lexer, close_lexer=close_lexer)
+            return self.__parse_and_ret(lexer, close_lexer=close_lexer, pipeline=pipeline)
         else:
-            self.__parse(lexer, close_lexer=close_lexer)
+            self.__parse(lexer, close_lexer=close_lexer, pipeline=pipeline)
         
     def parse_file(self, path: Union[str, bytes, os.PathLike], *, encoding: Optional[str] = None, **kwds: Any) -> Any:
         """
@@ -267,10 +364,10 @@ class KoiLang(CommandSet, metaclass=KoiLangMeta):
             if not self.__exec_level:
                 self.at_end()
 
-    def __getitem__(self, __key: str) -> Callable:
+    def __kola_lookup__(self, __key: str) -> Optional[Callable]:
         if self.__top is self:
-            return super().__getitem__(__key)
-        return self.__top[__key]
+            return self.get(__key)
+        return self.__top.__kola_lookup__(__key)
 
     def __kola_caller__(self, command: Command, args: tuple, kwargs: Dict[str, Any], **kwds: Any) -> Any:
         return self._handler(command, args, kwargs, **kwds)
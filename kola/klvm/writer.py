@@ -1,30 +1,31 @@
 import os
-from inspect import signature, Signature
 from functools import lru_cache
 from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
 from typing_extensions import Self
 
-from ..writer import BaseWriter, FileWriter, StringWriter
+from ..writer import AsyncStreamWriter, BaseWriter, BaseWriterItem, FileWriter, StringWriter, WriterItemLike
 from .command import Command
 from .environment import Environment
 from .handler import AbstractHandler
 from .koilang import KoiLang
 
 
+_writable_special_commands = frozenset(["@text", "@number", "@annotation"])
+# values formatted by the writer itself, which the schema does not check
+_writer_items = (BaseWriterItem, WriterItemLike)
+
+
 @lru_cache()
-def _default_writer_factory(name: str, sig: Optional[Signature] = None):
+def _default_writer_factory(name: str) -> Callable:
     if name == "@text":
         return BaseWriter.write_text
     elif name == "@annotation":
         return BaseWriter.write_annotation
+    elif name == "@number":
+        return BaseWriter.write_command
 
     def inner(writer: BaseWriter, *args, **kwds) -> None:
-        if sig:
-            # check writer arguments
-            sig.bind(writer, *args, **kwds)
-        if name != "@number":
-            args = (name,) + args
-        writer.write_command(*args, **kwds)
+        writer.write_command(name, *args, **kwds)
     return inner
 
 
@@ -35,8 +36,15 @@ class KoiLangWriter(KoiLang):
     The class should not be used directly.
     The usual way to use it is to call YourKoiLang.writer().
     """
-    def __init__(self, ___writer: Union[str, bytes, os.PathLike, BaseWriter, None] = None) -> None:
+    def __init__(
+        self,
+        ___writer: Union[str, bytes, os.PathLike, BaseWriter, None] = None,
+        *,
+        compression: Optional[str] = "infer",
+        validate: bool = True
+    ) -> None:
         super().__init__()
+        self.validate = validate
         if ___writer is None:
             self._writer = StringWriter(
                 command_threshold=self.__class__.__command_threshold__
@@ -47,7 +55,8 @@ class KoiLangWriter(KoiLang):
             self._writer = FileWriter(
                 ___writer,
                 command_threshold=self.__class__.__command_threshold__,
-                encoding=self.__class__.__text_encoding__
+                encoding=self.__class__.__text_encoding__,
+                compression=compression
             )
     
     def push_apply(self, __push_cache: Environment) -> None:
@@ -65,6 +74,18 @@ class KoiLangWriter(KoiLang):
         if not isinstance(self._writer, StringWriter):  # pragma: no cover
             raise TypeError("only `StringWriter` object can use 'getvalue' method")
         return self._writer.getvalue()
+    
+    def drain(self) -> str:
+        """take the text written so far and remove it from the `StringWriter`"""
+        if not isinstance(self._writer, StringWriter):  # pragma: no cover
+            raise TypeError("only `StringWriter` object can use 'drain' method")
+        return self._writer.drain()
+
+    async def adrain(self) -> None:
+        """wait until the buffered output of the `AsyncStreamWriter` is written to its stream"""
+        if not isinstance(self._writer, AsyncStreamWriter):  # pragma: no cover
+            raise TypeError("only `AsyncStreamWriter` object can use 'adrain' method")
+        await self._writer.drain()
 
     def __enter__(self) -> Self:
         self._writer.__enter__()
@@ -91,11 +112,22 @@ class WriterHandler(AbstractHandler):
         **kwds: Any
     ) -> Any:
         name = command.__name__
-        if name.startswith('@') and name not in ["@text", "@number", "@annotation"]:  # pragma: no cover
+        if name[0] == '@' and name not in _writable_special_commands:  # pragma: no cover
             return super().__call__(command, args, kwargs, **kwds)
         
         if not writer_func:
-            writer_func = _default_writer_factory(
-                command.__name__, signature(command.__func__)
-            )
+            writer_func = _default_writer_factory(name)
+            if command.batch:
+                # a batch is written as separated statements
+                batch, = args
+                for item_args, item_kwargs in batch:
+                    writer_func(self.owner._writer, *item_args, **item_kwargs)
+                return
+            if self.owner.validate:
+                schema = command.schema
+                if schema is None:
+                    command.validator(args, kwargs)
+                else:
+                    # only checked, the arguments are written as given
+                    schema(args, kwargs, _writer_items)
         return writer_func(self.owner._writer, *args, **kwargs)
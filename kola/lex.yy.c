@@ -1,6 +1,6 @@
-#line 2 "kola/lex.yy.c"
+#line 1 "kola/lex.yy.c"
 
-#line 4 "kola/lex.yy.c"
+#line 3 "kola/lex.yy.c"
 
 #define  YY_INT_ALIGNED short int
 
@@ -359,8 +359,8 @@ static void yynoreturn yy_fatal_error ( const char* msg , yyscan_t yyscanner );
 	yyg->yy_hold_char = *yy_cp; \
 	*yy_cp = '\0'; \
 	yyg->yy_c_buf_p = yy_cp;
-#define YY_NUM_RULES 19
-#define YY_END_OF_BUFFER 20
+#define YY_NUM_RULES 25
+#define YY_END_OF_BUFFER 26
 /* This struct is not used in this scanner,
    but its presence is necessary. */
 struct yy_trans_info
@@ -368,16 +368,24 @@ struct yy_trans_info
 	flex_int32_t yy_verify;
 	flex_int32_t yy_nxt;
 	};
-static const flex_int16_t yy_accept[72] =
+static const flex_int16_t yy_accept[147] =
     {   0,
-        0,    0,    0,    0,    0,    0,    0,    0,   20,    5,
-        1,    3,   19,    4,    5,   19,    7,    7,    6,   19,
-        8,    1,    8,   19,    9,   10,   13,   19,   19,   14,
-       14,   12,   18,    1,    3,    4,    2,    0,    7,    6,
-        8,    8,    1,    2,    0,    0,   11,    0,    0,   14,
-       14,   17,   17,    0,    0,    0,   14,   18,    0,    0,
-        0,   11,    0,   17,    0,   17,   16,   15,    0,   17,
-        0
+        0,    0,    0,    0,    0,    0,    0,    0,    0,    0,
+       26,    5,    1,    3,   25,    4,    5,   25,    7,    7,
+        6,   25,    8,    1,    8,   25,   15,   16,   19,   25,
+       25,   20,   20,   18,   24,    9,   14,   25,   13,    1,
+        3,    4,    2,    0,    7,    6,    8,    8,    1,    2,
+        0,    0,   17,    0,    0,   20,   20,   23,   23,    0,
+        0,    0,   20,   24,    9,   14,   12,    0,   11,    0,
+        0,    0,   17,    0,   23,    0,   23,   22,   21,    9,
+       10,    0,    0,   23,    9,    9,    9,    9,    9,    9,
+        9,    9,    9,    9,    9,    9,    9,    9,    9,    9,
+
+        9,    9,    9,    9,    9,    9,    9,    9,    9,    9,
+        9,    9,    9,    9,    9,    9,    9,    9,    9,    9,
+        9,    9,    9,    9,    9,    9,    9,    9,    9,    9,
+        9,    9,    9,    9,    9,    9,    9,    9,    9,    9,
+        9,    9,    9,    9,    9,    0
     } ;
 
 static const YY_CHAR yy_ec[256] =
@@ -415,101 +423,231 @@ static const YY_CHAR yy_ec[256] =
 static const YY_CHAR yy_meta[23] =
     {   0,
         1,    1,    2,    2,    1,    1,    1,    1,    1,    3,
-        1,    4,    4,    4,    1,    5,    6,    7,    1,    5,
+        1,    4,    4,    4,    1,    5,    6,    7,    8,    5,
         6,    7
     } ;
 
-static const flex_int16_t yy_base[83] =
+static const flex_int16_t yy_base[222] =
     {   0,
-        0,   18,   37,    0,   58,   76,   95,    0,  158,  211,
-      155,  211,  135,  123,    4,  211,  211,    0,    0,    6,
-      108,    9,   12,   13,  211,  211,  211,  107,   13,  111,
-      123,  211,    0,  122,  211,   88,  211,   89,   21,    0,
-       72,   62,   65,   66,   72,   63,  211,  142,   57,   72,
-        0,   55,   69,   26,   17,    0,    0,    0,   20,   68,
-      120,   69,    7,  109,  129,  136,   51,    0,  139,  142,
-      211,  161,  168,  172,  179,  186,  190,  194,  197,  201,
-      202,  206
+        0,   18,   37,    0,   58,   76,   95,    0,    4,    6,
+      255,  667,  246,  667,  238,  226,    8,  667,  667,    1,
+        0,   13,  205,   16,   62,   63,  667,  667,  667,  107,
+       14,  111,  123,  667,    0,    0,  667,  218,   66,  212,
+      667,  188,  667,  157,   17,    0,  140,   68,   65,  135,
+      139,   69,  667,  142,   20,   72,    0,   69,  106,  115,
+       51,    0,    0,    0,    0,  667,  667,   91,   72,   70,
+      119,  136,  124,   26,  109,  136,  139,   79,    0,    0,
+      667,    2,  144,  150,    0,    0,    0,    0,    0,    0,
+        0,    0,    0,    0,    0,    0,    0,    0,    0,    0,
+
+        0,    0,    0,    0,    0,    0,    0,    0,    0,    0,
+        0,    0,    0,    0,    0,    0,    0,    0,    0,    0,
+        0,    0,    0,    0,    0,    0,    0,    0,    0,    0,
+        0,    0,    0,    0,    0,    0,    0,    0,    0,    0,
+        0,    0,    0,    0,  667,  667,  164,  172,  180,  185,
+      192,  200,  205,  212,  216,  219,  223,  224,  230,  235,
+      239,  246,  253,  260,  267,  274,  281,  288,  295,  302,
+      309,  316,  323,  330,  337,  344,  351,  358,  365,  372,
+      379,  386,  393,  400,  407,  414,  421,  428,  435,  442,
+      449,  456,  463,  470,  477,  484,  491,  498,  505,  512,
+
+      519,  526,  533,  540,  547,  554,  561,  568,  575,  582,
+      589,  596,  603,  610,  617,  624,  631,  638,  645,  652,
+      659
     } ;
 
-static const flex_int16_t yy_def[83] =
+static const flex_int16_t yy_def[222] =
     {   0,
-       72,   72,   71,    3,   73,   73,   71,    7,   71,   71,
-       71,   71,   71,   71,   71,   71,   71,   71,   74,   71,
-       75,   75,   75,   76,   71,   71,   71,   71,   71,   71,
-       71,   71,   77,   71,   71,   71,   71,   71,   71,   74,
-       75,   75,   75,   75,   71,   76,   71,   76,   71,   71,
-       31,   78,   79,   80,   71,   81,   31,   77,   71,   76,
-       76,   76,   82,   79,   71,   71,   71,   81,   71,   71,
-        0,   71,   71,   71,   71,   71,   71,   71,   71,   71,
-       71,   71
+      147,  147,  146,    3,  148,  148,  146,    7,  149,  149,
+      146,  146,  146,  146,  146,  146,  146,  146,  146,  146,
+      150,  146,  151,  151,  151,  152,  146,  146,  146,  146,
+      146,  146,  146,  146,  153,  154,  146,  146,  146,  146,
+      146,  146,  146,  146,  146,  150,  151,  151,  151,  151,
+      146,  152,  146,  152,  146,  146,   33,  155,  156,  157,
+      146,  158,   33,  153,  159,  146,  146,  146,  146,  146,
+      152,  152,  152,  160,  156,  146,  146,  146,  158,  161,
+      146,  146,  146,  146,  162,  163,  164,  165,  166,  167,
+      168,  169,  170,  171,  172,  173,  174,  175,  176,  177,
+
+      178,  179,  180,  181,  182,  183,  184,  185,  186,  187,
+      188,  189,  190,  191,  192,  193,  194,  195,  196,  197,
+      198,  199,  200,  201,  202,  203,  204,  205,  206,  207,
+      208,  209,  210,  211,  212,  213,  214,  215,  216,  217,
+      218,  219,  220,  221,  146,    0,  146,  146,  146,  146,
+      146,  146,  146,  146,  146,  146,  146,  146,  146,  146,
+      146,  146,  146,  146,  146,  146,  146,  146,  146,  146,
+      146,  146,  146,  146,  146,  146,  146,  146,  146,  146,
+      146,  146,  146,  146,  146,  146,  146,  146,  146,  146,
+      146,  146,  146,  146,  146,  146,  146,  146,  146,  146,
+
+      146,  146,  146,  146,  146,  146,  146,  146,  146,  146,
+      146,  146,  146,  146,  146,  146,  146,  146,  146,  146,
+      146
     } ;
 
-static const flex_int16_t yy_nxt[234] =
+static const flex_int16_t yy_nxt[690] =
     {   0,
-       71,   11,   12,   13,   71,   14,   37,   38,   37,   38,
-       43,   39,   39,   39,   44,   45,   69,   47,   15,   11,
-       12,   13,   41,   14,   52,   52,   52,   42,   67,   67,
-       42,   48,   39,   39,   39,   65,   15,   16,   11,   12,
-       13,   16,   16,   16,   16,   16,   16,   16,   17,   18,
-       18,   16,   19,   19,   19,   20,   19,   19,   19,   22,
-       12,   13,   67,   67,   41,   59,   43,   47,   52,   52,
-       52,   63,   47,   47,   44,   63,   23,   22,   12,   13,
-       42,   48,   53,   42,   42,   63,   48,   48,   54,   63,
-       42,   37,   54,   36,   23,   16,   11,   12,   13,   24,
-
-       16,   25,   26,   27,   28,   29,   30,   31,   31,   32,
-       33,   33,   33,   20,   33,   33,   33,   49,   50,   51,
-       51,   53,   60,   34,   47,   63,   42,   54,   36,   63,
-       55,   54,   56,   53,   57,   57,   57,   35,   48,   54,
-       66,   66,   66,   54,   60,   61,   62,   66,   66,   66,
-       70,   70,   70,   70,   70,   70,   34,   71,   71,   71,
-       48,   10,   10,   10,   10,   10,   10,   10,   21,   21,
-       21,   21,   21,   21,   21,   40,   40,   40,   40,   41,
-       71,   41,   41,   41,   41,   41,   46,   46,   46,   46,
-       46,   46,   46,   58,   58,   58,   58,   52,   71,   52,
-
-       64,   71,   64,   66,   66,   68,   68,   68,   70,   70,
-        9,   71,   71,   71,   71,   71,   71,   71,   71,   71,
-       71,   71,   71,   71,   71,   71,   71,   71,   71,   71,
-       71,   71,   71
+      146,   13,   14,   15,   81,   16,   37,   38,   37,   38,
+       43,   44,   45,   45,   45,   43,   44,   49,   17,   13,
+       14,   15,   39,   16,   39,   58,   58,   58,   45,   45,
+       45,   58,   58,   58,   48,   83,   17,   18,   13,   14,
+       15,   18,   18,   18,   18,   18,   18,   18,   19,   20,
+       20,   18,   21,   21,   21,   22,   21,   21,   21,   24,
+       14,   15,   78,   78,   50,   51,   49,   53,   67,   68,
+       47,   70,   47,   53,   81,   82,   25,   24,   14,   15,
+       48,   54,   59,   48,   69,   74,   48,   54,   60,   74,
+       78,   78,   60,   67,   25,   18,   13,   14,   15,   26,
+
+       18,   27,   28,   29,   30,   31,   32,   33,   33,   34,
+       35,   35,   35,   22,   35,   35,   35,   55,   56,   57,
+       57,   59,   74,   53,   76,   74,   74,   60,   53,   74,
+       61,   60,   62,   59,   63,   63,   63,   54,   71,   60,
+       53,   50,   54,   60,   71,   72,   73,   77,   77,   77,
+       77,   77,   77,   48,   54,   84,   84,   84,   48,   43,
+       54,   84,   84,   84,   12,   12,   12,   12,   12,   12,
+       12,   12,   23,   23,   23,   23,   23,   23,   23,   23,
+       36,   36,   36,   36,   36,   36,   36,   36,   46,   46,
+       46,   46,   47,   42,   47,   47,   47,   47,   47,   47,
+
+       52,   52,   52,   52,   52,   52,   52,   52,   64,   64,
+       64,   64,   65,   40,   65,   65,   65,   65,   65,   58,
+       66,   58,   75,   48,   75,   77,   77,   79,   79,   79,
+       80,   42,   80,   80,   80,   80,   80,   84,   84,   85,
+       41,   85,   85,   85,   85,   85,   86,   40,   86,   86,
+       86,   86,   86,   87,  146,   87,   87,   87,   87,   87,
+       88,  146,   88,   88,   88,   88,   88,   89,  146,   89,
+       89,   89,   89,   89,   90,  146,   90,   90,   90,   90,
+       90,   91,  146,   91,   91,   91,   91,   91,   92,  146,
+       92,   92,   92,   92,   92,   93,  146,   93,   93,   93,
+
+       93,   93,   94,  146,   94,   94,   94,   94,   94,   95,
+      146,   95,   95,   95,   95,   95,   96,  146,   96,   96,
+       96,   96,   96,   97,  146,   97,   97,   97,   97,   97,
+       98,  146,   98,   98,   98,   98,   98,   99,  146,   99,
+       99,   99,   99,   99,  100,  146,  100,  100,  100,  100,
+      100,  101,  146,  101,  101,  101,  101,  101,  102,  146,
+      102,  102,  102,  102,  102,  103,  146,  103,  103,  103,
+      103,  103,  104,  146,  104,  104,  104,  104,  104,  105,
+      146,  105,  105,  105,  105,  105,  106,  146,  106,  106,
+      106,  106,  106,  107,  146,  107,  107,  107,  107,  107,
+
+      108,  146,  108,  108,  108,  108,  108,  109,  146,  109,
+      109,  109,  109,  109,  110,  146,  110,  110,  110,  110,
+      110,  111,  146,  111,  111,  111,  111,  111,  112,  146,
+      112,  112,  112,  112,  112,  113,  146,  113,  113,  113,
+      113,  113,  114,  146,  114,  114,  114,  114,  114,  115,
+      146,  115,  115,  115,  115,  115,  116,  146,  116,  116,
+      116,  116,  116,  117,  146,  117,  117,  117,  117,  117,
+      118,  146,  118,  118,  118,  118,  118,  119,  146,  119,
+      119,  119,  119,  119,  120,  146,  120,  120,  120,  120,
+      120,  121,  146,  121,  121,  121,  121,  121,  122,  146,
+
+      122,  122,  122,  122,  122,  123,  146,  123,  123,  123,
+      123,  123,  124,  146,  124,  124,  124,  124,  124,  125,
+      146,  125,  125,  125,  125,  125,  126,  146,  126,  126,
+      126,  126,  126,  127,  146,  127,  127,  127,  127,  127,
+      128,  146,  128,  128,  128,  128,  128,  129,  146,  129,
+      129,  129,  129,  129,  130,  146,  130,  130,  130,  130,
+      130,  131,  146,  131,  131,  131,  131,  131,  132,  146,
+      132,  132,  132,  132,  132,  133,  146,  133,  133,  133,
+      133,  133,  134,  146,  134,  134,  134,  134,  134,  135,
+      146,  135,  135,  135,  135,  135,  136,  146,  136,  136,
+
+      136,  136,  136,  137,  146,  137,  137,  137,  137,  137,
+      138,  146,  138,  138,  138,  138,  138,  139,  146,  139,
+      139,  139,  139,  139,  140,  146,  140,  140,  140,  140,
+      140,  141,  146,  141,  141,  141,  141,  141,  142,  146,
+      142,  142,  142,  142,  142,  143,  146,  143,  143,  143,
+      143,  143,  144,  146,  144,  144,  144,  144,  144,  145,
+      146,  145,  145,  145,  145,  145,   11,  146,  146,  146,
+      146,  146,  146,  146,  146,  146,  146,  146,  146,  146,
+      146,  146,  146,  146,  146,  146,  146,  146,  146
     } ;
 
-static const flex_int16_t yy_chk[234] =
+static const flex_int16_t yy_chk[690] =
     {   0,
-        0,    1,    1,    1,    0,    1,   15,   15,   20,   20,
-       22,   18,   18,   18,   23,   23,   63,   24,    1,    2,
-        2,    2,   59,    2,   29,   29,   29,   22,   55,   55,
-       23,   24,   39,   39,   39,   54,    2,    3,    3,    3,
+        0,    1,    1,    1,   82,    1,    9,    9,   10,   10,
+       17,   17,   20,   20,   20,   22,   22,   24,    1,    2,
+        2,    2,    9,    2,   10,   31,   31,   31,   45,   45,
+       45,   55,   55,   55,   24,   74,    2,    3,    3,    3,
         3,    3,    3,    3,    3,    3,    3,    3,    3,    3,
         3,    3,    3,    3,    3,    3,    3,    3,    3,    5,
-        5,    5,   67,   67,   42,   42,   43,   46,   49,   49,
-       49,   52,   60,   62,   45,   52,    5,    6,    6,    6,
-       42,   46,   50,   43,   44,   53,   60,   62,   50,   53,
-       41,   38,   50,   36,    6,    7,    7,    7,    7,    7,
+        5,    5,   61,   61,   25,   25,   49,   26,   39,   39,
+       48,   48,   70,   52,   69,   69,    5,    6,    6,    6,
+       25,   26,   56,   49,   39,   58,   48,   52,   56,   58,
+       78,   78,   56,   68,    6,    7,    7,    7,    7,    7,
 
         7,    7,    7,    7,    7,    7,    7,    7,    7,    7,
-        7,    7,    7,    7,    7,    7,    7,   28,   28,   28,
-       28,   30,   61,   34,   61,   64,   21,   30,   14,   64,
-       30,   30,   30,   31,   31,   31,   31,   13,   61,   31,
-       65,   65,   65,   31,   48,   48,   48,   66,   66,   66,
-       69,   69,   69,   70,   70,   70,   11,    9,    0,    0,
-       48,   72,   72,   72,   72,   72,   72,   72,   73,   73,
-       73,   73,   73,   73,   73,   74,   74,   74,   74,   75,
-        0,   75,   75,   75,   75,   75,   76,   76,   76,   76,
-       76,   76,   76,   77,   77,   77,   77,   78,    0,   78,
-
-       79,    0,   79,   80,   80,   81,   81,   81,   82,   82,
-       71,   71,   71,   71,   71,   71,   71,   71,   71,   71,
-       71,   71,   71,   71,   71,   71,   71,   71,   71,   71,
-       71,   71,   71
+        7,    7,    7,    7,    7,    7,    7,   30,   30,   30,
+       30,   32,   59,   71,   60,   75,   59,   32,   73,   75,
+       32,   32,   32,   33,   33,   33,   33,   71,   72,   33,
+       72,   51,   73,   33,   54,   54,   54,   76,   76,   76,
+       77,   77,   77,   50,   72,   83,   83,   83,   47,   44,
+       54,   84,   84,   84,  147,  147,  147,  147,  147,  147,
+      147,  147,  148,  148,  148,  148,  148,  148,  148,  148,
+      149,  149,  149,  149,  149,  149,  149,  149,  150,  150,
+      150,  150,  151,   42,  151,  151,  151,  151,  151,  151,
+
+      152,  152,  152,  152,  152,  152,  152,  152,  153,  153,
+      153,  153,  154,   40,  154,  154,  154,  154,  154,  155,
+       38,  155,  156,   23,  156,  157,  157,  158,  158,  158,
+      159,   16,  159,  159,  159,  159,  159,  160,  160,  161,
+       15,  161,  161,  161,  161,  161,  162,   13,  162,  162,
+      162,  162,  162,  163,   11,  163,  163,  163,  163,  163,
+      164,    0,  164,  164,  164,  164,  164,  165,    0,  165,
+      165,  165,  165,  165,  166,    0,  166,  166,  166,  166,
+      166,  167,    0,  167,  167,  167,  167,  167,  168,    0,
+      168,  168,  168,  168,  168,  169,    0,  169,  169,  169,
+
+      169,  169,  170,    0,  170,  170,  170,  170,  170,  171,
+        0,  171,  171,  171,  171,  171,  172,    0,  172,  172,
+      172,  172,  172,  173,    0,  173,  173,  173,  173,  173,
+      174,    0,  174,  174,  174,  174,  174,  175,    0,  175,
+      175,  175,  175,  175,  176,    0,  176,  176,  176,  176,
+      176,  177,    0,  177,  177,  177,  177,  177,  178,    0,
+      178,  178,  178,  178,  178,  179,    0,  179,  179,  179,
+      179,  179,  180,    0,  180,  180,  180,  180,  180,  181,
+        0,  181,  181,  181,  181,  181,  182,    0,  182,  182,
+      182,  182,  182,  183,    0,  183,  183,  183,  183,  183,
+
+      184,    0,  184,  184,  184,  184,  184,  185,    0,  185,
+      185,  185,  185,  185,  186,    0,  186,  186,  186,  186,
+      186,  187,    0,  187,  187,  187,  187,  187,  188,    0,
+      188,  188,  188,  188,  188,  189,    0,  189,  189,  189,
+      189,  189,  190,    0,  190,  190,  190,  190,  190,  191,
+        0,  191,  191,  191,  191,  191,  192,    0,  192,  192,
+      192,  192,  192,  193,    0,  193,  193,  193,  193,  193,
+      194,    0,  194,  194,  194,  194,  194,  195,    0,  195,
+      195,  195,  195,  195,  196,    0,  196,  196,  196,  196,
+      196,  197,    0,  197,  197,  197,  197,  197,  198,    0,
+
+      198,  198,  198,  198,  198,  199,    0,  199,  199,  199,
+      199,  199,  200,    0,  200,  200,  200,  200,  200,  201,
+        0,  201,  201,  201,  201,  201,  202,    0,  202,  202,
+      202,  202,  202,  203,    0,  203,  203,  203,  203,  203,
+      204,    0,  204,  204,  204,  204,  204,  205,    0,  205,
+      205,  205,  205,  205,  206,    0,  206,  206,  206,  206,
+      206,  207,    0,  207,  207,  207,  207,  207,  208,    0,
+      208,  208,  208,  208,  208,  209,    0,  209,  209,  209,
+      209,  209,  210,    0,  210,  210,  210,  210,  210,  211,
+        0,  211,  211,  211,  211,  211,  212,    0,  212,  212,
+
+      212,  212,  212,  213,    0,  213,  213,  213,  213,  213,
+      214,    0,  214,  214,  214,  214,  214,  215,    0,  215,
+      215,  215,  215,  215,  216,    0,  216,  216,  216,  216,
+      216,  217,    0,  217,  217,  217,  217,  217,  218,    0,
+      218,  218,  218,  218,  218,  219,    0,  219,  219,  219,
+      219,  219,  220,    0,  220,  220,  220,  220,  220,  221,
+        0,  221,  221,  221,  221,  221,  146,  146,  146,  146,
+      146,  146,  146,  146,  146,  146,  146,  146,  146,  146,
+      146,  146,  146,  146,  146,  146,  146,  146,  146
     } ;
 
 /* Table of booleans, true if rule could match eol. */
-static const flex_int32_t yy_rule_can_match_eol[20] =
+static const flex_int32_t yy_rule_can_match_eol[26] =
     {   0,
-0, 1, 1, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 
-        };
+0, 1, 1, 0, 0, 0, 0, 1, 0, 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 
+    0, 0, 0, 0, 0, 0,     };
 
 /* The intent behind this definition is that it'll catch
  * any uses of REJECT which flex missed.
@@ -529,9 +667,49 @@ static const flex_int32_t yy_rule_can_match_eol[20] =
     #define yy_lstrip               (yy_lflag & LFLAG_NOLSTRIP)
     #define yyset_annotation()      do {yy_lflag |= LFLAG_ISANNOTATION;} while (0)
     #define yyunset_annotation()    do {yy_lflag &= ~LFLAG_ISANNOTATION;} while (0)
+    #define yy_max_text_size        yyextra->max_text_size
+    #define yy_text_syn(part)       (yy_is_annotation? ((part)? ANNOTATION_PART : ANNOTATION) : ((part)? TEXT_PART : TEXT))
+    #define yy_return_text_part()   do { \
+        if (yyg->yy_hold_char == '\n' || yyg->yy_hold_char == '\r') { \
+            yy_lflag &= ~LFLAG_TEXTPART; \
+            return yy_text_syn(0); \
+        } \
+        yy_lflag |= LFLAG_TEXTPART; \
+        return yy_text_syn(1); \
+    } while (0)
+    #define BEGIN_TEXT()            do {if (yy_max_text_size) BEGIN PLAIN_CHUNK; else BEGIN PLAIN_TEXT;} while (0)
 
     #define ECHO yyterminate()
 
+    #ifdef yylex
+        /*
+         * Generated with the kolafast_ prefix, full tables and no yylineno
+         * (see Makefile). Line numbers are recovered from byte offsets.
+         */
+        #define KOLA_FAST_SCANNER
+        #define yylex_check     kolafast_lex_check
+        #define yylex_reset     kolafast_lex_reset
+        #define yylex_column    kolafast_lex_column
+        #define yylex_lineno    kolafast_lex_lineno
+        #define YY_TRACK_INPUT(buf, n) \
+            kola_track_input(yyextra, YY_CURRENT_BUFFER_LVALUE->yy_ch_buf, buf, n)
+    #else
+        #define YY_TRACK_INPUT(buf, n)
+    #endif
+
+    #define YY_INPUT(buf, result, max_size) do { \
+        int interactive = YY_CURRENT_BUFFER_LVALUE->yy_is_interactive; \
+        if (yyextra->input) \
+            result = yyextra->input(yyextra->input_ctx, buf, (int)(max_size), yyin, interactive); \
+        else \
+            result = kola_read_raw(yyin, buf, (int)(max_size), interactive); \
+        if (result < 0) \
+            YY_FATAL_ERROR("input in flex scanner failed"); \
+        /* the kept text has been moved to the buffer start */ \
+        yyextra->column_cursor = NULL; \
+        YY_TRACK_INPUT(buf, result); \
+    } while (0)
+
     #define YY_NO_UNISTD_H
 
     #ifdef _MSC_VER
@@ -540,14 +718,15 @@ static const flex_int32_t yy_rule_can_match_eol[20] =
     #else
         #include <unistd.h>
     #endif
-#line 544 "kola/lex.yy.c"
+#line 721 "kola/lex.yy.c"
 
-#line 546 "kola/lex.yy.c"
+#line 723 "kola/lex.yy.c"
 
 #define INITIAL 0
 #define COMMAND 1
 #define PLAIN_TEXT 2
 #define ARGUMENT 3
+#define PLAIN_CHUNK 4
 
 #ifndef YY_NO_UNISTD_H
 /* Special case for "unistd.h", since it is non-ANSI. We include it way
@@ -805,10 +984,10 @@ YY_DECL
 		}
 
 	{
-#line 47 "kola/kolalexer.l"
+#line 88 "kola/kolalexer.l"
 
 
-#line 812 "kola/lex.yy.c"
+#line 990 "kola/lex.yy.c"
 
 	while ( /*CONSTCOND*/1 )		/* loops until end-of-file is reached */
 		{
@@ -841,13 +1020,13 @@ yy_match:
 			while ( yy_chk[yy_base[yy_current_state] + yy_c] != yy_current_state )
 				{
 				yy_current_state = (int) yy_def[yy_current_state];
-				if ( yy_current_state >= 72 )
+				if ( yy_current_state >= 147 )
 					yy_c = yy_meta[yy_c];
 				}
 			yy_current_state = yy_nxt[yy_base[yy_current_state] + yy_c];
 			++yy_cp;
 			}
-		while ( yy_base[yy_current_state] != 211 );
+		while ( yy_base[yy_current_state] != 667 );
 
 yy_find_action:
 		yy_act = yy_accept[yy_current_state];
@@ -885,7 +1064,7 @@ do_action:	/* This label is used only to access EOF actions. */
 
 case 1:
 YY_RULE_SETUP
-#line 49 "kola/kolalexer.l"
+#line 90 "kola/kolalexer.l"
 {
     if (YY_START == INITIAL && yy_lstrip) yymore();
 }
@@ -893,15 +1072,17 @@ YY_RULE_SETUP
 case 2:
 /* rule 2 can match eol */
 YY_RULE_SETUP
-#line 52 "kola/kolalexer.l"
+#line 93 "kola/kolalexer.l"
 {}
 	YY_BREAK
 case 3:
 /* rule 3 can match eol */
 YY_RULE_SETUP
-#line 53 "kola/kolalexer.l"
+#line 94 "kola/kolalexer.l"
 {
     if (YY_START == COMMAND) {
+        /* report the error once, EOF is returned by the next call */
+        BEGIN INITIAL;
         yyterminate();
     }
     BEGIN INITIAL;
@@ -909,7 +1090,7 @@ YY_RULE_SETUP
 	YY_BREAK
 case 4:
 YY_RULE_SETUP
-#line 59 "kola/kolalexer.l"
+#line 102 "kola/kolalexer.l"
 {
     size_t prefix_len = yyleng - (size_t)(strchr(yytext, '#') - yytext);
     
@@ -921,101 +1102,175 @@ YY_RULE_SETUP
         } else {
             yyunset_annotation();
         }
-        BEGIN PLAIN_TEXT;
+        BEGIN_TEXT();
         yyless(0);
     }
 }
 	YY_BREAK
 case 5:
 YY_RULE_SETUP
-#line 74 "kola/kolalexer.l"
-{BEGIN PLAIN_TEXT; yyless(0);}
+#line 117 "kola/kolalexer.l"
+{BEGIN_TEXT(); yyless(0);}
 	YY_BREAK
 case 6:
 YY_RULE_SETUP
-#line 75 "kola/kolalexer.l"
+#line 118 "kola/kolalexer.l"
 {BEGIN ARGUMENT; return(CMD);}
 	YY_BREAK
 case 7:
 YY_RULE_SETUP
-#line 76 "kola/kolalexer.l"
+#line 119 "kola/kolalexer.l"
 {BEGIN ARGUMENT; return(CMD_N);}
 	YY_BREAK
 case 8:
 /* rule 8 can match eol */
 YY_RULE_SETUP
-#line 77 "kola/kolalexer.l"
+#line 120 "kola/kolalexer.l"
 {return yy_is_annotation? ANNOTATION : TEXT;}
 	YY_BREAK
+
 case 9:
 YY_RULE_SETUP
-#line 79 "kola/kolalexer.l"
-{return(SLP);}
+#line 123 "kola/kolalexer.l"
+{
+    /* collect text until the size limit, then hand out a part of it */
+    if ((size_t)yyleng < yy_max_text_size) {
+        yymore();
+    } else {
+        yyless(kola_utf8_boundary(yytext, yyleng, (int)yy_max_text_size));
+        yy_return_text_part();
+    }
+}
 	YY_BREAK
 case 10:
+/* rule 10 can match eol */
+#line 133 "kola/kolalexer.l"
+case 11:
+/* rule 11 can match eol */
+#line 134 "kola/kolalexer.l"
+case 12:
+/* rule 12 can match eol */
+#line 135 "kola/kolalexer.l"
+case 13:
+/* rule 13 can match eol */
+YY_RULE_SETUP
+#line 135 "kola/kolalexer.l"
+{
+    /*
+     * backslashes are matched in the pairs that filter_text() decodes,
+     * so a part never ends inside an escape or a line continuation
+     */
+    if ((size_t)yyleng > yy_max_text_size && yyg->yy_more_len) {
+        /* keep the escape for the next part */
+        yyless((int)yyg->yy_more_len);
+        yy_return_text_part();
+    } else if ((size_t)yyleng < yy_max_text_size) {
+        yymore();
+    } else {
+        yy_return_text_part();
+    }
+}
+	YY_BREAK
+case 14:
+/* rule 14 can match eol */
+YY_RULE_SETUP
+#line 150 "kola/kolalexer.l"
+{
+    int nl = (yyleng > 1 && yytext[yyleng - 2] == '\r') ? 2 : 1;
+    if (yyleng > nl || (yy_lflag & LFLAG_TEXTPART)) {
+        /* the last part of text, the line end will be matched again */
+        yyless(yyleng - nl);
+        yy_lflag &= ~LFLAG_TEXTPART;
+        return yy_text_syn(0);
+    }
+    BEGIN INITIAL;
+}
+	YY_BREAK
+case YY_STATE_EOF(PLAIN_CHUNK):
+#line 160 "kola/kolalexer.l"
+{
+    if (yyg->yy_more_len || (yy_lflag & LFLAG_TEXTPART)) {
+        /* text collected by yymore() before the end of file */
+        yyleng = (int)yyg->yy_more_len;
+        yy_lflag &= ~LFLAG_TEXTPART;
+        return yy_text_syn(0);
+    }
+    BEGIN INITIAL;
+    return(EOF);
+}
+	YY_BREAK
+
+case 15:
+YY_RULE_SETUP
+#line 172 "kola/kolalexer.l"
+{return(SLP);}
+	YY_BREAK
+case 16:
 YY_RULE_SETUP
-#line 80 "kola/kolalexer.l"
+#line 173 "kola/kolalexer.l"
 {return(SRP);}
 	YY_BREAK
-case 11:
-/* rule 11 can match eol */
+case 17:
+/* rule 17 can match eol */
 YY_RULE_SETUP
-#line 82 "kola/kolalexer.l"
+#line 175 "kola/kolalexer.l"
 {return(STRING);}
 	YY_BREAK
-case 12:
+case 18:
 YY_RULE_SETUP
-#line 84 "kola/kolalexer.l"
+#line 177 "kola/kolalexer.l"
 {return(CLN);}
 	YY_BREAK
-case 13:
+case 19:
 YY_RULE_SETUP
-#line 85 "kola/kolalexer.l"
+#line 178 "kola/kolalexer.l"
 {return(CMA);}
 	YY_BREAK
-case 14:
+case 20:
 YY_RULE_SETUP
-#line 87 "kola/kolalexer.l"
+#line 180 "kola/kolalexer.l"
 {return(NUM);}
 	YY_BREAK
-case 15:
+case 21:
 YY_RULE_SETUP
-#line 88 "kola/kolalexer.l"
+#line 181 "kola/kolalexer.l"
 {return(NUM_H);}
 	YY_BREAK
-case 16:
+case 22:
 YY_RULE_SETUP
-#line 89 "kola/kolalexer.l"
+#line 182 "kola/kolalexer.l"
 {return(NUM_B);}
 	YY_BREAK
-case 17:
+case 23:
 YY_RULE_SETUP
-#line 90 "kola/kolalexer.l"
+#line 183 "kola/kolalexer.l"
 {return(NUM_F);}
 	YY_BREAK
-case 18:
+case 24:
 YY_RULE_SETUP
-#line 91 "kola/kolalexer.l"
+#line 184 "kola/kolalexer.l"
 {return(LITERAL);}
 	YY_BREAK
 case YY_STATE_EOF(INITIAL):
 case YY_STATE_EOF(COMMAND):
 case YY_STATE_EOF(PLAIN_TEXT):
 case YY_STATE_EOF(ARGUMENT):
-#line 92 "kola/kolalexer.l"
+#line 185 "kola/kolalexer.l"
 {
     if (YY_START == COMMAND) {
+        /* report the error once, EOF is returned by the next call */
+        BEGIN INITIAL;
         yyterminate();
     }
     return(EOF);
 }
 	YY_BREAK
-case 19:
+case 25:
 YY_RULE_SETUP
-#line 99 "kola/kolalexer.l"
+#line 194 "kola/kolalexer.l"
 ECHO;
 	YY_BREAK
-#line 1019 "kola/lex.yy.c"
+#line 1273 "kola/lex.yy.c"
 
 	case YY_END_OF_BUFFER:
 		{
@@ -1312,7 +1567,7 @@ static int yy_get_next_buffer (yyscan_t yyscanner)
 		while ( yy_chk[yy_base[yy_current_state] + yy_c] != yy_current_state )
 			{
 			yy_current_state = (int) yy_def[yy_current_state];
-			if ( yy_current_state >= 72 )
+			if ( yy_current_state >= 147 )
 				yy_c = yy_meta[yy_c];
 			}
 		yy_current_state = yy_nxt[yy_base[yy_current_state] + yy_c];
@@ -1341,11 +1596,11 @@ static int yy_get_next_buffer (yyscan_t yyscanner)
 	while ( yy_chk[yy_base[yy_current_state] + yy_c] != yy_current_state )
 		{
 		yy_current_state = (int) yy_def[yy_current_state];
-		if ( yy_current_state >= 72 )
+		if ( yy_current_state >= 147 )
 			yy_c = yy_meta[yy_c];
 		}
 	yy_current_state = yy_nxt[yy_base[yy_current_state] + yy_c];
-	yy_is_jam = (yy_current_state == 71);
+	yy_is_jam = (yy_current_state == 146);
 
 	(void)yyg;
 	return yy_is_jam ? 0 : yy_current_state;
@@ -2193,7 +2448,7 @@ void yyfree (void * ptr , yyscan_t yyscanner)
 
 #define YYTABLES_NAME "yytables"
 
-#line 99 "kola/kolalexer.l"
+#line 194 "kola/kolalexer.l"
 
 
 int yylex_check(yyscan_t yyscanner) {
@@ -2201,3 +2456,65 @@ int yylex_check(yyscan_t yyscanner) {
     if (yy_lflag & LFLAG_DISABLED) return 0;
     return YY_CURRENT_BUFFER != NULL;
 }
+
+void yylex_reset(yyscan_t yyscanner) {
+    struct yyguts_t * yyg = (struct yyguts_t*)yyscanner;
+    /* drop the state left by the previous input */
+    BEGIN INITIAL;
+    yyg->yy_more_flag = yyg->yy_more_len = 0;
+    yy_lflag &= ~(LFLAG_ISANNOTATION | LFLAG_TEXTPART);
+    yyextra->input_total = yyextra->input_lines = 0;
+    yyextra->buffer_offset = yyextra->buffer_lines = 0;
+    yyextra->cursor_offset = yyextra->cursor_lines = 0;
+    yyextra->column_cursor = NULL;
+    if (YY_CURRENT_BUFFER) {
+        yylineno = 1;
+        yycolumn = 0;
+    }
+}
+
+int yylex_column(yyscan_t yyscanner) {
+    struct yyguts_t * yyg = (struct yyguts_t*)yyscanner;
+    LexerData* data = yyextra;
+    const char *base, *token, *p;
+
+    if (YY_CURRENT_BUFFER == NULL || yyg->yytext_ptr == NULL) return 0;
+    /* byte offset of the current token from the line start kept in the buffer */
+    base = YY_CURRENT_BUFFER_LVALUE->yy_ch_buf;
+    token = yyg->yytext_ptr;
+    p = data->column_cursor;
+    if (p == NULL || data->column_base != base || p > token) {
+        /* the buffer was refilled or switched, search it from the beginning */
+        p = data->column_line = base;
+    }
+    /* like the lazy line counter, only the text scanned since the last call is searched */
+    while ((p = (const char*)memchr(p, '\n', (size_t)(token - p))) != NULL) {
+        data->column_line = ++p;
+    }
+    data->column_base = base;
+    data->column_cursor = token;
+    return (int)(token - data->column_line);
+}
+
+#ifdef KOLA_FAST_SCANNER
+int yylex_lineno(yyscan_t yyscanner) {
+    struct yyguts_t * yyg = (struct yyguts_t*)yyscanner;
+    LexerData* data = yyextra;
+    const char* base;
+    size_t end;
+
+    if (YY_CURRENT_BUFFER == NULL) return (int)data->cursor_lines + 1;
+    /* the end of current token, relative to the scanner buffer */
+    base = YY_CURRENT_BUFFER_LVALUE->yy_ch_buf;
+    end = (size_t)(yyg->yytext_ptr - base) + yyleng;
+    if (data->cursor_offset < data->buffer_offset || data->cursor_offset > data->buffer_offset + end) {
+        /* text before the cursor has been dropped from the buffer */
+        data->cursor_offset = data->buffer_offset;
+        data->cursor_lines = data->buffer_lines;
+    }
+    data->cursor_lines += kola_count_lines(base + (data->cursor_offset - data->buffer_offset), end + data->buffer_offset - data->cursor_offset);
+    data->cursor_offset = data->buffer_offset + end;
+    return (int)data->cursor_lines + 1;
+}
+#endif
+
@@ -1,6 +1,7 @@
 cimport cython
 from libc.stdio cimport stdin, FILE, fopen, fclose, EOF
 from cpython cimport PyObject
+from cpython.pythread cimport PyThread_type_lock
 
 from ._cutil cimport *
 
@@ -21,22 +22,150 @@ cdef class Token:
     cpdef int get_flag(self)
 
 
+cdef class Diagnostic:
+    cdef bytes _filename
+    cdef readonly:
+        int code
+        int lineno
+        int column
+        bytes text
+        object cause
+
+
+cdef Diagnostic new_diagnostic(int code, const char* filename, int lineno, int column, const char* text, object cause)
+
+
 cdef class LexerConfig:
     cdef LexerData* lexer_data
     cdef readonly BaseLexer lexer
 
 
-@cython.no_gc
+cdef enum InputMode:
+    INPUT_DETECT, INPUT_RAW, INPUT_TRANSCODE
+
+
+cdef struct ReadAhead:
+    FILE* fp
+    size_t block_size
+    int depth
+    char* blocks
+    Py_ssize_t* sizes
+    int* errors
+    PyThread_type_lock* empty
+    PyThread_type_lock* full
+    PyThread_type_lock done
+    int head
+    size_t pos
+    bint holding
+    bint eof
+    volatile bint stop
+
+
+cdef struct InputState:
+    InputMode mode
+    PyObject* lexer
+    ReadAhead* reader
+
+
+cdef struct Scanner:
+    int (*lex_init_extra)(LexerData* yy_user_defined, yyscan_t* ptr_yy_globals) noexcept nogil
+    int (*lex_destroy)(yyscan_t yyscanner) noexcept nogil
+    int (*lex)(yyscan_t yyscanner) noexcept nogil
+    bint (*lex_check)(yyscan_t yyscanner) noexcept nogil
+    void (*reset)(yyscan_t yyscanner) noexcept nogil
+    void (*restart)(FILE* input_file, yyscan_t yyscanner) noexcept nogil
+    void (*pop_buffer_state)(yyscan_t yyscanner) noexcept nogil
+    int (*get_lineno)(yyscan_t yyscanner) noexcept nogil
+    int (*get_column)(yyscan_t yyscanner) noexcept nogil
+    int (*get_leng)(yyscan_t yyscanner) noexcept nogil
+    char* (*get_text)(yyscan_t yyscanner) noexcept nogil
+
+
+cdef struct NameFilter:
+    bint text
+    bint annotation
+    bint number
+    Py_ssize_t size
+    const char** names
+    Py_ssize_t* lengths
+
+
+cdef struct PipeEntry:
+    int syn
+    int lineno
+    int column
+    Py_ssize_t offset
+    Py_ssize_t length
+
+
+cdef struct PipeBlock:
+    PipeEntry* entries
+    Py_ssize_t count
+    char* text
+    Py_ssize_t size
+    Py_ssize_t capacity
+
+
+cdef struct Pipeline:
+    const Scanner* yy
+    yyscan_t scanner
+    NameFilter* filter
+    int depth
+    PipeBlock* blocks
+    PyThread_type_lock* empty
+    PyThread_type_lock* full
+    PyThread_type_lock done
+    int head
+    Py_ssize_t pos
+    bint holding
+    bint eof
+    bint failed
+    bint no_memory
+    PipeEntry* current
+    volatile bint stop
+
+
 cdef class BaseLexer:
     cdef:
+        const Scanner* yy
         yyscan_t scanner
         LexerData lexer_data
+        TextEncoding encoding_kind
+        bytes encoding_name
+        # input transcoding
+        InputState input_state
+        bint utf8_input
+        object decoder
+        bytes pending
+        Py_ssize_t pending_pos
+        object input_error
+        # statements skipped by the lexer
+        NameFilter filter
+        tuple filter_names
+        # tokens scanned ahead by a native thread
+        Pipeline* pipe
+        object pipe_error
     cdef readonly:
         str encoding
+        bint fast
+        frozenset ignore
+    cdef public:
+        list diagnostics
 
+    cdef void set_encoding(self, str encoding) except *
+    cdef void init_input(self)
+    cdef void set_decoder(self, str encoding) except *
+    cdef void set_ignore(self, names) except *
+    cdef int fill_input(self, char* buf, int max_size, FILE* fp, bint interactive) except -1
     cpdef void close(self)
+    cpdef void start_pipeline(self, int depth = *) except *
+    cpdef void stop_pipeline(self)
+    cdef int token_lineno(self) noexcept nogil
+    cdef int token_column(self) noexcept nogil
     cdef void set_error(self, const char* text) except *
-    cdef (int, const char*, Py_ssize_t) next_syn(self) nogil
+    cdef (int, const char*, Py_ssize_t) next_syn(self) noexcept nogil
+    cdef object syn_value(self, int* syn, const char* text, Py_ssize_t text_len)
+    cdef Token make_token(self, int syn, const char* text, Py_ssize_t text_len)
     cdef Token next_token(self)
 
 
@@ -45,10 +174,34 @@ cdef class FileLexer(BaseLexer):
         object _filenameo
         bytes _filenameb
         FILE* fp
+    cdef readonly:
+        int read_ahead
+        size_t block_size
     
+    cdef void open(self, path) except *
+    cdef void stop_read_ahead(self)
     cpdef void close(self)
 
 
-@cython.no_gc
 cdef class StringLexer(BaseLexer):
-    cdef readonly bytes content
\ No newline at end of file
+    cdef readonly bytes content
+
+    cdef void set_content(self, content) except *
+
+@cython.final
+cdef class StatementReader:
+    cdef:
+        char* buffer
+        Py_ssize_t size
+        Py_ssize_t capacity
+        # first token of the next statement
+        int next_syn
+        int next_lineno
+        bytes next_text
+        bint started
+        bint recover
+        bint dropped
+    cdef readonly BaseLexer lexer
+
+    cdef void append(self, const char* text, Py_ssize_t length) except *
+    cdef int read(self, const char** text, Py_ssize_t* length) except? -2
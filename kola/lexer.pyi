@@ -1,7 +1,9 @@
 import os
-from typing import Any, ClassVar, Final, FrozenSet, Union, final, TypedDict
+from typing import Any, ClassVar, Final, FrozenSet, Iterable, List, Optional, Tuple, Union, final, TypedDict
 from typing_extensions import Self
 
+from .exception import KoiLangError
+
 
 S_CMD: int
 S_CMD_N: int
@@ -17,6 +19,8 @@ S_CMA: int
 S_SLP: int
 S_SRP: int
 S_ANNOTATION: int
+S_TEXT_PART: int
+S_ANNOTATION_PART: int
 F_DISABLED: int
 F_LSTRIP_TEXT: int
 
@@ -25,6 +29,8 @@ class _LexerData(TypedDict):
     filename: str
     encoding: str
     command_threshold: int
+    max_text_size: int
+    ignore: FrozenSet[str]
     flag: int
 
 
@@ -44,6 +50,29 @@ class Token:
     def get_flag(self) -> int: ...
 
 
+@final
+class Diagnostic:
+    """
+    Error record collected in diagnostics mode
+
+    The exception and its traceback are only built when `exception()` is called.
+    """
+
+    code: Final[int]
+    lineno: Final[int]
+    column: Final[int]
+    text: Final[bytes]
+    cause: Final[Optional[BaseException]]
+
+    def __init__(self, code: int, filename: str = "<kolafile>", lineno: int = 0, column: int = 0,
+                 text: bytes = b"", cause: Optional[BaseException] = None) -> None: ...
+    @property
+    def filename(self) -> str: ...
+    @property
+    def message(self) -> str: ...
+    def exception(self) -> KoiLangError: ...
+
+
 class LexerConfig:
     """
     Python-level interface to access extra lexer data
@@ -57,6 +86,8 @@ class LexerConfig:
         *,
         encoding: str = ...,
         command_threshold: int = ...,
+        max_text_size: int = ...,
+        ignore: Iterable[str] = ...,
         flag: int = ...,
         disabled: bool = ...,
         no_lstrip: bool = ...
@@ -72,6 +103,14 @@ class LexerConfig:
     @command_threshold.setter
     def command_threshold(self, cmd_threshold: int) -> None: ...    
     @property
+    def max_text_size(self) -> int: ...
+    @max_text_size.setter
+    def max_text_size(self, size: int) -> None: ...
+    @property
+    def ignore(self) -> FrozenSet[str]: ...
+    @ignore.setter
+    def ignore(self, val: Iterable[str]) -> None: ...
+    @property
     def flag(self) -> int: ...
     @flag.setter
     def flag(self, val: int) -> None: ...
@@ -86,8 +125,15 @@ class LexerConfig:
 
 
 class BaseLexer:
-    def __init__(self, *, encoding: str = ..., command_threshold: int = 1, no_lstrip: bool = ...) -> None: ...
+    fast: Final[bool]
+    ignore: Final[FrozenSet[str]]
+    diagnostics: Optional[List[Diagnostic]]
+
+    def __init__(self, *, fast: bool = False, encoding: str = ..., command_threshold: int = 1, max_text_size: int = 0,
+                 no_lstrip: bool = ..., ignore: Iterable[str] = ...) -> None: ...
     def close(self) -> None: ...
+    def start_pipeline(self, depth: int = 2) -> None: ...
+    def stop_pipeline(self) -> None: ...
     @property
     def filename(self) -> str: ...
     @property
@@ -95,6 +141,8 @@ class BaseLexer:
     @property
     def column(self) -> int: ...
     @property
+    def pipeline(self) -> int: ...
+    @property
     def config(self) -> LexerConfig: ...
     @property
     def closed(self) -> bool: ...
@@ -105,8 +153,13 @@ class BaseLexer:
 
 
 class FileLexer(BaseLexer):
-    def __init__(self, __path: Union[str, bytes, os.PathLike], *, encoding: str = ...,
-                 command_threshold: int = 1, no_lstrip: bool = ...) -> None: ...
+    read_ahead: Final[int]
+    block_size: Final[int]
+
+    def __init__(self, __path: Union[str, bytes, os.PathLike], *, fast: bool = False,
+                 read_ahead: int = 0, block_size: int = 65536, encoding: str = ...,
+                 command_threshold: int = 1, max_text_size: int = 0, no_lstrip: bool = ..., ignore: Iterable[str] = ...) -> None: ...
+    def rebind(self, __path: Union[str, bytes, os.PathLike]) -> None: ...
     @property
     def filename(self) -> Union[str, bytes, os.PathLike]: ...
 
@@ -114,5 +167,15 @@ class FileLexer(BaseLexer):
 class StringLexer(BaseLexer):
     content: Final[bytes]
 
-    def __init__(self, content: Union[str, bytes], *, encoding: str = ...,
-                 command_threshold: int = 1, no_lstrip: bool = ...) -> None: ...
+    def __init__(self, content: Union[str, bytes], *, fast: bool = False, encoding: str = ...,
+                 command_threshold: int = 1, max_text_size: int = 0, no_lstrip: bool = ..., ignore: Iterable[str] = ...) -> None: ...
+    def reset(self, content: Union[str, bytes]) -> None: ...
+
+
+@final
+class StatementReader:
+    lexer: Final[BaseLexer]
+
+    def __init__(self, lexer: BaseLexer) -> None: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> Tuple[int, Optional[str], bytes, int]: ...
@@ -1,18 +1,33 @@
 # distutils: sources = [kola/unicode_handler.c]
 cimport cython
 from libc.stdint cimport uint8_t
-from libc.string cimport strchr, strcmp
-from cpython cimport Py_DECREF, PyLong_FromString, PyFloat_FromString, PyBytes_FromStringAndSize
-from cpython.unicode cimport PyUnicode_FromStringAndSize, PyUnicode_Decode
+from libc.string cimport strchr, memcpy, memmove, memcmp, memset
+from libc.errno cimport errno
+from libc.stdio cimport fread, ferror
+from cpython cimport Py_DECREF, PyBytes_FromStringAndSize
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free, PyMem_RawMalloc, PyMem_RawRealloc, PyMem_RawFree
+from cpython.pythread cimport *
+from cpython.unicode cimport PyUnicode_FromStringAndSize, PyUnicode_Decode, PyUnicode_FindChar, PyUnicode_Substring, PyUnicode_AsUTF8String
 from cpython.exc cimport PyErr_Format, PyErr_SetFromErrno
 from cpython.object cimport PyTypeObject
 from cpython.type cimport PyType_Modified
 from ._yylex cimport *
 
-from .exception import KoiLangSyntaxError
+from codecs import lookup as codec_lookup, getincrementaldecoder
+from .exception import KoiLangError, KoiLangSyntaxError, KoiLangCommandError
+
+
+cdef extern from "Python.h":
+    ctypedef struct PyThreadState
+    int PyGILState_Check() nogil
+    PyThreadState* PyEval_SaveThread() nogil
+    void PyEval_RestoreThread(PyThreadState* tstate) nogil
 
 
 DEF BUFFER_SIZE = 1 << 14
+DEF READ_AHEAD_BLOCK_SIZE = 1 << 16
+DEF PIPE_BLOCK_TOKENS = 512
+DEF PIPE_BLOCK_TEXT = 1 << 14
 
 # token syn
 S_CMD = CMD
@@ -29,6 +44,8 @@ S_CMA = CMA
 S_SLP = SLP
 S_SRP = SRP
 S_ANNOTATION = ANNOTATION
+S_TEXT_PART = TEXT_PART
+S_ANNOTATION_PART = ANNOTATION_PART
 F_DISABLED = LFLAG_DISABLED
 F_LSTRIP_TEXT = LFLAG_NOLSTRIP
 
@@ -60,7 +77,7 @@ cdef class Token:
         return self is other or self.syn == other
     
     cpdef int get_flag(self):
-        if self.syn <= TEXT or self.syn == ANNOTATION:
+        if self.syn <= TEXT or self.syn >= ANNOTATION:
             return 0
         elif self.syn == LITERAL:
             return 1
@@ -76,6 +93,65 @@ cdef class Token:
             return PyUnicode_FromFormat("<token %d: %R>", self.syn, <void*>self.val)
 
 
+@cython.final
+cdef class Diagnostic:
+    """
+    Error record collected in diagnostics mode
+
+    The exception and its traceback are only built when `exception()` is called.
+    """
+
+    def __init__(
+        self,
+        int code,
+        str filename = "<kolafile>",
+        int lineno = 0,
+        int column = 0,
+        bytes text = b"",
+        cause = None
+    ):
+        self.code = code
+        self._filename = PyUnicode_AsUTF8String(filename)
+        self.lineno = lineno
+        self.column = column
+        self.text = text
+        self.cause = cause
+    
+    @property
+    def filename(self) -> str:
+        return self._filename.decode()
+    
+    @property
+    def message(self) -> str:
+        return PyUnicode_FromFormat(get_format(self.code), self.code, <const char*>self.text)
+    
+    def exception(self) -> KoiLangError:
+        exc_type = KoiLangCommandError if 2 <= self.code <= 4 else KoiLangSyntaxError
+        try:
+            kola_set_errcause(exc_type, self.code, self._filename, self.lineno, self.text, self.cause)
+        except KoiLangError as e:
+            return e
+    
+    def __repr__(self):
+        return PyUnicode_FromFormat(
+            "<kola diagnostic [%d] in file \"%s\" line %d>",
+            self.code,
+            <const char*>self._filename,
+            self.lineno
+        )
+
+
+cdef Diagnostic new_diagnostic(int code, const char* filename, int lineno, int column, const char* text, object cause):
+    cdef Diagnostic diagnostic = Diagnostic.__new__(Diagnostic)
+    diagnostic.code = code
+    diagnostic._filename = filename
+    diagnostic.lineno = lineno
+    diagnostic.column = column
+    diagnostic.text = text
+    diagnostic.cause = cause
+    return diagnostic
+
+
 cdef class LexerConfig:
     """
     Python-level interface to access extra lexer data
@@ -106,8 +182,8 @@ cdef class LexerConfig:
         return self.lexer.encoding
     
     @encoding.setter
-    def encoding(self, val: str) -> None:
-        self.lexer.encoding = val
+    def encoding(self, str val not None) -> None:
+        self.lexer.set_encoding(val)
     
     @property
     def command_threshold(self) -> int:
@@ -117,6 +193,22 @@ cdef class LexerConfig:
     def command_threshold(self, uint8_t cmd_threshold) -> None:
         self.lexer_data.command_threshold = cmd_threshold
     
+    @property
+    def max_text_size(self) -> int:
+        return self.lexer_data.max_text_size
+    
+    @max_text_size.setter
+    def max_text_size(self, size_t size) -> None:
+        self.lexer_data.max_text_size = size
+    
+    @property
+    def ignore(self) -> frozenset:
+        return self.lexer.ignore
+    
+    @ignore.setter
+    def ignore(self, val) -> None:
+        self.lexer.set_ignore(val)
+    
     @property
     def flag(self) -> int:
         return self.lexer_data.flag
@@ -158,91 +250,671 @@ cdef set _lexer_data_names = {
 PyType_Modified(LexerConfig)
 
 
+cdef Scanner default_scanner, fast_scanner
+
+default_scanner.lex_init_extra = yylex_init_extra
+default_scanner.lex_destroy = yylex_destroy
+default_scanner.lex = yylex
+default_scanner.lex_check = yylex_check
+default_scanner.reset = yylex_reset
+default_scanner.restart = yyrestart
+default_scanner.pop_buffer_state = yypop_buffer_state
+default_scanner.get_lineno = yyget_lineno
+default_scanner.get_column = yylex_column
+default_scanner.get_leng = yyget_leng
+default_scanner.get_text = yyget_text
+
+fast_scanner.lex_init_extra = kolafast_lex_init_extra
+fast_scanner.lex_destroy = kolafast_lex_destroy
+fast_scanner.lex = kolafast_lex
+fast_scanner.lex_check = kolafast_lex_check
+fast_scanner.reset = kolafast_lex_reset
+fast_scanner.restart = kolafast_restart
+fast_scanner.pop_buffer_state = kolafast_pop_buffer_state
+fast_scanner.get_lineno = kolafast_lex_lineno
+fast_scanner.get_column = kolafast_lex_column
+fast_scanner.get_leng = kolafast_get_leng
+fast_scanner.get_text = kolafast_get_text
+
+
+cdef str _bom_encoding(const char* buf, Py_ssize_t size):
+    if size >= 4 and (memcmp(buf, b"\xff\xfe\0\0", 4) == 0 or memcmp(buf, b"\0\0\xfe\xff", 4) == 0):
+        return "utf-32"
+    elif size >= 3 and memcmp(buf, b"\xef\xbb\xbf", 3) == 0:
+        return "utf-8-sig"
+    elif size >= 2 and (memcmp(buf, b"\xff\xfe", 2) == 0 or memcmp(buf, b"\xfe\xff", 2) == 0):
+        return "utf-16"
+    return None
+
+
+cdef void _read_ahead_worker(void* arg) noexcept nogil:
+    cdef:
+        ReadAhead* reader = <ReadAhead*>arg
+        int i = 0
+        size_t n
+    while True:
+        PyThread_acquire_lock(reader.empty[i], WAIT_LOCK)
+        if reader.stop:
+            break
+        n = fread(reader.blocks + i * reader.block_size, 1, reader.block_size, reader.fp)
+        if n == 0 and ferror(reader.fp):
+            reader.sizes[i] = -1
+            reader.errors[i] = errno
+        else:
+            reader.sizes[i] = <Py_ssize_t>n
+        PyThread_release_lock(reader.full[i])
+        if n == 0:
+            break
+        i = (i + 1) % reader.depth
+    PyThread_release_lock(reader.done)
+
+
+cdef void _free_read_ahead(ReadAhead* reader) noexcept:
+    cdef int i
+    for i in range(reader.depth):
+        if reader.empty[i]:
+            PyThread_free_lock(reader.empty[i])
+        if reader.full[i]:
+            PyThread_free_lock(reader.full[i])
+    if reader.done:
+        PyThread_free_lock(reader.done)
+    PyMem_RawFree(reader.blocks)
+    PyMem_RawFree(reader.sizes)
+    PyMem_RawFree(reader.errors)
+    PyMem_RawFree(reader.empty)
+    PyMem_RawFree(reader.full)
+    PyMem_RawFree(reader)
+
+
+cdef ReadAhead* _start_read_ahead(FILE* fp, int depth, size_t block_size) except NULL:
+    """
+    Start a native thread filling up to `depth` blocks of the file ahead of the scanner.
+    """
+    cdef ReadAhead* reader = <ReadAhead*>PyMem_RawMalloc(sizeof(ReadAhead))
+    if reader == NULL:
+        raise MemoryError
+    memset(reader, 0, sizeof(ReadAhead))
+    reader.fp = fp
+    reader.depth = depth
+    reader.block_size = block_size
+    reader.blocks = <char*>PyMem_RawMalloc(depth * block_size)
+    reader.sizes = <Py_ssize_t*>PyMem_RawMalloc(depth * sizeof(Py_ssize_t))
+    reader.errors = <int*>PyMem_RawMalloc(depth * sizeof(int))
+    reader.empty = <PyThread_type_lock*>PyMem_RawMalloc(depth * sizeof(PyThread_type_lock))
+    reader.full = <PyThread_type_lock*>PyMem_RawMalloc(depth * sizeof(PyThread_type_lock))
+    if reader.empty != NULL:
+        memset(reader.empty, 0, depth * sizeof(PyThread_type_lock))
+    if reader.full != NULL:
+        memset(reader.full, 0, depth * sizeof(PyThread_type_lock))
+    if reader.blocks == NULL or reader.sizes == NULL or reader.errors == NULL or \
+            reader.empty == NULL or reader.full == NULL:
+        _free_read_ahead(reader)
+        raise MemoryError
+
+    cdef int i
+    try:
+        # a block is owned by the worker while 'empty' is held, and by the scanner while 'full' is held
+        for i in range(depth):
+            reader.empty[i] = PyThread_allocate_lock()
+            reader.full[i] = PyThread_allocate_lock()
+            if reader.empty[i] == NULL or reader.full[i] == NULL:
+                raise MemoryError
+            PyThread_acquire_lock(reader.full[i], WAIT_LOCK)
+        reader.done = PyThread_allocate_lock()
+        if reader.done == NULL:
+            raise MemoryError
+        PyThread_acquire_lock(reader.done, WAIT_LOCK)
+        if <unsigned long>PyThread_start_new_thread(_read_ahead_worker, reader) == <unsigned long>-1:
+            raise RuntimeError("can't start read-ahead thread")
+    except:
+        _free_read_ahead(reader)
+        raise
+    return reader
+
+
+cdef void _stop_read_ahead(ReadAhead* reader) noexcept:
+    cdef int i
+    with nogil:
+        reader.stop = True
+        for i in range(reader.depth):
+            PyThread_release_lock(reader.empty[i])
+        PyThread_acquire_lock(reader.done, WAIT_LOCK)
+    _free_read_ahead(reader)
+
+
+cdef int _read_ahead(ReadAhead* reader, char* buf, int max_size) noexcept nogil:
+    cdef Py_ssize_t size
+    if reader.eof:
+        return 0
+    if not reader.holding:
+        PyThread_acquire_lock(reader.full[reader.head], WAIT_LOCK)
+        reader.holding = True
+        reader.pos = 0
+
+    size = reader.sizes[reader.head]
+    if size <= 0:
+        reader.eof = True
+        if size < 0:
+            errno = reader.errors[reader.head]
+            return -1
+        return 0
+    size -= reader.pos
+    if size > max_size:
+        size = max_size
+    memcpy(buf, reader.blocks + reader.head * reader.block_size + reader.pos, size)
+    reader.pos += size
+    if reader.pos == <size_t>reader.sizes[reader.head]:
+        # hand the block back to the worker
+        reader.holding = False
+        PyThread_release_lock(reader.empty[reader.head])
+        reader.head = (reader.head + 1) % reader.depth
+    return <int>size
+
+
+cdef inline int _read_raw(InputState* state, char* buf, int max_size, FILE* fp, int interactive) noexcept nogil:
+    if state.reader != NULL:
+        return _read_ahead(state.reader, buf, max_size)
+    return kola_read_raw(fp, buf, max_size, interactive)
+
+
+cdef int _read_input(void* ctx, char* buf, int max_size, FILE* fp, int interactive) noexcept nogil:
+    cdef:
+        InputState* state = <InputState*>ctx
+        PyThreadState* save
+        int n
+    if state.mode == INPUT_RAW:
+        if not PyGILState_Check():
+            return _read_raw(state, buf, max_size, fp, interactive)
+        # scanning with the GIL held, release it while reading
+        save = PyEval_SaveThread()
+        n = _read_raw(state, buf, max_size, fp, interactive)
+        PyEval_RestoreThread(save)
+        return n
+    with gil:
+        lexer = <BaseLexer>state.lexer
+        try:
+            return lexer.fill_input(buf, max_size, fp, interactive)
+        except BaseException as e:
+            # reported to flex as EOF and raised again in next_token
+            if lexer.pipe != NULL:
+                # raised when the consumer reaches the end of the tokens
+                lexer.pipe_error = e
+                lexer.pipe.failed = True
+            else:
+                lexer.input_error = e
+            return 0
+
+
+cdef bint _skip_syn(const Scanner* yy, yyscan_t scanner, const NameFilter* filter, int syn) noexcept nogil:
+    cdef:
+        Py_ssize_t i, size
+        const char* text
+    if syn == TEXT or syn == TEXT_PART:
+        return filter.text
+    elif syn == ANNOTATION or syn == ANNOTATION_PART:
+        return filter.annotation
+    elif syn == CMD_N:
+        return filter.number
+    elif syn == CMD and filter.size:
+        text = yy.get_text(scanner)
+        size = yy.get_leng(scanner)
+        for i in range(filter.size):
+            if filter.lengths[i] == size and memcmp(filter.names[i], text, size) == 0:
+                return True
+    return False
+
+
+cdef int _scan_syn(const Scanner* yy, yyscan_t scanner, const NameFilter* filter) noexcept nogil:
+    cdef int syn = yy.lex(scanner)
+    while _skip_syn(yy, scanner, filter, syn):
+        # drop the whole statement without building any token
+        syn = yy.lex(scanner)
+        while syn > TEXT and syn < ANNOTATION:
+            syn = yy.lex(scanner)
+    return syn
+
+
+cdef void _pipeline_worker(void* arg) noexcept nogil:
+    cdef:
+        Pipeline* pipe = <Pipeline*>arg
+        PipeBlock* block
+        PipeEntry* entry
+        int i = 0, syn = 0
+        Py_ssize_t length
+        char* text
+    while syn != EOF:
+        PyThread_acquire_lock(pipe.empty[i], WAIT_LOCK)
+        if pipe.stop:
+            break
+        block = &pipe.blocks[i]
+        block.count = 0
+        block.size = 0
+        while block.count < PIPE_BLOCK_TOKENS and block.size < PIPE_BLOCK_TEXT and not pipe.stop:
+            syn = _scan_syn(pipe.yy, pipe.scanner, pipe.filter)
+            if pipe.failed:
+                # the token scanned when the input failed is dropped
+                syn = EOF
+            entry = &block.entries[block.count]
+            block.count += 1
+            entry.lineno = pipe.yy.get_lineno(pipe.scanner)
+            entry.column = pipe.yy.get_column(pipe.scanner)
+            entry.offset = block.size
+            entry.length = 0
+            if syn != EOF:
+                length = pipe.yy.get_leng(pipe.scanner)
+                if block.size + length >= block.capacity:
+                    text = <char*>PyMem_RawRealloc(block.text, block.size + length + PIPE_BLOCK_TEXT)
+                    if text == NULL:
+                        # end the tokens here, reported as MemoryError by the consumer
+                        pipe.no_memory = True
+                        syn = EOF
+                    else:
+                        block.text = text
+                        block.capacity = block.size + length + PIPE_BLOCK_TEXT
+            entry.syn = syn
+            if syn == EOF:
+                break
+            # the scanner buffer is reused, keep a NUL terminated copy of the text
+            memcpy(block.text + block.size, pipe.yy.get_text(pipe.scanner), length)
+            block.text[block.size + length] = 0
+            entry.length = length
+            block.size += length + 1
+        PyThread_release_lock(pipe.full[i])
+        i = (i + 1) % pipe.depth
+    PyThread_release_lock(pipe.done)
+
+
+cdef void _free_pipeline(Pipeline* pipe) noexcept:
+    cdef int i
+    for i in range(pipe.depth):
+        if pipe.empty != NULL and pipe.empty[i]:
+            PyThread_free_lock(pipe.empty[i])
+        if pipe.full != NULL and pipe.full[i]:
+            PyThread_free_lock(pipe.full[i])
+        if pipe.blocks != NULL:
+            PyMem_RawFree(pipe.blocks[i].entries)
+            PyMem_RawFree(pipe.blocks[i].text)
+    if pipe.done:
+        PyThread_free_lock(pipe.done)
+    PyMem_RawFree(pipe.blocks)
+    PyMem_RawFree(pipe.empty)
+    PyMem_RawFree(pipe.full)
+    PyMem_RawFree(pipe)
+
+
+cdef Pipeline* _start_pipeline(const Scanner* yy, yyscan_t scanner, NameFilter* filter, int depth) except NULL:
+    """
+    Start a native thread scanning up to `depth` blocks of tokens ahead of the consumer.
+    """
+    cdef Pipeline* pipe = <Pipeline*>PyMem_RawMalloc(sizeof(Pipeline))
+    if pipe == NULL:
+        raise MemoryError
+    memset(pipe, 0, sizeof(Pipeline))
+    pipe.yy = yy
+    pipe.scanner = scanner
+    pipe.filter = filter
+    pipe.depth = depth
+    pipe.blocks = <PipeBlock*>PyMem_RawMalloc(depth * sizeof(PipeBlock))
+    pipe.empty = <PyThread_type_lock*>PyMem_RawMalloc(depth * sizeof(PyThread_type_lock))
+    pipe.full = <PyThread_type_lock*>PyMem_RawMalloc(depth * sizeof(PyThread_type_lock))
+    if pipe.blocks != NULL:
+        memset(pipe.blocks, 0, depth * sizeof(PipeBlock))
+    if pipe.empty != NULL:
+        memset(pipe.empty, 0, depth * sizeof(PyThread_type_lock))
+    if pipe.full != NULL:
+        memset(pipe.full, 0, depth * sizeof(PyThread_type_lock))
+    if pipe.blocks == NULL or pipe.empty == NULL or pipe.full == NULL:
+        _free_pipeline(pipe)
+        raise MemoryError
+
+    cdef int i
+    try:
+        # same ownership as the read-ahead blocks
+        for i in range(depth):
+            pipe.blocks[i].entries = <PipeEntry*>PyMem_RawMalloc(PIPE_BLOCK_TOKENS * sizeof(PipeEntry))
+            pipe.blocks[i].text = <char*>PyMem_RawMalloc(2 * PIPE_BLOCK_TEXT)
+            if pipe.blocks[i].entries == NULL or pipe.blocks[i].text == NULL:
+                raise MemoryError
+            pipe.blocks[i].capacity = 2 * PIPE_BLOCK_TEXT
+            pipe.empty[i] = PyThread_allocate_lock()
+            pipe.full[i] = PyThread_allocate_lock()
+            if pipe.empty[i] == NULL or pipe.full[i] == NULL:
+                raise MemoryError
+            PyThread_acquire_lock(pipe.full[i], WAIT_LOCK)
+        pipe.done = PyThread_allocate_lock()
+        if pipe.done == NULL:
+            raise MemoryError
+        PyThread_acquire_lock(pipe.done, WAIT_LOCK)
+        if <unsigned long>PyThread_start_new_thread(_pipeline_worker, pipe) == <unsigned long>-1:
+            raise RuntimeError("can't start pipeline thread")
+    except:
+        _free_pipeline(pipe)
+        raise
+    return pipe
+
+
+cdef void _stop_pipeline(Pipeline* pipe) noexcept:
+    cdef int i
+    with nogil:
+        pipe.stop = True
+        for i in range(pipe.depth):
+            PyThread_release_lock(pipe.empty[i])
+        PyThread_acquire_lock(pipe.done, WAIT_LOCK)
+    _free_pipeline(pipe)
+
+
+cdef PipeEntry* _pipeline_next(Pipeline* pipe) noexcept nogil:
+    cdef:
+        PyThreadState* save
+        PipeEntry* entry
+    if pipe.eof:
+        return pipe.current
+    if pipe.holding and pipe.pos == pipe.blocks[pipe.head].count:
+        # hand the block back to the worker
+        pipe.holding = False
+        PyThread_release_lock(pipe.empty[pipe.head])
+        pipe.head = (pipe.head + 1) % pipe.depth
+    if not pipe.holding:
+        if not PyThread_acquire_lock(pipe.full[pipe.head], NOWAIT_LOCK):
+            if PyGILState_Check():
+                save = PyEval_SaveThread()
+                PyThread_acquire_lock(pipe.full[pipe.head], WAIT_LOCK)
+                PyEval_RestoreThread(save)
+            else:
+                PyThread_acquire_lock(pipe.full[pipe.head], WAIT_LOCK)
+        pipe.holding = True
+        pipe.pos = 0
+    entry = &pipe.blocks[pipe.head].entries[pipe.pos]
+    pipe.pos += 1
+    pipe.current = entry
+    pipe.eof = entry.syn == EOF
+    return entry
+
+
 cdef class BaseLexer(object):
     """
     KoiLang lexer reading from stdin
     """
 
-    def __cinit__(self, *args, **kwds):
+    def __cinit__(self, *args, bint fast = False, **kwds):
+        self.fast = fast
+        self.yy = &fast_scanner if fast else &default_scanner
         self.encoding = "utf-8"
+        self.encoding_kind = ENC_UTF8
+        self.encoding_name = b"utf-8"
         self.lexer_data.filename = "<kolafile>"
         self.lexer_data.command_threshold = 1
-        if yylex_init_extra(&self.lexer_data, &self.scanner):
+        self.ignore = frozenset()
+        if self.yy.lex_init_extra(&self.lexer_data, &self.scanner):
             PyErr_SetFromErrno(RuntimeError)
     
-    def __init__(self, **kwds):
-        yyrestart(stdin, self.scanner)
+    def __init__(self, *, bint fast = False, **kwds):
+        self.yy.restart(stdin, self.scanner)
+        self.init_input()
         self.lexer_data.filename = "<stdin>"
         LexerConfig(self).set(**kwds)
     
     def __dealloc__(self):
         self.close()
         if self.scanner:
-            yylex_destroy(self.scanner)
+            self.yy.lex_destroy(self.scanner)
+        PyMem_Free(self.filter.names)
+        PyMem_Free(self.filter.lengths)
+    
+    cdef void set_encoding(self, str encoding) except *:
+        cdef str name = codec_lookup(encoding).name
+        if name == "utf-8":
+            self.encoding_kind = ENC_UTF8
+        elif name == "ascii":
+            self.encoding_kind = ENC_ASCII
+        else:
+            self.encoding_kind = ENC_OTHER
+        self.encoding_name = name.encode()
+        self.encoding = encoding
+
+        if self.input_state.mode != INPUT_DETECT:
+            # input already started, switch the decoder for the following data
+            if self.encoding_kind == ENC_OTHER:
+                self.set_decoder(name)
+            else:
+                self.decoder = None
+                if self.pending is None:
+                    self.input_state.mode = INPUT_RAW
+    
+    cdef void init_input(self):
+        """
+        Install the input hook transcoding the file read to UTF-8.
+        """
+        self.input_state.mode = INPUT_DETECT
+        self.input_state.lexer = <PyObject*>self
+        self.lexer_data.input = _read_input
+        self.lexer_data.input_ctx = &self.input_state
+        self.yy.reset(self.scanner)
+        self.utf8_input = False
+        self.decoder = None
+        self.pending = None
+        self.input_error = None
+    
+    cdef void set_decoder(self, str encoding) except *:
+        self.decoder = getincrementaldecoder(encoding)()
+        self.input_state.mode = INPUT_TRANSCODE
+        self.utf8_input = True
+    
+    cdef void set_ignore(self, names) except *:
+        """
+        Set the statements skipped by the lexer.
+
+        '@text', '@annotation' and '@number' skip the corresponding statements,
+        other names skip the command lines with that name.
+        """
+        if self.pipe != NULL:
+            raise RuntimeError("can't change the ignored statements of a pipelined lexer")
+        cdef frozenset ignore = frozenset(names)
+        cdef tuple commands = tuple([
+            PyUnicode_AsUTF8String(name) for name in ignore if not (<str?>name).startswith("@")
+        ])
+        cdef Py_ssize_t i, size = len(commands)
+        cdef const char** cmd_names = <const char**>PyMem_Malloc(size * sizeof(char*) + 1)
+        cdef Py_ssize_t* cmd_lengths = <Py_ssize_t*>PyMem_Malloc(size * sizeof(Py_ssize_t) + 1)
+        if cmd_names == NULL or cmd_lengths == NULL:
+            PyMem_Free(cmd_names)
+            PyMem_Free(cmd_lengths)
+            raise MemoryError
+        for i in range(size):
+            cmd_names[i] = <bytes>commands[i]
+            cmd_lengths[i] = len(<bytes>commands[i])
+
+        PyMem_Free(self.filter.names)
+        PyMem_Free(self.filter.lengths)
+        self.filter.names = cmd_names
+        self.filter.lengths = cmd_lengths
+        self.filter.size = size
+        self.filter.text = "@text" in ignore
+        self.filter.annotation = "@annotation" in ignore
+        self.filter.number = "@number" in ignore
+        self.filter_names = commands
+        self.ignore = ignore
+    
+    cdef int fill_input(self, char* buf, int max_size, FILE* fp, bint interactive) except -1:
+        cdef:
+            int n, size
+            str bom
+        while True:
+            if self.pending is not None:
+                size = len(self.pending) - self.pending_pos
+                if size > 0:
+                    if size > max_size:
+                        size = max_size
+                    memcpy(buf, <const char*>self.pending + self.pending_pos, size)
+                    self.pending_pos += size
+                    return size
+                self.pending = None
+
+            with nogil:
+                n = _read_raw(&self.input_state, buf, max_size, fp, interactive)
+            if n < 0:
+                PyErr_SetFromErrno(OSError)
+
+            size = n
+            if self.input_state.mode == INPUT_DETECT:
+                if self.encoding_kind == ENC_OTHER:
+                    self.set_decoder(self.encoding_name.decode())
+                else:
+                    bom = _bom_encoding(buf, n)
+                    if bom == "utf-8-sig":
+                        size -= 3
+                        memmove(buf, buf + 3, size)
+                        self.utf8_input = True
+                    elif bom is not None:
+                        self.set_decoder(bom)
+            if self.decoder is None:
+                self.input_state.mode = INPUT_RAW
+                if size or not n:
+                    return size
+                continue
+
+            self.pending = PyUnicode_AsUTF8String(
+                self.decoder.decode(PyBytes_FromStringAndSize(buf, n), not n)
+            )
+            self.pending_pos = 0
+            if not n and not self.pending:
+                self.pending = None
+                return 0
     
     cpdef void close(self):
-        yypop_buffer_state(self.scanner)
+        self.stop_pipeline()
+        self.yy.pop_buffer_state(self.scanner)
+    
+    cpdef void start_pipeline(self, int depth = 2) except *:
+        """
+        Scan the tokens in a native thread, up to `depth` blocks ahead of the parser.
+
+        The lexer must not be reconfigured until the pipeline is stopped.
+        """
+        if depth <= 0:
+            raise ValueError("depth must be positive")
+        if not self.yy.lex_check(self.scanner):
+            raise OSError("operation on closed lexer")
+        if self.pipe != NULL:
+            raise RuntimeError("pipeline already started")
+        self.pipe = _start_pipeline(self.yy, self.scanner, &self.filter, depth)
+    
+    cpdef void stop_pipeline(self):
+        cdef Pipeline* pipe = self.pipe
+        if pipe != NULL:
+            self.pipe = NULL
+            _stop_pipeline(pipe)
+            self.pipe_error = None
+    
+    cdef int token_lineno(self) noexcept nogil:
+        if self.pipe != NULL and self.pipe.current != NULL:
+            return self.pipe.current.lineno
+        return self.yy.get_lineno(self.scanner)
+    
+    cdef int token_column(self) noexcept nogil:
+        if self.pipe != NULL and self.pipe.current != NULL:
+            return self.pipe.current.column
+        return self.yy.get_column(self.scanner)
     
     cdef void set_error(self, const char* text) except *:
         cdef int errno = 1
         
         # correct lineno and set error
         cdef bint c = strchr(text, ord('\n')) != NULL
-        cdef int lineno = yyget_lineno(self.scanner)
+        cdef int lineno = self.token_lineno()
         if c or text[0] == 0:
             lineno -= c
             errno = 10
+        if self.diagnostics is not None:
+            self.diagnostics.append(new_diagnostic(
+                errno, self.lexer_data.filename, lineno, self.token_column(), text, None
+            ))
+            return
         kola_set_error(KoiLangSyntaxError, errno, self.lexer_data.filename, lineno, text)
     
-    cdef (int, const char*, Py_ssize_t) next_syn(self) nogil:
-        cdef int syn = yylex(self.scanner)
-        return syn, yyget_text(self.scanner), yyget_leng(self.scanner)
+    cdef (int, const char*, Py_ssize_t) next_syn(self) noexcept nogil:
+        cdef PipeEntry* entry
+        if self.pipe != NULL:
+            entry = _pipeline_next(self.pipe)
+            if entry.syn == EOF:
+                if self.pipe.no_memory:
+                    with gil:
+                        self.pipe.no_memory = False
+                        self.input_error = MemoryError()
+                else:
+                    with gil:
+                        if self.pipe_error is not None:
+                            self.input_error, self.pipe_error = self.pipe_error, None
+                return EOF, "", 0
+            return entry.syn, self.pipe.blocks[self.pipe.head].text + entry.offset, entry.length
+        cdef int syn = _scan_syn(self.yy, self.scanner, &self.filter)
+        return syn, self.yy.get_text(self.scanner), self.yy.get_leng(self.scanner)
     
-    cdef Token next_token(self):
-        if not yylex_check(self.scanner):
-            raise OSError("operation on closed lexer")
-
-        cdef:
-            int syn
-            const char* text
-            Py_ssize_t text_len
-            const char* encoding
-        with nogil:
-            syn, text, text_len = self.next_syn()
+    cdef object syn_value(self, int* syn, const char* text, Py_ssize_t text_len):
+        """
+        Build the value of a scanned token.
 
-        val = None
-        if syn == NUM or syn == CMD_N:
-            val = PyLong_FromString(text, NULL, 10)
-        elif syn == NUM_H:
-            val = PyLong_FromString(text, NULL, 16)
-        elif syn == NUM_B:
-            val = PyLong_FromString(text, NULL, 2)
-        elif syn == NUM_F:
-            val = PyFloat_FromString(text)
-        elif syn == CMD or syn == LITERAL:
-            val = PyUnicode_FromStringAndSize(text, text_len)
-        elif syn == TEXT or syn == ANNOTATION:
-            encoding = unicode2string(self.encoding, NULL)
-            s = PyUnicode_Decode(text, text_len, encoding, NULL)
-            val = filter_text(s)
-        elif syn == STRING:
-            encoding = unicode2string(self.encoding, NULL)
-            if strcmp(encoding, "utf-8") != 0:
-                s = PyUnicode_Decode(text, text_len, encoding, NULL)
+        In diagnostics mode, a string failing to decode is recorded and `syn` set to 0.
+        """
+        cdef TextEncoding encoding_kind = ENC_UTF8 if self.utf8_input else self.encoding_kind
+        if syn[0] == NUM or syn[0] == CMD_N:
+            return parse_integer(text, text_len, 10)
+        elif syn[0] == NUM_H:
+            return parse_integer(text, text_len, 16)
+        elif syn[0] == NUM_B:
+            return parse_integer(text, text_len, 2)
+        elif syn[0] == NUM_F:
+            return parse_float(text)
+        elif syn[0] == CMD or syn[0] == LITERAL:
+            return PyUnicode_FromStringAndSize(text, text_len)
+        elif syn[0] == TEXT or syn[0] == ANNOTATION or syn[0] == TEXT_PART or syn[0] == ANNOTATION_PART:
+            return decode_text(text, text_len, encoding_kind, self.encoding_name)
+        elif syn[0] == STRING:
+            if encoding_kind != ENC_UTF8:
+                s = PyUnicode_Decode(text, text_len, <const char*>self.encoding_name, NULL)
+                if PyUnicode_FindChar(s, ord('\\'), 0, len(s), 1) == -1:
+                    # no escape in the string, the decoded text can be used directly
+                    return PyUnicode_Substring(s, 1, len(s) - 1)
                 text = unicode2string(s, &text_len)
             try:
-                val = decode_escapes(text + 1, text_len - 2)
+                return decode_escapes(text + 1, text_len - 2)
             except Exception as e:
-                kola_set_errcause(KoiLangSyntaxError, 5, self.lexer_data.filename, yyget_lineno(self.scanner), text, e)
-        elif syn == 0:
+                if self.diagnostics is None:
+                    kola_set_errcause(KoiLangSyntaxError, 5, self.lexer_data.filename, self.token_lineno(), text, e)
+                # report the string as an error token
+                self.diagnostics.append(new_diagnostic(
+                    5, self.lexer_data.filename, self.token_lineno(),
+                    self.token_column(), text, e
+                ))
+                syn[0] = 0
+        elif syn[0] == 0:
             self.set_error(text)
-        elif syn == EOF:
+        return None
+    
+    cdef Token make_token(self, int syn, const char* text, Py_ssize_t text_len):
+        if syn == EOF:
             return None
+        val = self.syn_value(&syn, text, text_len)
         return Token(
             syn, val,
-            lineno=yyget_lineno(self.scanner),
+            lineno=self.token_lineno(),
             raw_val=PyBytes_FromStringAndSize(text, text_len)
         )
+    
+    cdef Token next_token(self):
+        if not self.yy.lex_check(self.scanner):
+            raise OSError("operation on closed lexer")
+
+        cdef:
+            int syn
+            const char* text
+            Py_ssize_t text_len
+        with nogil:
+            syn, text, text_len = self.next_syn()
+        if self.input_error is not None:
+            e, self.input_error = self.input_error, None
+            raise e
+        return self.make_token(syn, text, text_len)
 
     @property
     def filename(self):
@@ -250,11 +922,15 @@ cdef class BaseLexer(object):
     
     @property
     def lineno(self):
-        return yyget_lineno(self.scanner)
+        return self.token_lineno()
     
     @property
     def column(self):
-        return yyget_column(self.scanner)
+        return self.token_column()
+    
+    @property
+    def pipeline(self) -> int:
+        return 0 if self.pipe == NULL else self.pipe.depth
     
     @property
     def config(self) -> LexerConfig:
@@ -262,7 +938,7 @@ cdef class BaseLexer(object):
     
     @property
     def closed(self) -> bool:
-        return not yylex_check(self.scanner)
+        return not self.yy.lex_check(self.scanner)
     
     def __iter__(self):
         return self
@@ -280,7 +956,7 @@ cdef class BaseLexer(object):
         self.close()
     
     def __repr__(self):
-        if not yylex_check(self.scanner):
+        if not self.yy.lex_check(self.scanner):
             return PyUnicode_FromFormat(
                 "<kola lexer in file \"%s\" closed>",
                 self.lexer_data.filename
@@ -289,7 +965,7 @@ cdef class BaseLexer(object):
             return PyUnicode_FromFormat(
                 "<kola lexer in file \"%s\" line %d>",
                 self.lexer_data.filename,
-                yyget_lineno(self.scanner)
+                self.token_lineno()
             )
 
 
@@ -298,24 +974,51 @@ cdef class FileLexer(BaseLexer):
     KoiLang lexer reading from file
     """
 
-    def __init__(self, __path not None, **kwds):
-        if self.fp:
-            fclose(self.fp)
+    def __init__(
+        self, __path not None, *, bint fast = False, int read_ahead = 0,
+        Py_ssize_t block_size = READ_AHEAD_BLOCK_SIZE, **kwds
+    ):
+        if read_ahead < 0:
+            raise ValueError("read_ahead must be non-negative")
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self.read_ahead = read_ahead
+        self.block_size = block_size
+        self.open(__path)
+        LexerConfig(self).set(**kwds)
+    
+    def rebind(self, __path not None):
+        """
+        Read another file, keeping the current configuration.
+        """
+        self.open(__path)
+    
+    cdef void open(self, path) except *:
+        self.close()
 
-        self._filenameo = __path
         cdef PyObject* p_addr
-        self.fp = kola_open(__path, &p_addr, 'r')
+        self.fp = kola_open(path, &p_addr, 'rb')
         p = <object>p_addr
+        self._filenameo = path
         self._filenameb = <bytes>p if isinstance(p, bytes) else (<str>p).encode()
         Py_DECREF(p)
 
-        yyrestart(self.fp, self.scanner)
+        self.yy.restart(self.fp, self.scanner)
+        self.init_input()
         self.lexer_data.filename = self._filenameb
-        LexerConfig(self).set(**kwds)
+        if self.read_ahead:
+            self.input_state.reader = _start_read_ahead(self.fp, self.read_ahead, self.block_size)
+    
+    cdef void stop_read_ahead(self):
+        cdef ReadAhead* reader = self.input_state.reader
+        if reader != NULL:
+            self.input_state.reader = NULL
+            _stop_read_ahead(reader)
     
     cpdef void close(self):
         BaseLexer.close(self)
         if self.fp:
+            self.stop_read_ahead()
             fclose(self.fp)
             self.fp = NULL
     
@@ -329,15 +1032,157 @@ cdef class StringLexer(BaseLexer):
     KoiLang lexer reading from string provided
     """
 
-    def __init__(self, content: Union[str, bytes], **kwds):
+    def __init__(self, content: Union[str, bytes], *, bint fast = False, **kwds):
+        self.lexer_data.filename = "<string>"
+        LexerConfig(self).set(**kwds)
+        self.set_content(content)
+    
+    def reset(self, content: Union[str, bytes]):
+        """
+        Scan new content, keeping the current configuration.
+        """
+        self.set_content(content)
+    
+    cdef void set_content(self, content) except *:
+        self.stop_pipeline()
         if not self.content is None:
-            yypop_buffer_state(self.scanner)
+            self.yy.pop_buffer_state(self.scanner)
 
+        cdef bytes data
+        cdef str codec = None
         if isinstance(content, str):
-            self.content = (<str>content).encode()
+            self.content = data = (<str>content).encode()
+            self.utf8_input = True
         else:
-            self.content = content
+            self.content = data = content
+            if self.encoding_kind == ENC_OTHER:
+                codec = self.encoding_name.decode()
+            else:
+                codec = _bom_encoding(data, len(data))
+            if codec == "utf-8-sig":
+                data = data[3:]
+            elif codec is not None:
+                # transcode once so that tokens are always decoded as UTF-8
+                data = PyUnicode_AsUTF8String(data.decode(codec))
+            self.utf8_input = codec is not None
 
-        yy_scan_bytes(self.content, len(self.content), self.scanner)
-        self.lexer_data.filename = "<string>"
-        LexerConfig(self).set(**kwds)
+        if self.fast:
+            kolafast__scan_bytes(data, len(data), self.scanner)
+        else:
+            yy_scan_bytes(data, len(data), self.scanner)
+        self.yy.reset(self.scanner)
+        self.input_error = None
+
+
+
+cdef inline bint _statement_start(int syn) noexcept nogil:
+    return syn <= TEXT or syn >= ANNOTATION
+
+
+@cython.final
+cdef class StatementReader:
+    """
+    Read whole statements from a lexer as raw source, without building token values.
+
+    Each statement is yielded as a tuple of the syn of its first token, the command name
+    (None for other statements), the UTF-8 source after the command name and the line.
+    The source of arguments is rebuilt from the tokens joined by single spaces, so the
+    original spacing and line continuations between them are not kept.
+    """
+
+    def __init__(self, BaseLexer lexer not None):
+        self.lexer = lexer
+    
+    def __dealloc__(self):
+        PyMem_Free(self.buffer)
+    
+    cdef void append(self, const char* text, Py_ssize_t length) except *:
+        cdef:
+            Py_ssize_t capacity
+            char* buffer
+        if self.size + length > self.capacity:
+            capacity = max(self.size + length, 2 * self.capacity, 256)
+            buffer = <char*>PyMem_Realloc(self.buffer, capacity)
+            if buffer == NULL:
+                raise MemoryError
+            self.buffer = buffer
+            self.capacity = capacity
+        memcpy(self.buffer + self.size, text, length)
+        self.size += length
+    
+    cdef int read(self, const char** text, Py_ssize_t* length) except? -2:
+        cdef:
+            BaseLexer lexer = self.lexer
+            int syn
+        if not lexer.yy.lex_check(lexer.scanner):
+            raise OSError("operation on closed lexer")
+        while True:
+            with nogil:
+                syn, text[0], length[0] = lexer.next_syn()
+            if lexer.input_error is not None:
+                e, lexer.input_error = lexer.input_error, None
+                raise e
+            if self.recover:
+                if syn == 0 or not _statement_start(syn):
+                    continue
+                self.recover = False
+            if syn == 0:
+                # skip to the next statement, dropping the current one
+                self.recover = self.dropped = True
+                lexer.set_error(text[0])
+                continue
+            return syn
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        cdef:
+            int syn, lineno, last
+            const char* text
+            Py_ssize_t length
+            object name = None
+        if not self.started or self.recover:
+            # first statement, or an error was raised while reading the last one
+            self.started = True
+            self.next_syn = self.read(&text, &length)
+            self.dropped = False
+            self.next_lineno = self.lexer.token_lineno()
+            self.next_text = PyBytes_FromStringAndSize(text, length)
+        
+        while True:
+            syn = last = self.next_syn
+            if syn == EOF:
+                raise StopIteration
+            lineno = self.next_lineno
+            self.size = 0
+            if syn == CMD:
+                name = PyUnicode_FromStringAndSize(<const char*>self.next_text, len(self.next_text))
+            else:
+                self.append(<const char*>self.next_text, len(self.next_text))
+            
+            while True:
+                self.next_syn = self.read(&text, &length)
+                if self.dropped:
+                    break
+                if last == TEXT_PART or last == ANNOTATION_PART:
+                    # parts are joined into one statement
+                    if self.next_syn != EOF:
+                        self.append(text, length)
+                        last = self.next_syn
+                        continue
+                elif not _statement_start(self.next_syn):
+                    if last != SLP and self.next_syn != CLN and self.next_syn != CMA and self.next_syn != SRP and \
+                            not (self.next_syn == SLP and last == LITERAL):
+                        self.append(" ", 1)
+                    self.append(text, length)
+                    last = self.next_syn
+                    continue
+                break
+            self.next_lineno = self.lexer.token_lineno()
+            self.next_text = PyBytes_FromStringAndSize(text, length)
+            if self.dropped:
+                # a collected error dropped the statement
+                self.dropped = False
+                continue
+            return syn, name, PyBytes_FromStringAndSize(self.buffer, self.size), lineno
@@ -0,0 +1,296 @@
+"""
+Streaming kola to kola transformation
+
+Statements read from a lexer go through a chain of stages and are written
+to a writer. Statements are kept as raw source, and the argument values
+are only built for the stages asking for them, so that renaming or dropping
+statements costs little more than scanning the document.
+
+The raw source of a command is rebuilt from its tokens: arguments are joined
+by single spaces, with no space after '(' or before ':', ',' and ')'. The
+original spacing and line continuations inside a command are not kept, and
+every statement is written with a '\\n' line end. Text and annotations keep
+their source bytes.
+"""
+
+import os
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple, Union
+
+from kola.lexer import (BaseLexer, Diagnostic, FileLexer, StatementReader, StringLexer, Token, S_CMD, S_CMD_N,
+                        S_LITERAL, S_CLN, S_CMA, S_SLP, S_SRP, S_ANNOTATION, S_ANNOTATION_PART)
+from kola.writer import BaseWriter, FileWriter, StringWriter
+from kola.lib.recorder import Instruction
+
+
+Stage = Callable[["Statement"], Optional["Statement"]]
+
+_NO_SPACE_BEFORE = frozenset((S_CLN, S_CMA, S_SLP, S_SRP))
+
+
+class Statement:
+    """
+    A statement read from the lexer.
+
+    Unless its instruction is replaced, the statement is written back from the raw
+    source, with `name` as the command name.
+    """
+    __slots__ = ["syn", "name", "source", "lineno", "_instruction"]
+
+    def __init__(self, syn: int, name: str, source: bytes, lineno: int = 0) -> None:
+        self.syn = syn
+        self.name = name
+        self.source = source
+        self.lineno = lineno
+        self._instruction: Optional[Instruction] = None
+
+    @classmethod
+    def from_instruction(cls, instruction: Instruction, lineno: int = 0) -> "Statement":
+        self = cls(0, instruction.name, b"", lineno)
+        self._instruction = instruction
+        return self
+
+    @property
+    def instruction(self) -> Instruction:
+        """
+        The statement as a recorder instruction, built on the first access.
+        """
+        if self._instruction is None:
+            self._instruction = self._build()
+        return self._instruction
+
+    @instruction.setter
+    def instruction(self, instruction: Instruction) -> None:
+        self.syn = 0
+        self.name = instruction.name
+        self.source = b""
+        self._instruction = instruction
+
+    @property
+    def raw(self) -> bool:
+        """whether the statement is written from the raw source"""
+        return self.syn != 0
+
+    def _tokens(self) -> List[Token]:
+        syn = self.syn
+        if syn == S_CMD:
+            # the name may have been renamed to anything
+            return list(StringLexer(b"#_" + self.source))
+        elif syn == S_CMD_N:
+            return list(StringLexer(b"#" + self.source))
+        # text is lexed with a threshold above its leading '#', annotations with the lowest one
+        threshold = 1
+        if syn != S_ANNOTATION and syn != S_ANNOTATION_PART:
+            threshold += len(self.source) - len(self.source.lstrip(b"#"))
+        return list(StringLexer(self.source, command_threshold=threshold))
+
+    def _build(self) -> Instruction:
+        tokens = self._tokens()
+        first = tokens[0]
+        if first.syn != S_CMD and first.syn != S_CMD_N:
+            return Instruction(self.name, ("".join(i.val for i in tokens),), {})
+        args: List[Any] = [] if first.syn == S_CMD else [first.val]
+        kwargs: Dict[str, Any] = {}
+        i, end = 1, len(tokens)
+        while i < end:
+            token = tokens[i]
+            if token.syn == S_LITERAL and i + 1 < end and tokens[i + 1].syn == S_SLP:
+                kwargs[token.val], i = self._build_complex(tokens, i + 2)
+            elif token.syn in _NO_SPACE_BEFORE:
+                self._syntax_error(token)
+            else:
+                args.append(token.val)
+                i += 1
+        return Instruction(self.name, tuple(args), kwargs)
+
+    def _build_complex(self, tokens: List[Token], i: int) -> Tuple[Any, int]:
+        # i is the index after '(', values are either all positional or all keyed
+        end = len(tokens)
+        items: List[Any] = []
+        keys: List[Any] = []
+        while True:
+            key = None
+            if i + 1 < end and tokens[i + 1].syn == S_CLN:
+                key = tokens[i]
+                if key.syn != S_LITERAL:
+                    self._syntax_error(key)
+                i += 2
+            if i >= end:
+                self._syntax_error(None)
+            token = tokens[i]
+            if token.syn in _NO_SPACE_BEFORE or (items and (key is None) != (not keys)):
+                self._syntax_error(token)
+            if key is not None:
+                keys.append(key.val)
+            items.append(token.val)
+            i += 1
+            if i >= end:
+                self._syntax_error(None)
+            if tokens[i].syn == S_SRP:
+                break
+            elif tokens[i].syn != S_CMA:
+                self._syntax_error(tokens[i])
+            i += 1
+        if keys:
+            return dict(zip(keys, items)), i + 1
+        return (items if len(items) > 1 else items[0]), i + 1
+
+    def _syntax_error(self, token: Optional[Token]) -> None:
+        # reported like the parser state machine, 16 for an unclosed statement
+        code, text = (16, b"") if token is None else (16 + token.syn, token.raw_val)
+        raise Diagnostic(code, "<pipeline>", self.lineno, 0, text).exception()
+
+    def __repr__(self) -> str:
+        return f"<kola statement {self.name!r} line {self.lineno}>"
+
+
+_NAMES = {S_CMD_N: "@number", S_ANNOTATION: "@annotation", S_ANNOTATION_PART: "@annotation"}
+
+
+def iter_statements(__lexer: BaseLexer) -> Generator[Statement, None, None]:
+    """
+    Group the tokens of a lexer into statements, without building argument values.
+    """
+    get = _NAMES.get
+    for syn, name, source, lineno in StatementReader(__lexer):
+        yield Statement(syn, name or get(syn, "@text"), source, lineno)
+
+
+def write_statements(statements: Iterable[Statement], writer: BaseWriter) -> None:
+    threshold = writer.command_threshold
+    prefix = "#" * threshold
+    raw_write = writer.raw_write
+    newline = writer.newline
+    for statement in statements:
+        syn = statement.syn
+        if syn == S_CMD:
+            raw_write(prefix + statement.name + statement.source.decode())
+        elif syn == S_CMD_N:
+            raw_write(prefix + statement.source.decode())
+        elif syn == S_ANNOTATION or syn == S_ANNOTATION_PART:
+            source = statement.source.decode()
+            if len(source) - len(source.lstrip("#")) <= threshold:
+                # the annotation prefix of a smaller threshold
+                source = "#" * (threshold + 1) + source
+            raw_write(source)
+        elif syn:
+            raw_write(statement.source.decode())
+        else:
+            writer.write_instructions((statement.instruction,))
+            continue
+        newline()
+
+
+# built-in stages
+
+def rename(mapping: Dict[str, str]) -> Stage:
+    """
+    Rename commands, keeping the raw arguments.
+    """
+    get = mapping.get
+
+    def stage(statement: Statement) -> Statement:
+        name = get(statement.name)
+        if name is not None:
+            if statement.syn == S_CMD:
+                statement.name = name
+            else:
+                statement.instruction = statement.instruction._replace(name=name)
+        return statement
+    return stage
+
+
+def drop(*names: str) -> Stage:
+    """
+    Drop statements by name, such as '@annotation'.
+    """
+    dropped = frozenset(names)
+
+    def stage(statement: Statement) -> Optional[Statement]:
+        return None if statement.name in dropped else statement
+    return stage
+
+
+def keep(*names: str) -> Stage:
+    """
+    Keep only the statements with these names.
+    """
+    kept = frozenset(names)
+
+    def stage(statement: Statement) -> Optional[Statement]:
+        return statement if statement.name in kept else None
+    return stage
+
+
+def map_instructions(func: Callable[[Instruction], Optional[Instruction]], *names: str) -> Stage:
+    """
+    Transform the argument values of statements, all of them unless names are given.
+
+    Returning None drops the statement.
+    """
+    selected = frozenset(names)
+
+    def stage(statement: Statement) -> Optional[Statement]:
+        if selected and statement.name not in selected:
+            return statement
+        instruction = func(statement.instruction)
+        if instruction is None:
+            return None
+        if instruction is not statement.instruction:
+            statement.instruction = instruction
+        return statement
+    return stage
+
+
+class Pipeline:
+    """
+    Chain of stages from a lexer to a writer.
+    """
+    __slots__ = ["stages"]
+
+    def __init__(self, *stages: Stage) -> None:
+        self.stages = list(stages)
+
+    def add(self, stage: Stage) -> Stage:
+        self.stages.append(stage)
+        return stage
+
+    def process(self, statements: Iterable[Statement]) -> Generator[Statement, None, None]:
+        stages = self.stages
+        for statement in statements:
+            for stage in stages:
+                statement = stage(statement)
+                if statement is None:
+                    break
+            else:
+                yield statement
+
+    def run(self, __lexer_or_str: Union[str, BaseLexer], writer: BaseWriter, **kwds: Any) -> None:
+        if isinstance(__lexer_or_str, str):
+            lexer = StringLexer(__lexer_or_str, **kwds)
+        else:
+            assert not kwds
+            lexer = __lexer_or_str
+        write_statements(self.process(iter_statements(lexer)), writer)
+
+    def run_file(
+        self,
+        path: Union[str, bytes, os.PathLike],
+        output: Union[BaseWriter, str, bytes, os.PathLike],
+        *,
+        encoding: Optional[str] = None,
+        **kwds: Any
+    ) -> None:
+        with FileLexer(path, encoding=encoding or "utf-8", **kwds) as lexer:
+            if isinstance(output, BaseWriter):
+                self.run(lexer, output)
+            else:
+                with FileWriter(output, encoding=encoding or "utf-8") as writer:
+                    self.run(lexer, writer)
+
+    def transform(self, __str: str, *, command_threshold: int = 1, **kwds: Any) -> str:
+        """
+        Transform a kola string with the same command threshold for input and output.
+        """
+        writer = StringWriter(command_threshold=command_threshold)
+        self.run(StringLexer(__str, command_threshold=command_threshold, **kwds), writer)
+        return writer.getvalue()
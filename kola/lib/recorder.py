@@ -1,9 +1,18 @@
+import math
 import os
-from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union, overload
+import sys
+from array import array
+from itertools import islice
+from types import GeneratorType
+from typing import (
+    Any, Callable, Dict, Generator, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union, overload
+)
 
-from kola.lexer import BaseLexer, FileLexer, StringLexer
-from kola.parser import Parser
-from kola.klvm import CommandSet
+from kola.exception import KoiLangError
+from kola.lexer import BaseLexer, Diagnostic, FileLexer, StringLexer
+from kola.parser import CommandBatch, Parser, TextParts
+from kola.writer import BaseWriter, FileWriter, StringWriter
+from kola.klvm import CommandSet, KoiLang
 
 
 class Instruction(NamedTuple):
@@ -12,11 +21,20 @@ class Instruction(NamedTuple):
     kwargs: Dict[Any, Any]
 
 
+def _instruction(__name: str, args: Tuple[Any, ...], kwds: Dict[str, Any]) -> Instruction:
+    if args and isinstance(args[0], TextParts):
+        # the parts can only be read during the call
+        args = ("".join(args[0]),)
+    return Instruction(__name, args, kwds)
+
+
 class _Recorder(CommandSet):
     __slots__ = []
 
-    def __getitem__(self, __key: str) -> Callable[..., Instruction]:
-        return lambda *args, **kwds: Instruction(__key, args, kwds)
+    def __kola_lookup__(self, __key: str) -> Callable[..., Instruction]:
+        return lambda *args, **kwds: _instruction(__key, args, kwds)
+
+    __getitem__ = __kola_lookup__
 
 
 recorder = _Recorder()
@@ -37,3 +55,336 @@ def parse(__lexer_or_str: Union[str, BaseLexer], **kwds: Any) -> List[Instructio
 def parse_file(path: Union[str, bytes, os.PathLike], *, encoding: Optional[str] = None, **kwds: Any) -> List[Instruction]:
     lexer = FileLexer(path, encoding=encoding or "utf-8", **kwds)
     return parse(lexer)
+
+
+def _lexer(__lexer_or_str: Union[str, BaseLexer], kwds: Dict[str, Any]) -> Tuple[BaseLexer, bool]:
+    if isinstance(__lexer_or_str, str):
+        return StringLexer(__lexer_or_str, **kwds), True
+    assert not kwds
+    return __lexer_or_str, False
+
+
+def iter_parse(__lexer_or_str: Union[str, BaseLexer], **kwds: Any) -> Generator[Instruction, None, None]:
+    """
+    Yield the instructions one by one instead of building the whole list.
+
+    Lexers created here are closed when the generator finishes or is closed.
+    """
+    lexer, owned = _lexer(__lexer_or_str, kwds)
+    try:
+        yield from Parser(lexer, recorder)
+    finally:
+        if owned:
+            lexer.close()
+
+
+def iter_parse_file(
+    path: Union[str, bytes, os.PathLike],
+    *,
+    encoding: Optional[str] = None,
+    **kwds: Any
+) -> Generator[Instruction, None, None]:
+    lexer = FileLexer(path, encoding=encoding or "utf-8", **kwds)
+    try:
+        yield from Parser(lexer, recorder)
+    finally:
+        lexer.close()
+
+
+def _iter_batches(it: Iterator[Instruction], size: int) -> Generator[List[Instruction], None, None]:
+    try:
+        while True:
+            batch = list(islice(it, size))
+            if not batch:
+                break
+            yield batch
+    finally:
+        if isinstance(it, GeneratorType):
+            it.close()
+
+
+def iter_batches(
+    __source: Union[str, BaseLexer, Iterable[Instruction]],
+    size: int,
+    **kwds: Any
+) -> Generator[List[Instruction], None, None]:
+    """
+    Yield the instructions in lists of `size`, the last one may be shorter.
+
+    The source can also be another instruction stream, such as `iter_parse_file()`,
+    which is closed with the batches.
+    """
+    if size <= 0:
+        raise ValueError("batch size must be positive")
+    if isinstance(__source, (str, BaseLexer)):
+        return _iter_batches(iter_parse(__source, **kwds), size)
+    assert not kwds
+    return _iter_batches(iter(__source), size)
+
+
+class InstructionTable:
+    """
+    Compact columnar storage of instructions.
+
+    Command names are interned as integer codes, and the arguments of all
+    rows are references into a shared pool of values, in which equal
+    hashable values are stored once.
+    """
+    __slots__ = ["names", "codes", "lines", "offsets", "nargs", "pool", "refs", "_name_codes", "_pool_index", "_rows"]
+
+    def __init__(self, instructions: Iterable[Instruction] = (), lines: Optional[Iterable[int]] = None) -> None:
+        self.names: List[str] = []
+        self.codes = array('i')
+        self.lines = array('i')
+        self.offsets = array('q', [0])
+        self.nargs = array('i')
+        self.pool: List[Any] = []
+        self.refs = array('i')
+        self._name_codes: Dict[str, int] = {}
+        self._pool_index: Dict[Hashable, int] = {}
+        self._rows: List[array] = []
+        if lines is None:
+            self.extend(instructions)
+        else:
+            for instruction, lineno in zip(instructions, lines):
+                self.append(instruction, lineno)
+
+    @classmethod
+    def parse(cls, __lexer_or_str: Union[str, BaseLexer], **kwds: Any) -> "InstructionTable":
+        """
+        Record a kola document, with the line of each statement.
+        """
+        lexer, owned = _lexer(__lexer_or_str, kwds)
+        table = cls()
+        try:
+            parser = Parser(lexer, recorder)
+            for instruction in parser:
+                table.append(instruction, parser.lineno)
+        finally:
+            if owned:
+                lexer.close()
+        return table
+
+    @classmethod
+    def parse_file(
+        cls,
+        path: Union[str, bytes, os.PathLike],
+        *,
+        encoding: Optional[str] = None,
+        **kwds: Any
+    ) -> "InstructionTable":
+        lexer = FileLexer(path, encoding=encoding or "utf-8", **kwds)
+        try:
+            return cls.parse(lexer)
+        finally:
+            lexer.close()
+
+    def _intern(self, value: Any) -> int:
+        try:
+            # types are part of the key, so that 1, 1.0 and True stay different
+            key = (type(value), value)
+            if key[0] is float and not value:
+                # 0.0 == -0.0, but the sign has to survive the round trip
+                key = (float, value, math.copysign(1.0, value))
+            index = self._pool_index.get(key)
+        except TypeError:
+            key = index = None
+        if index is None:
+            index = len(self.pool)
+            self.pool.append(value)
+            if key is not None:
+                self._pool_index[key] = index
+        return index
+
+    def append(self, instruction: Instruction, lineno: int = 0) -> None:
+        name, args, kwargs = instruction
+        code = self._name_codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self.names.append(sys.intern(name))
+            self._name_codes[name] = code
+            self._rows.append(array('i'))
+        self._rows[code].append(len(self.codes))
+        self.codes.append(code)
+        self.lines.append(lineno)
+        self.nargs.append(len(args))
+        intern = self._intern
+        refs = self.refs
+        for i in args:
+            refs.append(intern(i))
+        for key, value in kwargs.items():
+            refs.append(intern(key))
+            refs.append(intern(value))
+        self.offsets.append(len(refs))
+
+    def extend(self, instructions: Iterable[Instruction]) -> None:
+        for i in instructions:
+            self.append(i)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, __index: int) -> Instruction:
+        if __index < 0:
+            __index += len(self.codes)
+        pool = self.pool
+        refs = self.refs
+        start = self.offsets[__index]
+        mid = start + self.nargs[__index]
+        return Instruction(
+            self.names[self.codes[__index]],
+            tuple([pool[refs[i]] for i in range(start, mid)]),
+            {pool[refs[i]]: pool[refs[i + 1]] for i in range(mid, self.offsets[__index + 1], 2)}
+        )
+
+    def __iter__(self) -> Iterator[Instruction]:
+        for i in range(len(self.codes)):
+            yield self[i]
+
+    def to_list(self) -> List[Instruction]:
+        return list(self)
+
+    def rows(self, name: str) -> array:
+        """
+        Indexes of the rows of a command, in order.
+        """
+        code = self._name_codes.get(name)
+        if code is None:
+            return array('i')
+        return self._rows[code]
+
+    def select(self, name: str) -> List[Instruction]:
+        return [self[i] for i in self.rows(name)]
+
+    def to_numpy(self) -> Any:
+        """
+        Export the columns as a NumPy structured array.
+
+        The `code` field indexes `names`, and the arguments of row i are
+        `refs[offset:offset + size]` referring to `pool`, `nargs` positional
+        values followed by keyword and value pairs.
+        """
+        import numpy as np
+
+        rows = len(self.codes)
+        table = np.empty(rows, dtype=[
+            ("code", np.int32), ("lineno", np.int32), ("offset", np.int64), ("size", np.int32), ("nargs", np.int32)
+        ])
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+        table["code"] = np.frombuffer(self.codes, dtype=np.int32)
+        table["lineno"] = np.frombuffer(self.lines, dtype=np.int32)
+        table["offset"] = offsets[:-1]
+        table["size"] = np.diff(offsets)
+        table["nargs"] = np.frombuffer(self.nargs, dtype=np.int32)
+        return table
+
+
+def _replay_rows(table: InstructionTable) -> Generator[Tuple[str, Tuple[Any, ...], Dict[Any, Any], int], None, None]:
+    names = table.names
+    get = table.pool.__getitem__
+    # lists are indexed and sliced faster than arrays
+    refs = table.refs.tolist()
+    offsets = table.offsets.tolist()
+    begin = 0
+    for code, lineno, nargs, end in zip(table.codes, table.lines, table.nargs, offsets[1:]):
+        mid = begin + nargs
+        yield (
+            names[code],
+            tuple(map(get, refs[begin:mid])),
+            dict(zip(map(get, refs[mid:end:2]), map(get, refs[mid + 1:end:2]))) if end > mid else {},
+            lineno
+        )
+        begin = end
+
+
+def _error_text(name: str, args: Tuple[Any, ...]) -> bytes:
+    # the parser reports the text itself for text statements
+    if name in ("@text", "@annotation") and args and isinstance(args[0], str):
+        return args[0].encode()
+    return name.encode()
+
+
+def _replay_once(vm: KoiLang, rows: Iterator[Tuple[str, Tuple[Any, ...], Dict[Any, Any], int]]) -> None:
+    lookup = vm.__kola_lookup__
+    # with the default lookup, commands only change with the current environment
+    cached = type(vm).__kola_lookup__ is KoiLang.__kola_lookup__
+    cache: Dict[str, Optional[Callable]] = {}
+    top = vm.top
+    last_name = None
+    cmd = None
+    for name, args, kwargs, lineno in rows:
+        if name != last_name:
+            # resolved once for a run of the same command
+            if not cached:
+                cmd = lookup(name)
+            elif name in cache:
+                cmd = cache[name]
+            else:
+                cmd = cache[name] = lookup(name)
+            last_name = name if cached else None
+        if cmd is None:
+            if name == "@annotation":
+                continue
+            raise Diagnostic(2, "<replay>", lineno, 0, _error_text(name, args)).exception()
+        try:
+            if getattr(cmd, "batch", False):
+                cmd(CommandBatch([(args, kwargs)], [lineno]))
+            else:
+                cmd(*args, **kwargs)
+        except KoiLangError:
+            raise
+        except Exception as e:
+            raise Diagnostic(
+                4 if name == "@text" else 3, "<replay>", lineno, 0, _error_text(name, args), e
+            ).exception()
+        if cached and vm.top is not top:
+            # an environment was entered or left
+            top = vm.top
+            cache.clear()
+            last_name = None
+
+
+def replay(instructions: Union[InstructionTable, Iterable[Instruction]], vm: KoiLang) -> None:
+    """
+    Execute recorded instructions with a virtual machine, without parsing the document again.
+
+    Commands go through the normal dispatch, and errors are reported to `on_exception`
+    with the line of the instruction when recorded in an `InstructionTable`.
+    """
+    if isinstance(instructions, InstructionTable):
+        rows = _replay_rows(instructions)
+    else:
+        rows = ((name, args, kwargs, 0) for name, args, kwargs in instructions)
+    with vm.exec_block():
+        while True:
+            try:
+                _replay_once(vm, rows)
+            except KoiLangError:
+                if not vm.on_exception(*sys.exc_info()):
+                    raise
+            else:
+                break
+
+
+def dump(
+    instructions: Union[InstructionTable, Iterable[Instruction]],
+    writer_or_path: Union[BaseWriter, str, bytes, os.PathLike],
+    **kwds: Any
+) -> None:
+    """
+    Write instructions back as kola text.
+
+    Writers given are left open, files are created with `FileWriter(path, **kwds)`.
+    """
+    if isinstance(writer_or_path, BaseWriter):
+        assert not kwds
+        writer_or_path.write_instructions(instructions)
+        return
+    with FileWriter(writer_or_path, **kwds) as writer:
+        writer.write_instructions(instructions)
+
+
+def dumps(instructions: Union[InstructionTable, Iterable[Instruction]], **kwds: Any) -> str:
+    writer = StringWriter(**kwds)
+    writer.write_instructions(instructions)
+    return writer.getvalue()
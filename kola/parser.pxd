@@ -1,24 +1,76 @@
+from cpython cimport PyObject
 from ._cutil cimport *
-from .lexer cimport Token, BaseLexer
+from .lexer cimport Token, BaseLexer, new_diagnostic
 
 
 cdef extern from *:
     str PyUnicode_FromFormat(const char*, ...)
 
 
+cdef struct StackEntry:
+    int syn
+    int lineno
+    PyObject* val
+
+
+cdef struct ArgArena:
+    PyObject** items        # reserved slot, positional arguments, then keyword values when calling
+    PyObject** values       # keyword values
+    PyObject** names        # keyword names
+    Py_ssize_t nargs
+    Py_ssize_t nkw
+    Py_ssize_t capacity
+    # grammar stack
+    StackEntry* stack
+    Py_ssize_t depth
+    Py_ssize_t stack_capacity
+
+
+cdef class TextParts:
+    cdef:
+        Parser parser
+        Token token
+    cdef readonly bint closed
+    
+    cpdef void close(self) except *
+
+
+cdef class CommandBatch(list):
+    cdef readonly list lines
+    cdef public Py_ssize_t index
+
+
 cdef class Parser:
     cdef:
         Token t_cache
         Token stack_top
         uint8_t stat
+        object lookup
+        ArgArena arena
+        tuple kwnames
+        object pending_error
+        frozenset lexer_ignore
     cdef readonly:
         BaseLexer lexer
         object command_set
+        frozenset ignore
+        list diagnostics
+        int lineno
 
     cpdef void push(self, Token n)
     cpdef Token pop(self)
+    cdef void push_filter(self) except *
+    cdef void pop_filter(self) except *
     cdef void recovery(self)
-    cdef void set_error(self, int errorno = *, bint recovery = *) except *
+    cdef void set_error(self, int errorno = *, bint recovery = *, bint collect = *) except *
+    cdef void command_error(self, int errorno, Token token, object cause) except *
+    cdef bint collect_args(self, dict arrays = *) except -1
     cpdef tuple parse_args(self)
+    cdef object call_command(self, object cmd, object first)
+    cdef object get_command(self, str name)
+    cdef tuple take_args(self, object first)
+    cdef object exec_batch(self, object cmd, Token token, object first, dict arrays)
+    cdef object call_batch(self, object cmd, CommandBatch batch, Token token)
+    cdef object exec_parts(self, Token token)
     cpdef object exec_once(self)
     cpdef void exec(self) except *
\ No newline at end of file
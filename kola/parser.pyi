@@ -1,6 +1,7 @@
-from typing import Any, Callable, Final, Generic, Tuple, TypeVar
+import os
+from typing import Any, Callable, Dict, Final, FrozenSet, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 from typing_extensions import Protocol, Self
-from .lexer import BaseLexer, Token
+from .lexer import BaseLexer, Diagnostic, Token
 
 
 class SupportGetCommand(Protocol):
@@ -11,16 +12,50 @@ T_CmdSet = TypeVar("T_CmdSet", bound=SupportGetCommand)
 T_Lexer = TypeVar("T_Lexer", bound=BaseLexer)
 
 
+class TextParts(Iterator[str]):
+    """
+    Iterator over the parts of a long text split by the lexer
+    """
+
+    closed: Final[bool]
+
+    def __init__(self, parser: Parser, token: Token) -> None: ...
+    def close(self) -> None: ...
+    def __next__(self) -> str: ...
+
+
+class CommandBatch(List[Tuple[tuple, Dict[str, Any]]]):
+    """
+    Arguments of consecutive statements calling a batch command, as `(args, kwargs)` tuples
+    """
+    lines: Final[List[int]]
+    index: int
+
+    def __init__(self, items: Iterable[Tuple[tuple, Dict[str, Any]]] = (), lines: Optional[Iterable[int]] = None) -> None: ...
+    @property
+    def lineno(self) -> int: ...
+
+
 class Parser(Generic[T_Lexer, T_CmdSet]):
     lexer: Final[T_Lexer]
     command_set: Final[T_CmdSet]
+    ignore: Final[FrozenSet[str]]
+    diagnostics: Final[Optional[List[Diagnostic]]]
+    lineno: Final[int]
 
-    def __init__(self, lexer: T_Lexer, command_set: T_CmdSet) -> None: ...
+    def __init__(self, lexer: T_Lexer, command_set: T_CmdSet, *, ignore: Optional[Iterable[str]] = None,
+                 diagnostics: Optional[List[Diagnostic]] = None, pipeline: int = 0) -> None: ...
+    def reset(self) -> None: ...
+    def rebind(self, lexer: T_Lexer) -> None: ...
     def push(self, token: Token) -> None: ...
     def pop(self) -> Token: ...
-    def parse_args(self) -> Tuple[tuple, dict]: ...
+    def parse_args(self) -> Optional[Tuple[tuple, dict]]: ...
     def exec_once(self) -> Any: ...
+    def check(self) -> List[Diagnostic]: ...
     def exec(self) -> None: ...
     def eof(self) -> bool: ...
     def __iter__(self) -> Self: ...
-    def __next__(self) -> Any: ...
\ No newline at end of file
+    def __next__(self) -> Any: ...
+
+
+def validate(path: Union[str, bytes, os.PathLike], **kwds: Any) -> List[Diagnostic]: ...
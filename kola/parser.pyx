@@ -1,9 +1,17 @@
-from cpython cimport PyErr_Format
+cimport cython
+from cpython cimport PyErr_Format, Py_INCREF, Py_DECREF, Py_XDECREF
+from libc.stdio cimport EOF
+from libc.string cimport memcpy
+from cpython cimport array
+from cpython.conversion cimport PyOS_string_to_double
+from cpython.mem cimport PyMem_Realloc, PyMem_Free, PyMem_RawRealloc, PyMem_RawFree
 
+import array
 from typing import TypeVar
 from typing_extensions import Protocol
 
 from .exception import KoiLangError, KoiLangSyntaxError, KoiLangCommandError
+from .lexer import FileLexer
 
 
 class SupportGetCommand(Protocol):
@@ -13,13 +21,348 @@ class SupportGetCommand(Protocol):
 T_CmdSet = TypeVar("T_CmdSet", bound=SupportGetCommand)
 T_Lexer = TypeVar("T_Lexer", bound=BaseLexer)
 
+# longest run of statements passed to a batch command in one call
+cdef Py_ssize_t MAX_BATCH_SIZE = 4096
+
+
+cdef struct SynEntry:
+    int syn
+    int lineno
+
+
+cdef struct SynStack:
+    SynEntry* entries
+    Py_ssize_t size
+    Py_ssize_t capacity
+
+
+cdef inline int syn_flag(int syn) noexcept nogil:
+    # same as Token.get_flag, but also accepting EOF
+    if syn <= TEXT or syn >= ANNOTATION:
+        return 0
+    elif syn == LITERAL:
+        return 1
+    elif syn <= NUM_F:
+        return 2
+    else:
+        return syn - CLN + 3
+
+
+cdef inline bint plain_string(const char* text, Py_ssize_t text_len) noexcept nogil:
+    # an ASCII string without escapes always decodes
+    cdef Py_ssize_t i
+    for i in range(text_len):
+        if text[i] == b'\\' or <unsigned char>text[i] >= 0x80:
+            return False
+    return True
+
+
+cdef bint syn_push(SynStack* stack, int syn, int lineno) noexcept nogil:
+    cdef SynEntry* entries
+    if stack.size == stack.capacity:
+        entries = <SynEntry*>PyMem_RawRealloc(stack.entries, (stack.capacity * 2 + 8) * sizeof(SynEntry))
+        if entries == NULL:
+            return False
+        stack.entries = entries
+        stack.capacity = stack.capacity * 2 + 8
+    stack.entries[stack.size].syn = syn
+    stack.entries[stack.size].lineno = lineno
+    stack.size += 1
+    return True
+
+
+cdef int arena_reserve(ArgArena* arena, Py_ssize_t size) except -1:
+    cdef:
+        Py_ssize_t capacity
+        PyObject** items
+    if size <= arena.capacity:
+        return 0
+    capacity = max(size, arena.capacity * 2, 16)
+    # the capacity is only raised once all three arrays are resized
+    items = <PyObject**>PyMem_Realloc(arena.items, capacity * sizeof(PyObject*))
+    if items == NULL:
+        raise MemoryError
+    arena.items = items
+    items = <PyObject**>PyMem_Realloc(arena.values, capacity * sizeof(PyObject*))
+    if items == NULL:
+        raise MemoryError
+    arena.values = items
+    items = <PyObject**>PyMem_Realloc(arena.names, capacity * sizeof(PyObject*))
+    if items == NULL:
+        raise MemoryError
+    arena.names = items
+    if arena.capacity == 0:
+        arena.items[0] = NULL
+    arena.capacity = capacity
+    return 0
+
+
+cdef int arena_append(ArgArena* arena, object value) except -1:
+    arena_reserve(arena, arena.nargs + arena.nkw + 2)
+    arena.nargs += 1
+    Py_INCREF(value)
+    arena.items[arena.nargs] = <PyObject*>value
+    return 0
+
+
+cdef int arena_keyword(ArgArena* arena, str name, object value) except -1:
+    cdef Py_ssize_t i
+    for i in range(arena.nkw):
+        if <str>arena.names[i] == name:
+            # the last value wins like in a dict
+            Py_INCREF(value)
+            Py_DECREF(<object>arena.values[i])
+            arena.values[i] = <PyObject*>value
+            return 0
+    arena_reserve(arena, arena.nargs + arena.nkw + 2)
+    Py_INCREF(name)
+    Py_INCREF(value)
+    arena.names[arena.nkw] = <PyObject*>name
+    arena.values[arena.nkw] = <PyObject*>value
+    arena.nkw += 1
+    return 0
+
+
+cdef int stack_push(ArgArena* arena, int syn, int lineno, object val) except -1:
+    cdef:
+        Py_ssize_t capacity
+        StackEntry* stack
+    if arena.depth == arena.stack_capacity:
+        capacity = max(arena.stack_capacity * 2, 8)
+        stack = <StackEntry*>PyMem_Realloc(arena.stack, capacity * sizeof(StackEntry))
+        if stack == NULL:
+            raise MemoryError
+        arena.stack = stack
+        arena.stack_capacity = capacity
+    Py_INCREF(val)
+    arena.stack[arena.depth].syn = syn
+    arena.stack[arena.depth].lineno = lineno
+    arena.stack[arena.depth].val = <PyObject*>val
+    arena.depth += 1
+    return 0
+
+
+cdef object stack_pop(ArgArena* arena, StackEntry* entry):
+    # the caller makes sure that the stack is not empty
+    arena.depth -= 1
+    entry[0] = arena.stack[arena.depth]
+    val = <object>entry.val
+    Py_DECREF(val)
+    return val
+
+
+cdef void arena_clear(ArgArena* arena) noexcept:
+    while arena.depth:
+        arena.depth -= 1
+        Py_XDECREF(arena.stack[arena.depth].val)
+    while arena.nargs:
+        Py_XDECREF(arena.items[arena.nargs])
+        arena.nargs -= 1
+    while arena.nkw:
+        arena.nkw -= 1
+        Py_XDECREF(arena.names[arena.nkw])
+        Py_XDECREF(arena.values[arena.nkw])
+
+
+cdef void arena_free(ArgArena* arena) noexcept:
+    arena_clear(arena)
+    PyMem_Free(arena.items)
+    PyMem_Free(arena.values)
+    PyMem_Free(arena.names)
+    PyMem_Free(arena.stack)
+    arena.items = arena.values = arena.names = NULL
+    arena.stack = NULL
+    arena.capacity = arena.stack_capacity = 0
+
+
+cdef array.array _double_array = array.array('d')
+cdef array.array _int64_array = array.array('q')
+
+
+cdef array.array typed_array(str typecode, object first):
+    cdef array.array buf = array.clone(_double_array if typecode == 'd' else _int64_array, 0, False)
+    buf.append(first)
+    return buf
+
+
+cdef int typed_append(array.array buf, int syn, const char* text, Py_ssize_t text_len) except -1:
+    """
+    Append a number token to a typed array without building a Python object.
+    """
+    cdef:
+        int base = 16 if syn == NUM_H else (2 if syn == NUM_B else 10)
+        long long q
+        double d
+    if syn == NUM_F:
+        if buf.ob_descr.typecode != c'd':
+            raise TypeError(f"integer expected, got float {text.decode()}")
+        d = PyOS_string_to_double(text, NULL, NULL)
+        return array.extend_buffer(buf, <char*>&d, 1)
+    if parse_int64(text, text_len, base, &q) < 0:
+        # too long for a machine word
+        v = parse_integer(text, text_len, base)
+        if buf.ob_descr.typecode == c'd':
+            d = v
+        else:
+            q = v
+    else:
+        d = <double>q
+    if buf.ob_descr.typecode == c'd':
+        return array.extend_buffer(buf, <char*>&d, 1)
+    return array.extend_buffer(buf, <char*>&q, 1)
+
+
+cdef class TextParts:
+    """
+    Iterator over the parts of a long text split by the lexer
+    """
+
+    def __cinit__(self, Parser parser not None, Token token not None):
+        self.parser = parser
+        self.token = token
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        cdef Token token = self.token
+        if token is None:
+            if self.closed:
+                # the lexer has moved on to the next statement
+                raise OSError("operation on closed text parts")
+            raise StopIteration
+        if token.syn == TEXT_PART or token.syn == ANNOTATION_PART:
+            self.token = self.parser.lexer.next_token()
+        else:
+            self.token = None
+            if not token.val:
+                # empty tail after a part ending at the size limit
+                raise StopIteration
+        return token.val
+    
+    cpdef void close(self) except *:
+        """
+        Skip the remaining parts and read the next statement.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        while not self.token is None:
+            if self.token.syn != TEXT_PART and self.token.syn != ANNOTATION_PART:
+                break
+            self.token = self.parser.lexer.next_token()
+        self.token = None
+        try:
+            self.parser.t_cache = self.parser.lexer.next_token()
+        except KoiLangSyntaxError:
+            self.parser.recovery()
+            raise
+
+
+cdef class CommandBatch(list):
+    """
+    Arguments of consecutive statements calling a batch command, as `(args, kwargs)` tuples
+
+    Errors raised by the command are reported at the line of the item at `index`,
+    which follows the iteration over the batch.
+    """
+
+    def __init__(self, items = (), lines = None):
+        list.__init__(self, items)
+        self.lines = [0] * len(self) if lines is None else list(lines)
+        self.index = 0
+    
+    def __iter__(self):
+        return _BatchIterator(self)
+    
+    @property
+    def lineno(self):
+        """line of the current item"""
+        if 0 <= self.index < len(self.lines):
+            return self.lines[self.index]
+        return self.lines[0] if self.lines else 0
+
+
+@cython.final
+@cython.no_gc_clear
+cdef class _BatchIterator:
+    cdef:
+        CommandBatch batch
+        Py_ssize_t next_index
+
+    def __cinit__(self, CommandBatch batch not None):
+        self.batch = batch
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        cdef Py_ssize_t i = self.next_index
+        if i >= len(self.batch):
+            raise StopIteration
+        self.batch.index = i
+        self.next_index = i + 1
+        return (<list>self.batch)[i]
+
 
 cdef class Parser:
-    def __init__(self, BaseLexer lexer not None, command_set not None):
+    def __init__(
+        self, BaseLexer lexer not None, command_set not None, *,
+        ignore = None, list diagnostics = None, int pipeline = 0
+    ):
         self.lexer = lexer
+        self.diagnostics = diagnostics
+        lexer.diagnostics = diagnostics
         self.command_set = command_set
+        if type(command_set) is dict:
+            self.lookup = (<dict>command_set).get
+        elif getattr(command_set, "__kola_getitem__", False):
+            # `__getitem__` is customized without a matching `__kola_lookup__`
+            self.lookup = None
+        else:
+            self.lookup = getattr(command_set, "__kola_lookup__", None)
+        self.ignore = frozenset() if ignore is None else frozenset(ignore)
+        self.push_filter()
+        if pipeline and lexer.pipe == NULL:
+            # scan the tokens in another thread while the commands run
+            lexer.start_pipeline(pipeline)
+        self.recovery()
+    
+    def __dealloc__(self):
+        self.pop_filter()
+        arena_free(&self.arena)
+    
+    cdef void push_filter(self) except *:
+        # let the lexer skip the statements never executed
+        if not self.ignore <= self.lexer.ignore:
+            self.lexer_ignore = self.lexer.ignore
+            self.lexer.set_ignore(self.lexer.ignore | self.ignore)
+    
+    cdef void pop_filter(self) except *:
+        # give the lexer back the ignored statements it had before
+        cdef frozenset ignore = self.lexer_ignore
+        self.lexer_ignore = None
+        if ignore is not None and self.lexer is not None and self.lexer.pipe == NULL:
+            self.lexer.set_ignore(ignore)
+    
+    def reset(self):
+        """
+        Drop the parsing state and start again from the current lexer position.
+        """
+        self.stat = 0
+        self.pending_error = None
         self.recovery()
     
+    def rebind(self, BaseLexer lexer not None):
+        """
+        Parse from another lexer with the same command set.
+        """
+        self.pop_filter()
+        self.lexer = lexer
+        lexer.diagnostics = self.diagnostics
+        self.push_filter()
+        self.reset()
+    
     cpdef void push(self, Token n):
         n.next = self.stack_top
         self.stack_top = n
@@ -27,7 +370,7 @@ cdef class Parser:
     cpdef Token pop(self):
         cdef Token n = self.stack_top
         if n is None:
-            self.set_error(210)
+            self.set_error(210, True, False)
         self.stack_top = n.next
         return n
     
@@ -37,13 +380,13 @@ cdef class Parser:
                 self.t_cache = self.lexer.next_token()
             except KoiLangSyntaxError:
                 continue
-            if self.t_cache is None or self.t_cache.get_flag() == 0:
+            if self.t_cache is None or (self.t_cache.get_flag() == 0 and self.t_cache.syn != 0):
                 break
         self.stack_top = None
     
-    cdef void set_error(self, int errorno = 16, bint recovery = True) except *:
+    cdef void set_error(self, int errorno = 16, bint recovery = True, bint collect = True) except *:
         cdef:
-            int lineno = 1
+            int lineno = self.lexer.token_lineno()
             const char* text = ""
             Token cur = self.t_cache
         if not cur is None:
@@ -51,141 +394,496 @@ cdef class Parser:
             if errorno == 16:
                 errorno = (self.stat << 4) + cur.syn
             text = <const char*>cur.raw_val
+        if collect and self.diagnostics is not None:
+            self.diagnostics.append(new_diagnostic(
+                errorno, self.lexer.lexer_data.filename, lineno,
+                self.lexer.token_column(), text, None))
+            if recovery:
+                self.recovery()
+            return
         if recovery:
             self.recovery()
         kola_set_error(KoiLangSyntaxError, errorno,
             self.lexer.lexer_data.filename, lineno, text)
     
-    cpdef tuple parse_args(self):
+    cdef bint collect_args(self, dict arrays = None) except -1:
+        """
+        Parse the arguments of the current statement into the argument arena.
+
+        Only the values of the tokens are built, the next statement is read as a
+        token into `t_cache`. Return False if the statement is dropped in diagnostics mode.
+        Keyword lists named in `arrays` are read into typed arrays.
+        """
         cdef:
             uint8_t stat = 1, action = 0
-            
-            list args = []
-            dict kwds = {}
-            object v
-            Token i
+            ArgArena* arena = &self.arena
+            BaseLexer lexer = self.lexer
+            Token token = self.t_cache
+            StackEntry entry
+            int syn, flag
+            const char* text
+            Py_ssize_t text_len
+            object val, v
+            array.array buf = None
+            object error = None
+        
+        arena_clear(arena)
+        arena_reserve(arena, 2)
+        if not lexer.yy.lex_check(lexer.scanner):
+            raise OSError("operation on closed lexer")
 
         while True:
             self.stat = stat
-            try:
-                i = self.lexer.next_token()
-            except KoiLangSyntaxError:
-                # recovery from syntax error
-                self.recovery()
-                raise
-            if i is None:
-                stat = yy_goto[0][stat-1]
-            else:
-                stat = yy_goto[i.get_flag()][stat - 1]
+            syn, text, text_len = lexer.next_syn()
+            if lexer.input_error is not None:
+                e, lexer.input_error = lexer.input_error, None
+                raise e
+            flag = syn_flag(syn)
+            if buf is not None and stat == 4 and flag == 2 and syn != STRING:
+                # item of a typed array, converted without a Python object
+                if error is None:
+                    try:
+                        typed_append(buf, syn, text, text_len)
+                    except Exception as e:
+                        error = e
+                stat = 5
+                continue
+            val = None
+            if flag or syn == 0:
+                try:
+                    val = lexer.syn_value(&syn, text, text_len)
+                except KoiLangSyntaxError:
+                    # recovery from syntax error
+                    self.recovery()
+                    raise
+                if syn == 0:
+                    # error token already collected by the lexer
+                    self.recovery()
+                    arena_clear(arena)
+                    return False
+            stat = yy_goto[flag][stat - 1]
             action = stat >> 4
             stat &= 0x0F
 
+            if action >= 3 and action != 7 and action != 8 and (
+                arena.depth == 0 or (action == 4 and arena.depth == 1)
+            ):
+                self.t_cache = lexer.make_token(syn, text, text_len)
+                self.set_error(210)
+                arena_clear(arena)
+                return False
             if action == 1:
-                args.append(i.val)
+                arena_append(arena, val)
             elif action == 2:
-                self.push(i)
+                stack_push(arena, syn, lexer.token_lineno(), val)
             elif action == 3:
-                args.append(self.pop().val)
-            elif action == 4:
-                v = self.pop().val
-                i = self.pop()
-                if not i.syn == LITERAL:
-                    self.t_cache = i
-                    self.set_error(201)
-                kwds[i.val] = v
-            elif action == 5:
-                i = self.pop()
-                if not i.syn == LITERAL:
-                    self.t_cache = i
-                    self.set_error(202)
-                kwds[i.val] = v
+                arena_append(arena, stack_pop(arena, &entry))
+            elif action == 4 or action == 5:
+                if action == 4:
+                    v = stack_pop(arena, &entry)
+                name = stack_pop(arena, &entry)
+                if entry.syn != LITERAL:
+                    self.t_cache = Token(entry.syn, name, lineno=entry.lineno, raw_val=b"")
+                    self.set_error(201 if action == 4 else 202)
+                    arena_clear(arena)
+                    return False
+                if action == 4 and arrays is not None and name in arrays:
+                    try:
+                        v = typed_array(<str>arrays[name], v)
+                    except Exception as e:
+                        error = e
+                arena_keyword(arena, <str>name, v)
+                buf = None
             elif action == 6:
-                v = [self.pop().val]
+                v = [stack_pop(arena, &entry)]
+                entry = arena.stack[arena.depth - 1]
+                if arrays is not None and entry.syn == LITERAL and <object>entry.val in arrays:
+                    try:
+                        buf = v = typed_array(<str>arrays[<object>entry.val], (<list>v)[0])
+                    except Exception as e:
+                        error = e
             elif action == 7:
-                (<list>v).append(i.val)
+                if buf is None:
+                    (<list>v).append(val)
+                elif error is None:
+                    try:
+                        buf.append(val)
+                    except Exception as e:
+                        error = e
             elif action == 8:
                 v = {}
             elif action == 9:
-                (<dict>v)[self.pop().val] = i.val
+                (<dict>v)[stack_pop(arena, &entry)] = val
             elif action == 10:
-                args.append(self.pop().val)
-                self.push(i)
+                arena_append(arena, stack_pop(arena, &entry))
+                stack_push(arena, syn, lexer.token_lineno(), val)
 
             if stat == 15:
                 break
             elif stat == 0:
-                self.t_cache = i
+                self.t_cache = lexer.make_token(syn, text, text_len)
                 self.set_error()
-                
-        if not self.stack_top is None:
-            self.t_cache = self.stack_top
-            self.stack_top = None
-            self.set_error(16, False)
+                arena_clear(arena)
+                return False
 
-        self.t_cache = i
+        self.t_cache = lexer.make_token(syn, text, text_len)
+        if arena.depth:
+            # unclosed statement, reported at the top of the stack
+            token = self.t_cache
+            entry = arena.stack[arena.depth - 1]
+            self.t_cache = Token(entry.syn, <object>entry.val, lineno=entry.lineno, raw_val=b"")
+            self.set_error(16, False)
+            self.t_cache = token
+            arena_clear(arena)
+            return False
+        if error is not None:
+            # a value not fitting in a typed array
+            arena_clear(arena)
+            self.command_error(3, token, error)
+            return False
+        return True
+    
+    cpdef tuple parse_args(self):
+        if not self.collect_args():
+            return None
+        return self.take_args(None)
+    
+    cdef object call_command(self, object cmd, object first):
+        """
+        Call the command with the arguments in the arena, with `first` before them unless it is None.
+        """
+        cdef:
+            Py_ssize_t i
+            ArgArena arena = self.arena
+            tuple names = None
+            PyObject** args
+            size_t nargsf
+        # detach the arena, so that a command parsing with this parser again gets a new one
+        self.arena = ArgArena(NULL, NULL, NULL, 0, 0, 0, NULL, 0, 0)
+        try:
+            if arena.nkw:
+                memcpy(arena.items + arena.nargs + 1, arena.values, arena.nkw * sizeof(PyObject*))
+                names = self.kwnames
+                if names is None or len(names) != arena.nkw:
+                    names = None
+                else:
+                    for i in range(arena.nkw):
+                        if <object>arena.names[i] != names[i]:
+                            names = None
+                            break
+                if names is None:
+                    names = tuple([<object>arena.names[i] for i in range(arena.nkw)])
+                    self.kwnames = names
+            if first is None:
+                args = arena.items + 1
+                nargsf = arena.nargs | PY_VECTORCALL_ARGUMENTS_OFFSET
+            else:
+                arena.items[0] = <PyObject*>first
+                args = arena.items
+                nargsf = arena.nargs + 1
+            return kola_vectorcall(cmd, args, nargsf, NULL if names is None else <PyObject*>names)
+        finally:
+            arena.items[0] = NULL
+            arena_clear(&arena)
+            if self.arena.items == NULL:
+                self.arena = arena
+            else:
+                arena_free(&arena)
+    
+    cdef void command_error(self, int errorno, Token token, object cause) except *:
+        if self.diagnostics is None:
+            kola_set_errcause(KoiLangCommandError, errorno, 
+                self.lexer.lexer_data.filename, token.lineno, token.raw_val, cause)
+        self.diagnostics.append(new_diagnostic(
+            errorno, self.lexer.lexer_data.filename, token.lineno, 0, token.raw_val, cause))
+    
+    cdef object get_command(self, str name):
+        if self.lookup is not None:
+            return self.lookup(name)
+        try:
+            return self.command_set[name]
+        except KeyError:
+            return None
+    
+    cdef tuple take_args(self, object first):
+        """
+        Take the arguments in the arena as an `(args, kwargs)` tuple, with `first` before them unless it is None.
+        """
+        cdef:
+            Py_ssize_t i
+            ArgArena* arena = &self.arena
+            list args = [] if first is None else [first]
+            dict kwds = {}
+        for i in range(1, arena.nargs + 1):
+            args.append(<object>arena.items[i])
+        for i in range(arena.nkw):
+            kwds[<object>arena.names[i]] = <object>arena.values[i]
+        arena_clear(arena)
         return tuple(args), kwds
     
+    cdef object exec_batch(self, object cmd, Token token, object first, dict arrays):
+        """
+        Collect the following statements calling the same command and run them in one call.
+
+        No command runs while collecting, so the environment cannot change. A syntax error
+        ends the batch, and is raised once the statements before it have run.
+        """
+        cdef:
+            CommandBatch batch = CommandBatch.__new__(CommandBatch)
+            list lines = [token.lineno]
+            Token t
+            int syn = token.syn
+        batch.lines = lines
+        batch.append(self.take_args(first))
+        try:
+            while len(lines) < MAX_BATCH_SIZE:
+                t = self.t_cache
+                if t is None or t.syn != syn or (syn == CMD and <str>t.val != <str>token.val):
+                    break
+                self.lineno = t.lineno
+                if not self.collect_args(arrays):
+                    continue
+                batch.append(self.take_args(None if syn == CMD else t.val))
+                lines.append(t.lineno)
+        except Exception as e:
+            # raised by exec_once after the batch, even if the batch fails
+            self.pending_error = e
+        self.lineno = token.lineno
+        ret = self.call_batch(cmd, batch, token)
+        if self.pending_error is not None:
+            e, self.pending_error = self.pending_error, None
+            raise e
+        return ret
+    
+    cdef object call_batch(self, object cmd, CommandBatch batch, Token token):
+        cdef:
+            Py_ssize_t index
+            object text
+        try:
+            return cmd(batch)
+        except KoiLangError:
+            raise
+        except Exception as e:
+            index = batch.index if 0 <= batch.index < len(batch.lines) else 0
+            if token.syn == CMD or token.syn == TEXT_PART:
+                text = token.raw_val
+            else:
+                # the value of the failed statement
+                text = str((<tuple>(<tuple>(<list>batch)[index])[0])[0]).encode()
+            self.command_error(
+                4 if token.syn == TEXT or token.syn == TEXT_PART else 3,
+                Token(token.syn, token.val, lineno=batch.lines[index], raw_val=text), e)
+    
+    cdef object exec_parts(self, Token token):
+        cdef:
+            str name = "@text" if token.syn == TEXT_PART else "@annotation"
+            TextParts parts = TextParts(self, token)
+        
+        try:
+            cmd = self.get_command(name)
+            if cmd is None:
+                if token.syn == ANNOTATION_PART:
+                    return
+                self.command_error(2, token, None)
+                return
+
+            if getattr(cmd, "batch", False):
+                # a text in parts is a batch of its own, with the parts as its value
+                return self.call_batch(cmd, CommandBatch([((parts,), {})], [token.lineno]), token)
+            try:
+                return cmd(parts)
+            except KoiLangError:
+                raise
+            except Exception as e:
+                self.command_error(4 if token.syn == TEXT_PART else 3, token, e)
+        finally:
+            parts.close()
+    
     cpdef object exec_once(self):
         cdef:
             str name
-            tuple args
-            dict kwds
+            object first = None
             Token token
 
+        if self.pending_error is not None:
+            e, self.pending_error = self.pending_error, None
+            raise e
         token = self.t_cache
         if token is None:
             return
+        elif token.syn == 0:
+            self.recovery()
+            return
+        # line of the statement being executed
+        self.lineno = token.lineno
+        if token.syn == TEXT_PART or token.syn == ANNOTATION_PART:
+            return self.exec_parts(token)
         
-        args = self.parse_args()
-        kwds = <dict>args[1]
-        args = <tuple>args[0]
-
         if token.syn == CMD:
             name = <str>token.val
         elif token.syn == CMD_N:
             name = "@number"
-            args = (token.val,) + args
+            first = token.val
         elif token.syn == TEXT:
             name = "@text"
-            args = (token.val,)
+            first = token.val
         elif token.syn == ANNOTATION:
             name = "@annotation"
-            args = (token.val,)
+            first = token.val
         else:
             PyErr_Format(RuntimeError, "illegal token %S", <void*>token)
 
-        try:
-            cmd = self.command_set[name]
-        except KeyError:
+        # looked up first, as the command may ask for typed arrays
+        cmd = self.get_command(name)
+        arrays = None if cmd is None else getattr(cmd, "arrays", None)
+        if not self.collect_args(arrays):
+            # statement dropped in diagnostics mode
+            return
+        if cmd is None:
+            arena_clear(&self.arena)
             if token.syn == ANNOTATION:
                 return
-            kola_set_errcause(KoiLangCommandError, 2, 
-                self.lexer.lexer_data.filename, token.lineno, token.raw_val, None)
+            self.command_error(2, token, None)
+            return
+        if getattr(cmd, "batch", False):
+            return self.exec_batch(cmd, token, first, arrays)
         
         try:
-            return cmd(*args, **kwds)
+            return self.call_command(cmd, first)
         except KoiLangError:
             raise
         except Exception as e:
-            if token.syn != TEXT:
-                kola_set_errcause(KoiLangCommandError, 3, 
-                    self.lexer.lexer_data.filename, token.lineno, token.raw_val, e)
-            else:
-                kola_set_errcause(KoiLangCommandError, 4, 
-                    self.lexer.lexer_data.filename, token.lineno, token.raw_val, e)
+            self.command_error(4 if token.syn == TEXT else 3, token, e)
     
+    def check(self):
+        """
+        Check the syntax of the remaining statements without executing them.
+
+        Only the syn codes of tokens go through the state machine, so no value
+        is built and the GIL is released while scanning. Errors are collected
+        as diagnostics and returned. Strings with escapes or non-ASCII bytes
+        are decoded to report their errors.
+        """
+        cdef:
+            list diagnostics = [] if self.diagnostics is None else self.diagnostics
+            list saved = self.lexer.diagnostics
+            BaseLexer lexer = self.lexer
+            SynStack stack = SynStack(NULL, 0, 0)
+            SynEntry entry
+            uint8_t stat = 1, last, action
+            int syn, code, lineno
+            const char* text
+            Py_ssize_t text_len
+            bint recover = False
+        if self.t_cache is None:
+            return diagnostics
+        if not lexer.yy.lex_check(lexer.scanner):
+            raise OSError("operation on closed lexer")
+        
+        lexer.diagnostics = diagnostics
+        try:
+            with nogil:
+                while True:
+                    syn, text, text_len = lexer.next_syn()
+                    if syn == 0:
+                        with gil:
+                            lexer.set_error(text)
+                        stack.size = 0
+                        recover = True
+                        continue
+                    if syn == STRING and not plain_string(text, text_len):
+                        # a string failing to decode is recorded as an error token
+                        with gil:
+                            lexer.syn_value(&syn, text, text_len)
+                        if syn == 0:
+                            stack.size = 0
+                            recover = True
+                            continue
+                    if recover:
+                        if syn_flag(syn):
+                            continue
+                        # a new statement begins
+                        recover = False
+                        stat = 15
+                    else:
+                        last = stat
+                        stat = yy_goto[syn_flag(syn)][stat - 1]
+                        action = stat >> 4
+                        stat &= 0x0F
+                        code = 0
+
+                        if action == 3 or action == 6 or action == 9 or action == 10:
+                            if stack.size == 0:
+                                code = 210
+                            else:
+                                stack.size -= 1
+                        if (action == 2 or action == 10) and code == 0:
+                            if not syn_push(&stack, syn, lexer.token_lineno()):
+                                with gil:
+                                    raise MemoryError
+                        if action == 4 or action == 5:
+                            # pop the value first for action 4, then the keyword
+                            if stack.size < 6 - action:
+                                code = 210
+                            else:
+                                stack.size -= 5 - action
+                                entry = stack.entries[stack.size - 1]
+                                stack.size -= 1
+                                if entry.syn != LITERAL:
+                                    code = 201 if action == 4 else 202
+                        if code == 0 and stat == 0:
+                            code = 16 if syn == EOF else (last << 4) + syn
+                        
+                        if code:
+                            if code == 201 or code == 202:
+                                # no token text is kept for the popped values
+                                text = ""
+                            lineno = entry.lineno if code == 201 or code == 202 else lexer.token_lineno()
+                            with gil:
+                                diagnostics.append(new_diagnostic(
+                                    code, lexer.lexer_data.filename, lineno,
+                                    lexer.token_column(), text, None))
+                            # skip to the next statement like Parser.recovery
+                            stack.size = 0
+                            if syn == EOF:
+                                break
+                            recover = True
+                            continue
+                        elif stat == 15 and stack.size:
+                            # unclosed statement, the current token begins the next one
+                            entry = stack.entries[stack.size - 1]
+                            with gil:
+                                diagnostics.append(new_diagnostic(
+                                    (last << 4) + entry.syn, lexer.lexer_data.filename, entry.lineno, 0, "", None))
+                            stack.size = 0
+                    
+                    if stat == 15:
+                        if syn == EOF:
+                            break
+                        stat = 1
+        finally:
+            lexer.diagnostics = saved
+            PyMem_RawFree(stack.entries)
+        
+        self.t_cache = None
+        self.stack_top = None
+        if lexer.input_error is not None:
+            e, lexer.input_error = lexer.input_error, None
+            raise e
+        return diagnostics
+
     cpdef void exec(self) except *:
-        while not self.t_cache is None:
+        while not (self.t_cache is None and self.pending_error is None):
             self.exec_once()
 
     def eof(self):
-        return self.t_cache is None
+        return self.t_cache is None and self.pending_error is None
     
     def __iter__(self):
         return self
     
     def __next__(self):
-        if self.t_cache is None:
+        if self.t_cache is None and self.pending_error is None:
             raise StopIteration
         ret = self.exec_once()
         return ret
@@ -194,4 +892,16 @@ cdef class Parser:
         return cls
     
     def __repr__(self):
-        return PyUnicode_FromFormat("<kola parser in file \"%s\">", self.lexer.lexer_data.filename)
\ No newline at end of file
+        return PyUnicode_FromFormat("<kola parser in file \"%s\">", self.lexer.lexer_data.filename)
+
+
+def validate(path, **kwds):
+    """
+    Check the syntax of a KoiLang file and return the errors found.
+
+    Other keyword arguments are passed to the FileLexer. The GIL is released
+    during the check, so several files can be validated in threads.
+    """
+    kwds.setdefault("fast", True)
+    with FileLexer(path, **kwds) as lexer:
+        return Parser(lexer, {}, diagnostics=[]).check()
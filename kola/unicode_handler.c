@@ -18,7 +18,7 @@ PyObject* _decode_utf8(const char **sPtr, const char *end)
 }
 
 // from cpython:string_parser.decode_unicode_with_escapes
-PyObject* decode_escapes(const char* s, Py_ssize_t len) {
+static PyObject* decode_escapes_fallback(const char* s, Py_ssize_t len) {
     PyObject *v = NULL;
 
     /* check for integer overflow */
@@ -95,6 +95,150 @@ PyObject* decode_escapes(const char* s, Py_ssize_t len) {
     return v;
 }
 
+static __inline int _write_run(_PyUnicodeWriter* writer, const char* s, Py_ssize_t len) {
+    const char* p;
+    for (p = s; p < s + len; p++) {
+        if (*p & 0x80) {
+            PyObject* w = PyUnicode_DecodeUTF8(s, len, NULL);
+            if (w == NULL) {
+                return -1;
+            }
+            int r = _PyUnicodeWriter_WriteStr(writer, w);
+            Py_DECREF(w);
+            return r;
+        }
+    }
+    return _PyUnicodeWriter_WriteASCIIString(writer, s, len);
+}
+
+static __inline int _read_digits(const char** sPtr, const char* end, int base, int max_count, Py_UCS4* value) {
+    const char* s = *sPtr;
+    int count = 0;
+    Py_UCS4 v = 0;
+    while (count < max_count && s < end) {
+        int d;
+        char c = *s;
+        if (c >= '0' && c <= '9') {
+            d = c - '0';
+        } else if (c >= 'a' && c <= 'f') {
+            d = c - 'a' + 10;
+        } else if (c >= 'A' && c <= 'F') {
+            d = c - 'A' + 10;
+        } else {
+            break;
+        }
+        if (d >= base) {
+            break;
+        }
+        v = v * base + d;
+        s++;
+        count++;
+    }
+    *sPtr = s;
+    *value = v;
+    return count;
+}
+
+/*
+ * Decode the content of a string literal in a single pass.
+ *
+ * Literals without backslashes are decoded directly. Unusual escapes,
+ * like `\N{...}` or invalid ones, are handed to the fallback decoder
+ * so that the results and the errors stay the same as Python's.
+ */
+PyObject* decode_escapes(const char* s, Py_ssize_t len) {
+    const char* end = s + len;
+    const char* start = s;
+    const char* p = memchr(s, '\\', len);
+    if (p == NULL) {
+        return PyUnicode_DecodeUTF8(s, len, NULL);
+    }
+
+    _PyUnicodeWriter writer;
+    _PyUnicodeWriter_Init(&writer);
+    // escapes never make the string longer
+    writer.min_length = len;
+
+    while (1) {
+        if (p > s && _write_run(&writer, s, p - s) < 0) {
+            goto error;
+        }
+        if (p >= end) {
+            break;
+        }
+        s = p + 1;
+
+        Py_UCS4 ch;
+        if (s >= end || *s & 0x80) {
+            // keep the backslash like the fallback decoder
+            ch = '\\';
+        } else {
+            char c = *s++;
+            switch (c) {
+            case '\n':
+                goto next;
+            case '\r':
+                if (s < end && *s == '\n') {
+                    s++;
+                    goto next;
+                }
+                goto fallback;
+            case '\\': ch = '\\'; break;
+            case '\'': ch = '\''; break;
+            case '"': ch = '"'; break;
+            case 'a': ch = '\a'; break;
+            case 'b': ch = '\b'; break;
+            case 'f': ch = '\f'; break;
+            case 'n': ch = '\n'; break;
+            case 'r': ch = '\r'; break;
+            case 't': ch = '\t'; break;
+            case 'v': ch = '\v'; break;
+            case '0': case '1': case '2': case '3':
+            case '4': case '5': case '6': case '7':
+                s--;
+                _read_digits(&s, end, 8, 3, &ch);
+                if (ch > 0377) {
+                    goto fallback;
+                }
+                break;
+            case 'x':
+                if (_read_digits(&s, end, 16, 2, &ch) != 2) {
+                    goto fallback;
+                }
+                break;
+            case 'u':
+                if (_read_digits(&s, end, 16, 4, &ch) != 4) {
+                    goto fallback;
+                }
+                break;
+            case 'U':
+                if (_read_digits(&s, end, 16, 8, &ch) != 8 || ch > 0x10ffff) {
+                    goto fallback;
+                }
+                break;
+            default:
+                goto fallback;
+            }
+        }
+        if (_PyUnicodeWriter_WriteChar(&writer, ch) < 0) {
+            goto error;
+        }
+    next:
+        p = memchr(s, '\\', end - s);
+        if (p == NULL) {
+            p = end;
+        }
+    }
+    return _PyUnicodeWriter_Finish(&writer);
+
+fallback:
+    _PyUnicodeWriter_Dealloc(&writer);
+    return decode_escapes_fallback(start, len);
+error:
+    _PyUnicodeWriter_Dealloc(&writer);
+    return NULL;
+}
+
 PyObject* filter_text(PyObject* string) {
     Py_ssize_t len = PyUnicode_GET_LENGTH(string);
     Py_UCS4 maxchar = PyUnicode_MAX_CHAR_VALUE(string);
@@ -157,4 +301,73 @@ PyObject* filter_text(PyObject* string) {
 bad:
     Py_DECREF(result);
     return NULL;
-}
\ No newline at end of file
+}
+
+static __inline PyObject* _decode_bytes(const char* s, Py_ssize_t len, int kind) {
+    if (kind == ENC_ASCII) {
+        return PyUnicode_DecodeASCII(s, len, NULL);
+    }
+    return PyUnicode_DecodeUTF8(s, len, NULL);
+}
+
+/*
+ * Decode a text token and remove the `\`-newline continuations.
+ *
+ * For UTF-8 and ASCII, the continuations are removed at the byte level
+ * before a single decoding call, since their bytes never appear inside
+ * a multibyte sequence. Other encodings are decoded by the codec first
+ * and then filtered only if a backslash is found.
+ */
+PyObject* decode_text(const char* s, Py_ssize_t len, int kind, const char* encoding) {
+    if (kind == ENC_OTHER) {
+        PyObject* u = PyUnicode_Decode(s, len, encoding, NULL);
+        if (u == NULL) {
+            return NULL;
+        }
+        Py_ssize_t i = PyUnicode_FindChar(u, '\\', 0, PyUnicode_GET_LENGTH(u), 1);
+        if (i == -1) {
+            return u;
+        }
+        PyObject* r = (i == -2) ? NULL : filter_text(u);
+        Py_DECREF(u);
+        return r;
+    }
+
+    const char* end = s + len;
+    const char* p = memchr(s, '\\', len);
+    if (p == NULL) {
+        return _decode_bytes(s, len, kind);
+    }
+
+    char* buf = (char*)PyMem_Malloc(len);
+    if (buf == NULL) {
+        return PyErr_NoMemory();
+    }
+    char* q = buf;
+    while (p != NULL) {
+        memcpy(q, s, p - s);
+        q += p - s;
+        s = p + 1;
+        if (s >= end) {
+            *q++ = '\\';
+        } else if (*s == '\n') {
+            s++;
+        } else if (*s == '\r') {
+            s++;
+            if (s < end && *s == '\n') {
+                s++;
+            }
+        } else {
+            *q++ = '\\';
+            *q++ = *s++;
+        }
+        p = memchr(s, '\\', end - s);
+    }
+    if (s < end) {
+        memcpy(q, s, end - s);
+        q += end - s;
+    }
+    PyObject* r = _decode_bytes(buf, q - buf, kind);
+    PyMem_Free(buf);
+    return r;
+}
@@ -54,13 +54,23 @@ cdef class BaseWriter:
     cpdef void newline(self, bint concat_prev = *) except *
     cpdef void prepare(self) except *
     cdef void _write_text(self, str text) except *
+    cdef void _check_text(self, str text) except *
+    cdef void _write_command(self, object name, tuple args, dict kwds) except *
 
 
 cdef class FileWriter(BaseWriter):
-    cdef FILE* fp
+    cdef:
+        FILE* fp
+        object compressor
+        char* compression_buffer
+        Py_ssize_t buffer_pos
     cdef readonly:
         object path
         str encoding
+        str compression
+    cdef void _write_bytes(self, bytes data) except *
+    cdef void _compress(self, const char* string, Py_ssize_t length) except *
+    cdef void _flush_buffer(self) except *
     cpdef void close(self)
     cpdef void prepare(self) except *
     cpdef void raw_write(self, str text) except *
@@ -72,10 +82,58 @@ cdef class StringWriter(BaseWriter):
     cdef:
         bint _closed
         _PyUnicodeWriter writer
+        list _chunks
+    cdef readonly Py_ssize_t chunk_size
     
+    cdef void _seal(self) except *
+    cdef inline void _check_chunk(self, Py_ssize_t length) except *
     cpdef void close(self)
     cpdef void prepare(self) except *
     cpdef void raw_write(self, str text) except *
     cdef void raw_write_string(self, const char* string, Py_ssize_t length = *) except *
     cdef void raw_write_char(self, char ch) except *
     cpdef str getvalue(self)
+    cpdef str drain(self)
+
+
+
+cdef class BufferedWriter(BaseWriter):
+    cdef:
+        bint _closed
+        char* buffer
+        Py_ssize_t buffer_pos
+    cdef readonly:
+        str encoding
+        Py_ssize_t buffer_size
+
+    cdef void _alloc_buffer(self, Py_ssize_t size) except *
+    cdef void write_data(self, const char* data, Py_ssize_t length) except *
+    cpdef void close(self)
+    cpdef void prepare(self) except *
+    cpdef void flush(self) except *
+    cpdef void raw_write(self, str text) except *
+    cdef void raw_write_string(self, const char* string, Py_ssize_t length = *) except *
+    cdef void raw_write_char(self, char ch) except *
+
+
+cdef class AsyncStreamWriter(BufferedWriter):
+    cdef readonly object stream
+
+    cdef void write_data(self, const char* data, Py_ssize_t length) except *
+    cpdef void close(self)
+
+
+cdef enum SinkKind:
+    SINK_BYTES
+    SINK_STR
+    SINK_WRITER
+
+
+cdef class TeeWriter(BufferedWriter):
+    cdef list _sinks
+    cdef readonly:
+        tuple sinks
+        bint close_sinks
+
+    cdef void write_data(self, const char* data, Py_ssize_t length) except *
+    cpdef void close(self)
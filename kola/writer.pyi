@@ -1,7 +1,7 @@
 import os
 from types import TracebackType
-from typing import Any, Dict, Final, List, Type, Union
-from typing_extensions import Protocol, runtime_checkable, Self
+from typing import IO, Any, Callable, Dict, Final, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from typing_extensions import Literal, Protocol, runtime_checkable, Self
 
 
 WF_BASE_ITEM: int
@@ -53,6 +53,7 @@ class BaseWriter(object):
     def write_annotation(self, annotation: str) -> None: ...
     def write_command(self, __name: Union[str, int], *args: _BaseItem, **kwds: _ComplexItem) -> None: ...
     def write(self, command: Union[str, WriterItemLike]) -> None: ...
+    def write_instructions(self, instructions: Iterable[Tuple[str, Tuple[Any, ...], Dict[str, Any]]]) -> None: ...
     @property
     def closed(self) -> bool: ...
     def __enter__(self) -> Self: ...
@@ -62,10 +63,56 @@ class BaseWriter(object):
 class FileWriter(BaseWriter):
     path: Final[Union[str, bytes, os.PathLike]]
     encoding: Final[str]
+    compression: Final[Optional[str]]
 
     def __init__(self, __path: Union[str, bytes, os.PathLike], encoding: str = "utf-8",
-                 indent: int = ..., command_threshold: int = ...) -> None: ...
+                 indent: int = ..., command_threshold: int = ...,
+                 compression: Optional[Literal["infer", "gzip", "bz2", "xz", "lzma"]] = "infer") -> None: ...
 
 
 class StringWriter(BaseWriter):
+    chunk_size: Final[int]
+
+    def __init__(self, indent: int = 4, command_threshold: int = 1, chunk_size: int = 0) -> None: ...
     def getvalue(self) -> str: ...
+    def drain(self) -> str: ...
+    def iter_chunks(self) -> Iterator[str]: ...
+
+
+
+class BufferedWriter(BaseWriter):
+    encoding: Final[str]
+    buffer_size: Final[int]
+
+    def flush(self) -> None: ...
+
+
+class _AsyncStream(Protocol):
+    def write(self, __data: bytes) -> None: ...
+    async def drain(self) -> None: ...
+    def close(self) -> None: ...
+    async def wait_closed(self) -> None: ...
+
+
+class AsyncStreamWriter(BufferedWriter):
+    stream: Final[_AsyncStream]
+
+    def __init__(self, __stream: _AsyncStream, encoding: str = "utf-8",
+                 indent: int = ..., command_threshold: int = ..., high_water: int = ...) -> None: ...
+    @property
+    def high_water(self) -> int: ...
+    async def drain(self) -> None: ...
+    async def aclose(self) -> None: ...
+    async def __aenter__(self) -> Self: ...
+    async def __aexit__(self, exc_type: Type[BaseException], exc_ins: Exception, traceback: TracebackType) -> None: ...
+
+
+_Sink = Union[BaseWriter, IO[str], IO[bytes], Callable[[bytes], Any]]
+
+
+class TeeWriter(BufferedWriter):
+    sinks: Final[Tuple[_Sink, ...]]
+    close_sinks: Final[bool]
+
+    def __init__(self, *sinks: _Sink, encoding: str = "utf-8", indent: int = ..., command_threshold: int = ...,
+                 buffer_size: int = ..., close_sinks: bool = False) -> None: ...
@@ -1,9 +1,15 @@
-from libc.stdio cimport fopen, fclose, fputc, fputs, sprintf
-from libc.string cimport strlen
+from libc.stdio cimport fopen, fclose, fputc, fputs, fwrite, sprintf
+from libc.string cimport strlen, memcpy
 from cpython cimport PyObject, PySequence_Check, PyMapping_Check, PyErr_Format, PyErr_SetString,\
-    PyUnicode_FindChar, PyUnicode_FromStringAndSize, PyUnicode_AsEncodedString
+    PyUnicode_FindChar, PyUnicode_FromStringAndSize, PyUnicode_AsEncodedString, PyUnicode_Decode, PyBytes_FromStringAndSize
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from cpython.buffer cimport PyBUF_READ
+from cpython.memoryview cimport PyMemoryView_FromMemory
 
+import os
 import re
+from array import array
+from io import TextIOBase
 from typing_extensions import Protocol, runtime_checkable
 
 
@@ -24,6 +30,10 @@ cdef extern from *:
     const char* _prefix_string
 
 
+cdef enum:
+    BUFFER_SIZE = 1 << 16
+
+
 cdef object literal_pattarn = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 
@@ -68,6 +78,9 @@ cdef void _write_complex_item(BaseWriter writer, str key, object value, bint spl
         writer.newline(True)
     try:
         if not _write_base_item(writer, value):
+            if isinstance(value, array):
+                # typed array read by the parser
+                value = value.tolist()
             if isinstance(value, list):
                 if not value:
                     raise ValueError("empty list is not a valid kola item")
@@ -229,25 +242,28 @@ cdef class BaseWriter(object):
         self.raw_write(text)
         self.newline()
     
-    def write_text(self, str text not None):
+    cdef void _check_text(self, str text) except *:
         cdef Py_ssize_t i = 0
         while i < len(text) and PyUnicode_READ_CHAR(text, i) == ord('#'):
             i += 1
         if i >= self.command_threshold:
             PyErr_Format(ValueError, "kola text cannot have '#' prefix longer than %d", self.command_threshold)
+    
+    def write_text(self, str text not None):
+        self._check_text(text)
         self._write_text(text)
     
-    def write_command(self, __name not None, *args, **kwds):
+    cdef void _write_command(self, object name, tuple args, dict kwds) except *:
         cdef:
             int number_name
             char cache[11]
-        if isinstance(__name, str):
-            if literal_pattarn.match(__name) is None:
-                PyErr_Format(ValueError, "%U is an invalid command name", <PyObject*>__name)
+        if isinstance(name, str):
+            if literal_pattarn.match(name) is None:
+                PyErr_Format(ValueError, "%U is an invalid command name", <PyObject*>name)
             self._write_prefix(self.command_threshold)
-            self.raw_write(__name)
-        elif isinstance(__name, int):
-            number_name = <int>__name
+            self.raw_write(name)
+        elif isinstance(name, int):
+            number_name = <int>name
             if number_name < 0:
                 raise ValueError("the numeric command should be a non-negative integer")
             self._write_prefix(self.command_threshold)
@@ -257,7 +273,7 @@ cdef class BaseWriter(object):
             PyErr_Format(
                 TypeError,
                 "argumnet '__name' must be a str or an integer, not '%s'",
-                get_type_qualname(__name)
+                get_type_qualname(name)
             )
 
         self.inc_indent()
@@ -276,6 +292,9 @@ cdef class BaseWriter(object):
             self.dec_indent()
         self.newline()
     
+    def write_command(self, __name not None, *args, **kwds):
+        self._write_command(__name, args, kwds)
+    
     def write_annotation(self, str annotation not None):
         self._write_prefix(self.command_threshold + 1)
         self._write_text(annotation)
@@ -286,6 +305,37 @@ cdef class BaseWriter(object):
         else:
             _write_writeritemlike(self, command, FULL_CMD)
 
+    def write_instructions(self, instructions not None):
+        """
+        Write the (name, args, kwargs) records of `kola.lib.recorder`.
+
+        '@text', '@annotation' and '@number' records are written as the statements they come from.
+        """
+        cdef:
+            str name, text
+            tuple args
+            dict kwds
+            Py_ssize_t i
+        for record in instructions:
+            name, args, kwds = record
+            if name == "@text":
+                text, = args
+                self._check_text(text)
+                self._write_text(text)
+            elif name == "@annotation":
+                text, = args
+                i = 0
+                while i < len(text) and PyUnicode_READ_CHAR(text, i) == ord('#'):
+                    i += 1
+                if i <= self.command_threshold:
+                    # recorded annotations keep their prefix
+                    self._write_prefix(self.command_threshold + 1)
+                self._write_text(text)
+            elif name == "@number":
+                self._write_command(args[0], args[1:], kwds)
+            else:
+                self._write_command(name, args, kwds)
+
     @property
     def closed(self):
         return False
@@ -301,47 +351,142 @@ cdef class BaseWriter(object):
         return PyUnicode_FromFormat(format, <PyObject*>self)
     
 
+cdef dict _compression_suffixes = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "lzma"
+}
+
+
+cdef str _infer_compression(object path, str compression):
+    if compression == "infer":
+        ext = os.path.splitext(os.fsdecode(path))[1]
+        return _compression_suffixes.get(ext.lower())
+    return compression
+
+
+cdef object _get_compressor(str compression):
+    if compression == "gzip":
+        import zlib
+        return zlib.compressobj(wbits=31)
+    elif compression == "bz2":
+        import bz2
+        return bz2.BZ2Compressor()
+    elif compression == "xz" or compression == "lzma":
+        import lzma
+        return lzma.LZMACompressor(lzma.FORMAT_XZ if compression == "xz" else lzma.FORMAT_ALONE)
+    PyErr_Format(ValueError, "unsupported compression '%U'", <PyObject*>compression)
+
+
 cdef class FileWriter(BaseWriter):
     def __cinit__(
         self,
         __path,
         *args,
         str encoding = "utf-8",
+        str compression = "infer",
         **kwds
     ):
         self.path = __path
-        self.fp = kola_open(__path, NULL, 'w')
+        self.compression = _infer_compression(__path, compression)
+        if self.compression is None:
+            self.fp = kola_open(__path, NULL, 'w')
+        else:
+            self.compressor = _get_compressor(self.compression)
+            self.fp = kola_open(__path, NULL, 'wb')
+            self.compression_buffer = <char*>PyMem_Malloc(BUFFER_SIZE)
+            if self.compression_buffer == NULL:
+                fclose(self.fp)
+                self.fp = NULL
+                raise MemoryError
         if encoding is None:
             self.encoding = "utf-8"
         else:
             self.encoding = encoding
     
-    def __init__(self, __path, encoding = "utf-8", indent = None, command_threshold = None):
+    def __init__(self, __path, encoding = "utf-8", indent = None, command_threshold = None, compression = "infer"):
         pass
     
+    def __dealloc__(self):
+        # only the C resources are released here, the compressed output is
+        # finished by an explicit `close()`
+        if self.fp != NULL:
+            with nogil:
+                fclose(self.fp)
+            self.fp = NULL
+        PyMem_Free(self.compression_buffer)
+        self.compression_buffer = NULL
+    
+    cdef void _compress(self, const char* string, Py_ssize_t length) except *:
+        cdef bytes data = self.compressor.compress(PyMemoryView_FromMemory(<char*>string, length, PyBUF_READ))
+        self._write_bytes(data)
+    
+    cdef void _write_bytes(self, bytes data) except *:
+        cdef:
+            const char* string = data
+            size_t length = len(data)
+        with nogil:
+            fwrite(string, 1, length, self.fp)
+    
+    cdef void _flush_buffer(self) except *:
+        if self.buffer_pos:
+            self._compress(self.compression_buffer, self.buffer_pos)
+            self.buffer_pos = 0
+    
     cpdef void raw_write(self, str text) except *:
         cdef:
             const char* encoding = unicode2string(self.encoding, NULL)
             bytes tb = PyUnicode_AsEncodedString(text, encoding, NULL)
-        self.raw_write_string(tb)
+        self.raw_write_string(tb, len(tb))
     
     cdef void raw_write_string(self, const char* string, Py_ssize_t length = -1) except *:
         if length == 0:
             return
         self.prepare()
-        with nogil:
-            fputs(string, self.fp)
+        if self.compressor is None:
+            with nogil:
+                if length < 0:
+                    fputs(string, self.fp)
+                else:
+                    fwrite(string, 1, length, self.fp)
+            return
+        
+        if length < 0:
+            length = <Py_ssize_t>strlen(string)
+        if self.buffer_pos + length > BUFFER_SIZE:
+            self._flush_buffer()
+            if length >= BUFFER_SIZE:
+                self._compress(string, length)
+                return
+        memcpy(self.compression_buffer + self.buffer_pos, string, length)
+        self.buffer_pos += length
 
     cdef void raw_write_char(self, char ch) except *:
         self.prepare()
-        with nogil:
-            fputc(ch, self.fp)
+        if self.compressor is None:
+            with nogil:
+                fputc(ch, self.fp)
+            return
+        
+        if self.buffer_pos >= BUFFER_SIZE:
+            self._flush_buffer()
+        self.compression_buffer[self.buffer_pos] = ch
+        self.buffer_pos += 1
     
     cpdef void close(self):
-        if self.fp != NULL:
+        if self.fp == NULL:
+            return
+        try:
+            if self.compressor is not None:
+                self._flush_buffer()
+                self._write_bytes(self.compressor.flush())
+        finally:
             with nogil:
                 fclose(self.fp)
-        self.fp = NULL
+            self.fp = NULL
+            PyMem_Free(self.compression_buffer)
+            self.compression_buffer = NULL
     
     cpdef void prepare(self) except *:
         """preparation before writing"""
@@ -356,11 +501,33 @@ cdef class FileWriter(BaseWriter):
 
 cdef class StringWriter(BaseWriter):
     def __cinit__(self, *args, **kwds):
+        self._chunks = []
         _PyUnicodeWriter_Init(&self.writer)
         self.writer.overallocate = True
     
+    def __init__(self, indent = None, command_threshold = None, Py_ssize_t chunk_size = 0):
+        if chunk_size < 0:
+            PyErr_Format(ValueError, "the chunk size should be a non-negative number, not %zd", chunk_size)
+        self.chunk_size = chunk_size
+    
+    cdef void _seal(self) except *:
+        """move the content of the unicode writer into the chunk list"""
+        if self.writer.pos == 0:
+            return
+        cdef str chunk = _PyUnicodeWriter_Finish(&self.writer)
+        _PyUnicodeWriter_Init(&self.writer)
+        self.writer.overallocate = True
+        self._chunks.append(chunk)
+    
+    cdef inline void _check_chunk(self, Py_ssize_t length) except *:
+        # seal the current chunk first if the new text would overflow it;
+        # only a single write longer than the chunk size exceeds the bound
+        if self.chunk_size and self.writer.pos and self.writer.pos + length > self.chunk_size:
+            self._seal()
+    
     cpdef void raw_write(self, str text) except *:
         self.prepare()
+        self._check_chunk(len(text))
         _PyUnicodeWriter_WriteStr(&self.writer, text)
     
     cdef void raw_write_string(self, const char* string, Py_ssize_t length = -1) except *:
@@ -369,14 +536,25 @@ cdef class StringWriter(BaseWriter):
         if length == 0:
             return
         self.prepare()
+        self._check_chunk(length)
         _PyUnicodeWriter_WriteASCIIString(&self.writer, string, length)
     
     cdef void raw_write_char(self, char ch) except *:
         self.prepare()
+        self._check_chunk(1)
         _PyUnicodeWriter_WriteChar(&self.writer, ch)
     
+    def __dealloc__(self):
+        # mark the writer closed so that BaseWriter.__dealloc__ does nothing
+        if not self._closed:
+            self._closed = True
+            _PyUnicodeWriter_Dealloc(&self.writer)
+    
     cpdef void close(self):
+        if self._closed:
+            return
         self._closed = True
+        self._chunks = None
         _PyUnicodeWriter_Dealloc(&self.writer)
     
     cpdef void prepare(self) except *:
@@ -386,17 +564,243 @@ cdef class StringWriter(BaseWriter):
         BaseWriter.prepare(self)
 
     cpdef str getvalue(self):
+        """
+        get all the text written since the last drain
+
+        The written chunks are merged into a single string and kept,
+        so calling it again without new output costs nothing.
+        """
         if self._closed:
             raise OSError("operation on closed writer")
-        cdef str intermediate = _PyUnicodeWriter_Finish(&self.writer)
-        self._closed = True
+        self._seal()
+        cdef Py_ssize_t n = len(self._chunks)
+        if n == 0:
+            return ""
+        elif n > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0]
+    
+    cpdef str drain(self):
+        """get the text written so far and remove it from the writer"""
+        cdef str value = self.getvalue()
+        self._chunks = []
+        return value
+    
+    def iter_chunks(self):
+        """
+        iterate over the written chunks without merging them
+
+        Each chunk is removed from the writer before it is yielded.
+        """
+        if self._closed:
+            raise OSError("operation on closed writer")
+        self._seal()
+        cdef list chunks = self._chunks
+        self._chunks = []
+        for i in range(len(chunks)):
+            chunk = chunks[i]
+            chunks[i] = None
+            yield chunk
+    
+    @property
+    def closed(self):
+        return self._closed
 
-        _PyUnicodeWriter_Init(&self.writer)
-        self.writer.overallocate = True
-        _PyUnicodeWriter_WriteStr(&self.writer, intermediate)
-        self._closed = False
-        return intermediate
+
+cdef class BufferedWriter(BaseWriter):
+    """
+    base class for writers collecting encoded output in a fixed buffer
+
+    The buffer content is passed to `write_data` each time it is full,
+    when `flush` is called and when the writer is closed.
+    """
+
+    def __cinit__(self, *args, str encoding = "utf-8", **kwds):
+        self.encoding = "utf-8" if encoding is None else encoding
+    
+    def __dealloc__(self):
+        self._closed = True
+        PyMem_Free(self.buffer)
+        self.buffer = NULL
+    
+    cdef void _alloc_buffer(self, Py_ssize_t size) except *:
+        if size <= 0:
+            PyErr_Format(ValueError, "the buffer size should be a positive number, not %zd", size)
+        self.buffer = <char*>PyMem_Malloc(size)
+        if self.buffer == NULL:
+            raise MemoryError
+        self.buffer_size = size
+        self.buffer_pos = 0
+    
+    cdef void write_data(self, const char* data, Py_ssize_t length) except *:
+        raise NotImplementedError
+    
+    cpdef void flush(self) except *:
+        """pass the buffered output to `write_data`"""
+        if self.buffer_pos == 0:
+            return
+        cdef Py_ssize_t length = self.buffer_pos
+        self.buffer_pos = 0
+        self.write_data(self.buffer, length)
+    
+    cpdef void raw_write(self, str text) except *:
+        cdef:
+            const char* encoding = unicode2string(self.encoding, NULL)
+            bytes tb = PyUnicode_AsEncodedString(text, encoding, NULL)
+        self.raw_write_string(tb, len(tb))
+    
+    cdef void raw_write_string(self, const char* string, Py_ssize_t length = -1) except *:
+        if length < 0:
+            length = <Py_ssize_t>strlen(string)
+        if length == 0:
+            return
+        self.prepare()
+        if self.buffer_pos + length > self.buffer_size:
+            self.flush()
+            if length >= self.buffer_size:
+                self.write_data(string, length)
+                return
+        memcpy(self.buffer + self.buffer_pos, string, length)
+        self.buffer_pos += length
+    
+    cdef void raw_write_char(self, char ch) except *:
+        self.prepare()
+        if self.buffer_pos >= self.buffer_size:
+            self.flush()
+        self.buffer[self.buffer_pos] = ch
+        self.buffer_pos += 1
+    
+    cpdef void close(self):
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            PyMem_Free(self.buffer)
+            self.buffer = NULL
+    
+    cpdef void prepare(self) except *:
+        """preparation before writing"""
+        if self._closed:
+            raise OSError("operation on closed writer")
+        BaseWriter.prepare(self)
     
     @property
     def closed(self):
         return self._closed
+
+
+cdef class AsyncStreamWriter(BufferedWriter):
+    """
+    writer buffering output for an asyncio stream
+
+    The output is written to the stream each time the buffer reaches
+    the high-water mark. Await `drain()` to respect the stream backpressure.
+    """
+
+    def __cinit__(self, __stream, *args, Py_ssize_t high_water = 1 << 16, **kwds):
+        if high_water <= 0:
+            PyErr_Format(ValueError, "the high-water mark should be a positive number, not %zd", high_water)
+        self._alloc_buffer(high_water)
+        self.stream = __stream
+    
+    def __init__(self, __stream, encoding = "utf-8", indent = None, command_threshold = None, high_water = None):
+        pass
+    
+    cdef void write_data(self, const char* data, Py_ssize_t length) except *:
+        self.stream.write(PyBytes_FromStringAndSize(data, length))
+    
+    async def drain(self):
+        """flush the buffer and wait until the stream is ready to accept more data"""
+        self.flush()
+        await self.stream.drain()
+    
+    cpdef void close(self):
+        if self._closed:
+            return
+        try:
+            BufferedWriter.close(self)
+        finally:
+            self.stream.close()
+    
+    async def aclose(self):
+        """flush all the output and close the stream"""
+        if not self._closed:
+            self.flush()
+            await self.stream.drain()
+            self.close()
+        await self.stream.wait_closed()
+    
+    @property
+    def high_water(self):
+        return self.buffer_size
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+
+cdef class TeeWriter(BufferedWriter):
+    """
+    writer formatting the output once and passing it to several sinks
+
+    A sink can be another writer, a file object or a callable accepting
+    bytes, like the `update` method of a hashlib object. The sinks are only
+    written by `flush()` and `close()`, so the writer should be closed or
+    used as a context manager.
+    """
+
+    def __cinit__(self, *sinks, Py_ssize_t buffer_size = 1 << 16, bint close_sinks = False, **kwds):
+        self._alloc_buffer(buffer_size)
+        self.sinks = sinks
+        self.close_sinks = close_sinks
+        self._sinks = []
+        for i in sinks:
+            if isinstance(i, BaseWriter):
+                if isinstance(i, (FileWriter, BufferedWriter)) and i.encoding == self.encoding:
+                    self._sinks.append((SINK_WRITER, i))
+                else:
+                    self._sinks.append((SINK_STR, (<BaseWriter>i).raw_write))
+            elif isinstance(i, TextIOBase):
+                self._sinks.append((SINK_STR, i.write))
+            elif hasattr(i, "write"):
+                self._sinks.append((SINK_BYTES, i.write))
+            elif callable(i):
+                self._sinks.append((SINK_BYTES, i))
+            else:
+                PyErr_Format(TypeError, "unsupport sink type '%s'", get_type_qualname(i))
+    
+    def __init__(self, *sinks, encoding = "utf-8", indent = None, command_threshold = None,
+                 buffer_size = None, close_sinks = None):
+        pass
+    
+    cdef void write_data(self, const char* data, Py_ssize_t length) except *:
+        cdef:
+            bytes bdata = None
+            str sdata = None
+            SinkKind kind
+        for kind, sink in self._sinks:
+            if kind == SINK_WRITER:
+                (<BaseWriter>sink).raw_write_string(data, length)
+            elif kind == SINK_STR:
+                if sdata is None:
+                    sdata = PyUnicode_Decode(data, length, unicode2string(self.encoding, NULL), NULL)
+                sink(sdata)
+            else:
+                if bdata is None:
+                    bdata = PyBytes_FromStringAndSize(data, length)
+                sink(bdata)
+    
+    cpdef void close(self):
+        if self._closed:
+            return
+        try:
+            BufferedWriter.close(self)
+        finally:
+            if self.close_sinks and self.sinks:
+                for i in self.sinks:
+                    if isinstance(i, BaseWriter) or hasattr(i, "close"):
+                        i.close()
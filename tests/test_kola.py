@@ -1,15 +1,21 @@
 import os
+from array import array
+from contextlib import redirect_stdout
 from functools import partial
+from io import StringIO
+from traceback import extract_tb
 from types import TracebackType
-from typing import Type
+from typing import Any, List, Optional, Type
+from typing_extensions import Literal
 from unittest import TestCase
 
+from kola.exception import KoiLangCommandError, KoiLangSyntaxError
 from kola.klvm import CommandSet, Environment, KoiLang, kola_environment
 from kola.klvm.decorator import kola_command, kola_annotation, kola_text, kola_env_enter, kola_env_exit
 from kola.klvm.writer import KoiLangWriter
 from kola.lexer import StringLexer
-from kola.parser import Parser
-from kola.writer import BaseWriter
+from kola.parser import CommandBatch, Parser
+from kola.writer import BaseWriter, FormatItem
 
 
 class CommandSetTest(CommandSet):
@@ -85,6 +91,70 @@ class KolaTest(KoiLang, command_threshold=2, lstrip_text=False):
         return True
             
 
+class BatchTest(KoiLang):
+    @kola_command(batch=True)
+    def point(self, batch: CommandBatch) -> int:
+        for args, kwargs in batch:
+            if args[0] < 0:
+                raise ValueError(args[0])
+            self.log.append((args, kwargs))
+        return len(batch)
+
+    @kola_text(batch=True)
+    def text(self, batch: CommandBatch) -> None:
+        # chunked texts are given as TextParts
+        texts = ["".join(args[0]) for args, _ in batch]
+        if any(i.startswith("error") for i in texts):
+            raise ValueError(texts)
+        self.log.append((texts, batch.lines))
+
+    @kola_command
+    def other(self) -> None:
+        self.log.append("other")
+
+    def at_start(self) -> None:
+        self.log = []
+        self.errors = []
+
+    def on_exception(self, exc_type: Type[BaseException], exc_ins: BaseException, traceback: TracebackType) -> bool:
+        self.errors.append((exc_type, extract_tb(traceback)[-1].lineno))
+        return True
+
+
+class ArrayTest(KoiLang):
+    @kola_command(arrays={"verts": "d", "ids": "q"})
+    def mesh(self, name: str, verts: Optional[array] = None, ids: Optional[array] = None, **kwds: Any) -> None:
+        self.log.append((name, verts, ids, kwds))
+
+    def at_start(self) -> None:
+        self.log = []
+
+
+class SchemaTest(KoiLang):
+    @kola_command
+    def seek(self, __cookie: int, whence: Literal["SET", "CUR", "END"] = "SET") -> None:
+        self.log.append((__cookie, whence))
+
+    @kola_command
+    def pos(self, x: float, y: float, *, tags: List[str] = [], scale: Optional[float] = None, **extra: int) -> None:
+        self.log.append((x, y, tags, scale, extra))
+
+    @kola_command
+    def name(self, path: str, flag: bool = False) -> None:
+        self.log.append((path, flag))
+
+    @kola_command
+    def group(self, items: list) -> None:
+        self.log.append(items)
+
+    @kola_text
+    def text(self, text: str) -> None:
+        self.log.append(text if isinstance(text, str) else "".join(text))
+
+    def at_start(self) -> None:
+        self.log = []
+
+
 class TestKoiLang(TestCase):
     def test_init(self) -> None:
         self.assertEqual(len(KoiLang.__command_field__), 3)
@@ -142,6 +212,14 @@ class TestKoiLang(TestCase):
             [200, "text: # This is a text", "text:    This is a text, too", "annotation: ### This is an annotation"]
         )
         self.assertEqual(vmobj.errors, [None])
+
+        # the string parser is reused with the same configuration
+        for _ in range(2):
+            self.assertEqual(
+                list(vmobj.parse(string, with_ret=True)),
+                [200, "text: # This is a text", "text:    This is a text, too", "annotation: ### This is an annotation"]
+            )
+        self.assertEqual(list(vmobj.parse("##version 1\n#text", with_ret=True)), [1, "text: #text"])
     
     def test_writer(self) -> None:
         writer = KolaTest.writer
@@ -159,6 +237,8 @@ class TestKoiLang(TestCase):
             wr.annotation("?")
         ret = list(KolaTest().parse_file(path, with_ret=True))
         self.assertEqual(ret, [120, "text: Hello", "annotation: ###?"])
+        ret = list(KolaTest().parse_file(path, with_ret=True, pipeline=2))
+        self.assertEqual(ret, [120, "text: Hello", "annotation: ###?"])
 
     def test_writer2(self) -> None:
         with EnvTest.writer() as wr:
@@ -184,6 +264,139 @@ class TestKoiLang(TestCase):
         )
         self.assertEqual(text, string)
 
+    def test_annotation_filter(self) -> None:
+        class Vm(KoiLang):
+            @kola_text
+            def text(self, text: str) -> str:
+                return text
+
+        vm = Vm()
+        vm.parse("text\n## note\n")
+        self.assertEqual(vm._KoiLang__ignored_statements(), {"@annotation"})
+        # unhandled annotations still give a None result
+        self.assertEqual(list(vm.parse("text\n## note\n", with_ret=True)), ["text", None])
+        vm.parse("text\n## note\n")
+        self.assertEqual(list(vm.parse("text\n## note\n", with_ret=True)), ["text", None])
+        Vm.register_annotation(lambda self, text: text)
+        self.assertEqual(list(Vm().parse("text\n## note\n", with_ret=True)), ["text", "## note"])
+        self.assertEqual(Vm()._KoiLang__ignored_statements(), frozenset())
+
+    def test_getitem(self) -> None:
+        from kola.lib.debugger.command_debugger import CommandDebugger
+
+        self.assertTrue(CommandDebugger.__kola_getitem__)
+        debugger = CommandDebugger()
+        self.assertIs(debugger["@exception"].__func__, CommandDebugger.on_exception)
+        output = StringIO()
+        with redirect_stdout(output):
+            debugger.parse("#cmd 1\n## note\n")
+        self.assertIn("command cmd with args (1,)", output.getvalue())
+        self.assertIn("command @annotation with args ('## note',)", output.getvalue())
+
+    def test_batch(self) -> None:
+        vm = BatchTest()
+        ret = list(vm.parse("#point 1 2\n#point 3 k(1)\na\nb\n#other\n#point 4\n", with_ret=True))
+        self.assertEqual(ret, [2, None, None, 1])
+        self.assertEqual(vm.log, [((1, 2), {}), ((3,), {"k": 1}), (["a", "b"], [3, 4]), "other", ((4,), {})])
+
+        vm.parse("#point 1\n#point -1\n#point 2\n#point 3 [\n#point 4\n")
+        self.assertEqual(vm.log, [((1,), {}), ((4,), {})])
+        self.assertEqual(vm.errors, [(KoiLangCommandError, 2), (KoiLangSyntaxError, 4)])
+
+        vm.parse(StringLexer("#point 1\n" + "text" * 10 + "\n", max_text_size=8))
+        self.assertEqual(vm.log, [((1,), {}), (["text" * 10], [2])])
+        vm.parse(StringLexer("#point 1\n" + "error" * 4 + "\n#point 2\n", max_text_size=8))
+        self.assertEqual(vm.log, [((1,), {}), ((2,), {})])
+        self.assertEqual(vm.errors, [(KoiLangCommandError, 2)])
+
+        # batch commands called from python
+        self.assertEqual(vm.point([((5,), {}), ((6,), {})]), 2)
+        self.assertEqual(vm.point(7, k=1), 1)
+        self.assertEqual(vm.log[-3:], [((5,), {}), ((6,), {}), ((7,), {"k": 1})])
+
+        with BatchTest.writer() as wr:
+            wr.point(CommandBatch([((1, 2), {}), ((3,), {"k": 1})]))
+            wr.text(CommandBatch([(("text",), {})]))
+            wr.point([((4,), {})])
+            wr.point(5, k=2)
+            wr.text("line")
+            self.assertEqual(wr.getvalue(), "#point 1 2\n#point 3 k(1)\ntext\n#point 4\n#point 5 k(2)\nline\n")
+
+    def test_arrays(self) -> None:
+        vm = ArrayTest()
+        vm.parse(
+            "#mesh a verts(1.0, 2, -3.5e2, 0x10) ids(1, -2, 0x1F, 0b101, 123456789012345678) other(1, 2)\n"
+            "#mesh b verts(1) ids(7)\n"
+        )
+        self.assertEqual(vm.log, [
+            ("a", array("d", [1.0, 2.0, -350.0, 16.0]), array("q", [1, -2, 31, 5, 123456789012345678]), {"other": [1, 2]}),
+            ("b", array("d", [1.0]), array("q", [7]), {})
+        ])
+        for text, cause in [
+            ("#mesh c ids(1, 2.5)", TypeError),
+            ("#mesh c ids(1, x)", TypeError),
+            ("#mesh c ids(1, 99999999999999999999)", OverflowError),
+            ("#mesh c ids(x: 1)", TypeError),
+            ("#mesh \"c\" \"v\"", TypeError)
+        ]:
+            try:
+                vm.parse(f"#mesh a\n{text}\n#mesh b\n")
+            except KoiLangCommandError as e:
+                self.assertIsInstance(e.__cause__, cause)
+                self.assertEqual(extract_tb(e.__traceback__)[-1].lineno, 2)
+            else:
+                self.fail("KoiLangCommandError not raised")
+            self.assertEqual([i[0] for i in vm.log], ["a"])
+        with self.assertRaises(ValueError):
+            kola_command(arrays={"verts": "f"})(lambda self, verts: None)
+        vm.mesh("c", verts=[1, 2])
+        self.assertEqual(vm.log[-1], ("c", array("d", [1.0, 2.0]), None, {}))
+
+        with ArrayTest.writer() as wr:
+            wr.mesh("a", verts=array("d", [1.0, 2.5]))
+            self.assertEqual(wr.getvalue(), "#mesh a verts(1.0, 2.5)\n")
+
+    def test_schema(self) -> None:
+        self.assertIsNone(CommandSetTest.cmd1._schema)
+        self.assertIsNotNone(SchemaTest.seek._schema)
+        vm = SchemaTest()
+        vm.parse("#seek 1 SET\n#seek 2\n#pos 1 2 tags(a) scale(2)\n#pos 1.5 2 tags(a, 1) a(1)\n#name 0x10 True\n#group a\n")
+        self.assertEqual(vm.log, [
+            (1, "SET"), (2, "SET"), (1.0, 2.0, ["a"], 2.0, {}), (1.5, 2.0, ["a", "1"], None, {"a": 1}), ("16", True),
+            ["a"]
+        ])
+        self.assertIs(type(vm.log[2][0]), float)
+        vm.parse(StringLexer("#seek 1\n" + "text" * 10 + "\n", max_text_size=8))
+        self.assertEqual(vm.log, [(1, "SET"), "text" * 10])
+
+        for text, message in [
+            ("#seek 1 BAD", "seek() argument 'whence': expected one of 'SET', 'CUR', 'END', got 'BAD'"),
+            ("#pos 1 2 a(x)", "pos() argument 'a': expected int, got str"),
+            ("#pos 1 2 scale(x)", "pos() argument 'scale': expected float or None, got 'x'"),
+            ("#name a maybe", "name() argument 'flag': expected bool, got 'maybe'"),
+            ("#name path(x: 1)", "name() argument 'path': expected str, got dict"),
+            ("#pos 1 2 tags(a: 1)", "pos() argument 'tags': expected str, got dict"),
+            ("#seek 1 2 3", "seek() takes 2 positional arguments but 3 were given")
+        ]:
+            try:
+                vm.parse(f"#seek 0\n{text}\n#seek 3\n")
+            except KoiLangCommandError as e:
+                self.assertEqual(str(e.__cause__), message)
+                self.assertEqual(extract_tb(e.__traceback__)[-1].lineno, 2)
+            else:
+                self.fail("KoiLangCommandError not raised")
+            self.assertEqual(vm.log, [(0, "SET")])
+
+        with SchemaTest.writer() as wr:
+            wr.pos(1, 2, tags="x")
+            wr.pos(FormatItem(3.14159, ".2f"), 2, scale=FormatItem(2, ".1f"))
+            wr.group("a")
+            with self.assertRaises(ValueError):
+                wr.seek(1, "BAD")
+            with self.assertRaises(TypeError):
+                wr.pos("x", 2)
+            self.assertEqual(wr.getvalue(), "#pos 1 2 tags(x)\n#pos 3.14 2 scale(2.0)\n#group a\n")
+
 
 if __name__ == "__main__":
     for i in TestKoiLang.__dict__:
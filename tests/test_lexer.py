@@ -1,6 +1,14 @@
+import gc
+import os
+import weakref
+from tempfile import TemporaryDirectory
+from traceback import extract_tb
 from unittest import TestCase
 from kola.exception import KoiLangSyntaxError
-from kola.lexer import StringLexer, FileLexer, Token, S_CMD, S_LITERAL, S_ANNOTATION, S_TEXT, F_DISABLED, F_LSTRIP_TEXT
+from kola.lexer import (
+    StringLexer, FileLexer, Token, S_CMD, S_LITERAL, S_NUM, S_SLP, S_SRP, S_ANNOTATION, S_TEXT, S_TEXT_PART,
+    F_DISABLED, F_LSTRIP_TEXT
+)
 
 
 class TestLexer(TestCase):
@@ -54,12 +62,214 @@ class TestLexer(TestCase):
         self.assertEqual(token.syn, S_TEXT)
         self.assertEqual(token.val, text)
 
+        token, = StringLexer("Continued\\\n text".encode("ascii"), encoding="ascii")
+        self.assertEqual(token.val, "Continued text")
+        with self.assertRaises(UnicodeError):
+            token, = StringLexer(text.encode(), encoding="ascii")
+        with self.assertRaises(LookupError):
+            StringLexer(text, encoding="unknown-encoding")
+
         test_string = r"\u00a7a呃，\x20只熟悉这一个Unicode"
         self.assertEqual(test_string[0], '\\')
         _, t_str = StringLexer(f'#command "{test_string}"')
         self.assertNotEqual(t_str.val, test_string)
         self.assertEqual(t_str.val, eval(f"'{test_string}'"))
     
+    def test_transcode(self) -> None:
+        text = "#command \"中文字段\" 1\n这是一段中文\\\n 文本\n## 注释\n" * 2000
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "utf-8.kola")
+            with open(path, "wb") as f:
+                f.write(text.encode("utf-8"))
+            expected = [(i.syn, i.val, i.lineno) for i in FileLexer(path)]
+
+            for encoding, kwds in [
+                ("gbk", {"encoding": "gbk"}),
+                ("utf-16-le", {"encoding": "utf-16-le"}),
+                ("utf-8-sig", {}),
+                ("utf-16", {}),
+                ("utf-32", {})
+            ]:
+                path = os.path.join(tmp, f"{encoding}.kola")
+                with open(path, "wb") as f:
+                    f.write(text.encode(encoding))
+                self.assertEqual([(i.syn, i.val, i.lineno) for i in FileLexer(path, **kwds)], expected)
+                self.assertEqual(
+                    [(i.syn, i.val) for i in StringLexer(text.encode(encoding), **kwds)],
+                    [i[:2] for i in expected]
+                )
+            
+            path = os.path.join(tmp, "error.kola")
+            with open(path, "wb") as f:
+                f.write(b"\xff\xff\n")
+            with self.assertRaises(UnicodeDecodeError):
+                list(FileLexer(path, encoding="gbk"))
+
+    def test_fast(self) -> None:
+        lexer = FileLexer("examples/example0.kola", fast=True)
+        self.assertTrue(lexer.fast)
+        self.assertEqual(
+            [(i.syn, i.val, i.lineno) for i in lexer],
+            [(i.syn, i.val, i.lineno) for i in FileLexer("examples/example0.kola")]
+        )
+
+        text = "#command \"中文字段\" 1\n这是一段中文\\\n 文本\n\n## 注释\n" * 2000
+        self.assertEqual(
+            [(i.syn, i.val, i.lineno) for i in StringLexer(text, fast=True)],
+            [(i.syn, i.val, i.lineno) for i in StringLexer(text)]
+        )
+        try:
+            list(StringLexer(text + "#command [", fast=True))
+        except KoiLangSyntaxError as e:
+            self.assertEqual(extract_tb(e.__traceback__)[-1].lineno, 10001)
+        else:
+            self.fail("KoiLangSyntaxError not raised")
+
+    def test_column(self) -> None:
+        text = "text\n#a " + "1 " * 1000 + "\n  #b x(1)\n"
+        for fast in (False, True):
+            lexer = StringLexer(text, fast=fast)
+            columns = [(i.syn, lexer.column) for i in lexer]
+            self.assertEqual(columns[:3], [(S_TEXT, 0), (S_CMD, 1), (S_NUM, 3)])
+            self.assertEqual(columns[1001], (S_NUM, 2001))
+            self.assertEqual(columns[1002:], [(S_CMD, 3), (S_LITERAL, 5), (S_SLP, 6), (S_NUM, 7), (S_SRP, 8)])
+            lexer.reset("#c 1")
+            self.assertEqual([lexer.column for _ in lexer], [1, 3])
+
+    def test_read_ahead(self) -> None:
+        expected = [(i.syn, i.val, i.lineno) for i in FileLexer("examples/example0.kola")]
+        for read_ahead, block_size in [(1, 1), (2, 7), (4, 1 << 16)]:
+            lexer = FileLexer("examples/example0.kola", read_ahead=read_ahead, block_size=block_size)
+            self.assertEqual(lexer.read_ahead, read_ahead)
+            self.assertEqual([(i.syn, i.val, i.lineno) for i in lexer], expected)
+        
+        with FileLexer("examples/example0.kola", read_ahead=2, block_size=3, fast=True) as lexer:
+            next(lexer)
+        self.assertTrue(lexer.closed)
+
+        text = "#command \"中文字段\" 1\n这是一段中文\\\n 文本\n" * 100
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "gbk.kola")
+            with open(path, "wb") as f:
+                f.write(text.encode("gbk"))
+            self.assertEqual(
+                [(i.syn, i.val) for i in FileLexer(path, encoding="gbk", read_ahead=3, block_size=5)],
+                [(i.syn, i.val) for i in StringLexer(text)]
+            )
+        with self.assertRaises(ValueError):
+            FileLexer("examples/example0.kola", read_ahead=1, block_size=0)
+
+    def test_reset(self) -> None:
+        for fast in (False, True):
+            expected = [(i.syn, i.val, i.lineno) for i in FileLexer("examples/example0.kola", fast=fast)]
+            lexer = FileLexer("examples/example0.kola", fast=fast, read_ahead=2, block_size=5)
+            next(lexer)
+            next(lexer)
+            lexer.rebind("examples/example0.kola")
+            self.assertEqual([(i.syn, i.val, i.lineno) for i in lexer], expected)
+
+            lexer = StringLexer("### annotation\n##command [", command_threshold=2, fast=fast)
+            with self.assertRaises(KoiLangSyntaxError):
+                list(lexer)
+            lexer.reset("##command 1\n#text")
+            self.assertEqual(
+                [(i.syn, i.val, i.lineno) for i in lexer],
+                [(S_CMD, "command", 1), (S_NUM, 1, 1), (S_TEXT, "#text", 2)]
+            )
+            lexer.close()
+            lexer.reset("text")
+            self.assertEqual(list(lexer), [S_TEXT])
+
+    def test_chunked(self) -> None:
+        text = "#command 1\n" + "中文文本" * 100 + "\\\n continued\n#command 2\n"
+        for fast in (False, True):
+            tokens = list(StringLexer(text, max_text_size=16, fast=fast))
+            parts = [i for i in tokens if i.syn == S_TEXT_PART]
+            self.assertTrue(parts)
+            self.assertTrue(all(len(i.raw_val) <= 16 for i in parts))
+            text_token = tokens[len(parts) + 2]
+            self.assertEqual(text_token.syn, S_TEXT)
+            self.assertEqual(
+                "".join(i.val for i in parts) + text_token.val,
+                "中文文本" * 100 + " continued"
+            )
+            self.assertEqual(tokens[-2:], [S_CMD, S_NUM])
+            self.assertEqual(tokens[-1].val, 2)
+
+    def test_chunked_escape(self) -> None:
+        def joined(lexer: StringLexer) -> list:
+            values, parts = [], []
+            for token in lexer:
+                parts.append(token.val)
+                if token.syn != S_TEXT_PART:
+                    values.append("".join(parts))
+                    parts.clear()
+            return values
+
+        for count in range(1, 6):
+            for newline in ("\n", "\r\n", ""):
+                for offset in range(4):
+                    text = "a" * offset + "\\" * count + newline + "b\n"
+                    expected = joined(StringLexer(text))
+                    for size in range(1, len(text) + 2):
+                        for fast in (False, True):
+                            self.assertEqual(joined(StringLexer(text, max_text_size=size, fast=fast)), expected)
+
+    def test_ignore(self) -> None:
+        text = (
+            "#keep 1\n"
+            "## annotation\\\n continued\n"
+            "#drop \"string\" x(1, 2)\n"
+            "#drop\n"
+            "#5 a\n"
+            "#keep 2\n"
+        ) * 1000
+        for fast in (False, True):
+            lexer = StringLexer(text, ignore=["@annotation", "@number", "drop"], fast=fast)
+            self.assertEqual(lexer.config.ignore, {"@annotation", "@number", "drop"})
+            self.assertEqual(
+                [(i.syn, i.val, i.lineno) for i in lexer],
+                [
+                    (syn, val, lineno + i * 7)
+                    for i in range(1000)
+                    for syn, val, lineno in [(S_CMD, "keep", 1), (S_NUM, 1, 1), (S_CMD, "keep", 7), (S_NUM, 2, 7)]
+                ]
+            )
+        
+        lexer = StringLexer("text\n#drop [\n#keep", ignore=["@text", "drop"])
+        with self.assertRaises(KoiLangSyntaxError):
+            next(lexer)
+        lexer.config.ignore = ()
+        self.assertEqual(list(lexer), [S_CMD])
+
+    def test_string(self) -> None:
+        for string, value in [
+            (r'"Hello world"', "Hello world"),
+            (r'"\x41\101\u4e2d\U0001F600\0"', "AA中\U0001F600\0"),
+            (r'"\t\"\\\'\n"', "\t\"\\'\n"),
+            ('"中文\\\n字段"', "中文字段"),
+            ('"line\\\r\n2"', "line2"),
+            (r'"\N{BULLET}"', "\N{BULLET}"),
+            (r'"\é"', "\\é")
+        ]:
+            _, token = StringLexer(f"#command {string}")
+            self.assertEqual(token.val, value)
+        with self.assertRaises(KoiLangSyntaxError):
+            list(StringLexer(r'#command "\x4"'))
+        _, token = StringLexer('#command "中文字段"'.encode("gbk"), encoding="gbk")
+        self.assertEqual(token.val, "中文字段")
+    
+    def test_number(self) -> None:
+        numbers = [
+            "0", "-12", "123456789012345678", "-1234567890123456789012",
+            "0x1F", "0xFFFFFFFFFFFFFFFFFFFF", "0b101", "1.5", "-.5e-3", "1e999"
+        ]
+        _, *tokens = StringLexer("#command " + " ".join(numbers))
+        self.assertEqual(
+            [i.val for i in tokens],
+            [int(i, 0) if 'x' in i or 'b' in i else (float(i) if '.' in i or 'e' in i else int(i)) for i in numbers]
+        )
+    
     def test_command_threshold(self) -> None:
         lexer = StringLexer(
             "# #This is text\n"
@@ -72,6 +282,19 @@ class TestLexer(TestCase):
             [S_TEXT, S_CMD, S_ANNOTATION]
         )
     
+    def test_gc(self) -> None:
+        class Marker:
+            pass
+
+        marker = Marker()
+        ref = weakref.ref(marker)
+        lexer = StringLexer("#a 1\n#b [")
+        lexer.diagnostics = [lexer, marker]
+        list(lexer)
+        del lexer, marker
+        gc.collect()
+        self.assertIsNone(ref())
+
     def test_config(self) -> None:
         lexer = StringLexer(
             "#command\n"
@@ -94,7 +317,7 @@ class TestLexer(TestCase):
         self.assertTrue(lexer.closed)
         self.assertEqual(
             lexer.config.data_names,
-            {'command_threshold', 'disabled', 'encoding', 'filename', 'flag', 'lexer', 'no_lstrip'}
+            {'command_threshold', 'disabled', 'encoding', 'filename', 'flag', 'ignore', 'lexer', 'max_text_size', 'no_lstrip'}
         )
         self.assertIsInstance(lexer.config.data_names, frozenset)
         self.assertEqual(
@@ -103,6 +326,8 @@ class TestLexer(TestCase):
                 "filename": "<string>",
                 "encoding": "utf-8",
                 "command_threshold": 2,
+                "max_text_size": 0,
+                "ignore": frozenset(),
                 "flag": F_DISABLED | F_LSTRIP_TEXT,
                 "lexer": lexer,
                 "disabled": True,
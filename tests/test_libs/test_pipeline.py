@@ -0,0 +1,72 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from kola.exception import KoiLangSyntaxError
+from kola.lexer import StatementReader, StringLexer, S_CMD, S_TEXT
+from kola.writer import StringWriter
+from kola.lib import recorder
+from kola.lib.pipeline import Pipeline, Statement, drop, iter_statements, keep, map_instructions, rename
+
+
+TEXT = (
+    '#cmd 1 "str x" lit k(2) l(1, 2) d(a: 1, b: "s t")\n'
+    'text line\\\n continued\n'
+    '## note\n'
+    '#3 a b\n'
+    '#e\n'
+)
+
+
+class TestPipeline(TestCase):
+    def test_statements(self) -> None:
+        self.assertEqual(
+            list(StatementReader(StringLexer("#a 1 x(1,2)\ntext\n#b"))),
+            [(S_CMD, "a", b" 1 x(1, 2)", 1), (S_TEXT, None, b"text", 2), (S_CMD, "b", b"", 3)]
+        )
+        statements = list(iter_statements(StringLexer(TEXT)))
+        self.assertEqual([i.name for i in statements], ["cmd", "@text", "@annotation", "@number", "e"])
+        self.assertEqual([i.instruction for i in statements], recorder.parse(TEXT))
+        self.assertTrue(all(i.raw for i in statements))
+
+        reader = StatementReader(StringLexer("#a 1-\n#b 2\n#c"))
+        with self.assertRaises(KoiLangSyntaxError):
+            next(reader)
+        self.assertEqual([i[1] for i in reader], ["b", "c"])
+
+        text = "#a 1\n" + "中文文本" * 20 + "\n## " + "note" * 20 + "\n"
+        statements = list(iter_statements(StringLexer(text, max_text_size=16)))
+        self.assertEqual([i.instruction for i in statements], recorder.parse(text))
+        self.assertEqual(Pipeline().transform(text, max_text_size=16), text)
+
+    def test_transform(self) -> None:
+        self.assertEqual(Pipeline().transform(TEXT), TEXT)
+        self.assertEqual(
+            Pipeline(rename({"cmd": "c", "@number": "n"}), drop("@annotation")).transform(TEXT),
+            TEXT.replace("#cmd", "#c").replace("## note\n", "").replace("#3 a b", "#n 3 a b")
+        )
+        self.assertEqual(Pipeline(keep("e", "@text")).transform(TEXT), "text line\\\n continued\n#e\n")
+
+        def double(instruction: recorder.Instruction) -> recorder.Instruction:
+            return instruction._replace(args=tuple(i * 2 for i in instruction.args))
+        self.assertEqual(
+            Pipeline(map_instructions(double, "@number"), drop("cmd", "@text")).transform(TEXT),
+            "## note\n#6 aa bb\n#e\n"
+        )
+        self.assertEqual(Pipeline(map_instructions(lambda i: None)).transform(TEXT), "")
+
+        output = Pipeline().transform("##cmd 1\n# #text\n### note\n", command_threshold=2)
+        self.assertEqual(output, "##cmd 1\n# #text\n### note\n")
+        writer = StringWriter(command_threshold=2)
+        Pipeline().run(TEXT, writer)
+        self.assertIn("\n##### note\n", writer.getvalue())
+        self.assertEqual(recorder.parse(writer.getvalue(), command_threshold=2)[:2], recorder.parse(TEXT)[:2])
+
+        with self.assertRaises(KoiLangSyntaxError):
+            Statement(S_CMD, "a", b" x(1, 2", 1).instruction
+
+    def test_run_file(self) -> None:
+        expected = recorder.parse_file("examples/example0.kola")
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "output.kola")
+            Pipeline().run_file("examples/example0.kola", path)
+            self.assertEqual(recorder.parse_file(path), expected)
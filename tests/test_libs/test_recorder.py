@@ -0,0 +1,186 @@
+from traceback import extract_tb
+from types import TracebackType
+from typing import Type
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+from kola.exception import KoiLangCommandError, KoiLangError
+from kola.klvm import Environment, KoiLang
+from kola.klvm.decorator import kola_command, kola_env_enter, kola_env_exit, kola_text
+from kola.lexer import FileLexer, StringLexer
+from kola.writer import StringWriter
+from kola.lib import recorder
+from kola.lib.recorder import Instruction, InstructionTable
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class TrackedLexer(FileLexer):
+    instances = []
+
+    def __init__(self, *args, **kwds) -> None:
+        super().__init__(*args, **kwds)
+        self.instances.append(self)
+
+
+class ReplayTest(KoiLang):
+    @kola_command
+    def cmd(self, x: int, **kwds: int) -> None:
+        self.log.append(("cmd", x, kwds))
+
+    @kola_text
+    def text(self, text: str) -> None:
+        if text == "fail":
+            raise ValueError(text)
+        self.log.append(("text", text))
+
+    class Env(Environment):
+        @kola_env_enter
+        def enter(self) -> None:
+            self.home.log.append(("enter",))
+
+        @kola_command
+        def cmd(self, x: int, **kwds: int) -> None:
+            self.home.log.append(("env", x, kwds))
+
+        @kola_env_exit
+        def exit(self) -> None:
+            self.home.log.append(("exit",))
+
+    def at_start(self) -> None:
+        self.log = []
+        self.errors = []
+
+    def on_exception(self, exc_type: Type[KoiLangError], exc_ins: KoiLangError, traceback: TracebackType) -> bool:
+        self.errors.append((str(exc_ins), extract_tb(traceback)[-1].lineno))
+        return True
+
+
+class TestRecorder(TestCase):
+    def test_iter_parse(self) -> None:
+        text = "#a 1\ntext\n#b x(1, 2)\n" * 10
+        expected = recorder.parse(text)
+        self.assertEqual(len(expected), 30)
+        self.assertEqual(expected[2], Instruction("b", (), {"x": [1, 2]}))
+        self.assertEqual(list(recorder.iter_parse(text)), expected)
+        self.assertEqual(list(recorder.iter_parse(StringLexer(text))), expected)
+        self.assertEqual(list(recorder.iter_parse(text, max_text_size=2)), expected)
+        self.assertEqual(InstructionTable.parse(text, max_text_size=2).to_list(), expected)
+        self.assertEqual(
+            list(recorder.iter_parse_file("examples/example0.kola")),
+            recorder.parse_file("examples/example0.kola")
+        )
+
+        with patch.object(recorder, "FileLexer", TrackedLexer):
+            it = recorder.iter_parse_file("examples/example0.kola")
+            next(it)
+            lexer = TrackedLexer.instances[-1]
+            self.assertFalse(lexer.closed)
+            it.close()
+            self.assertTrue(lexer.closed)
+
+    def test_iter_batches(self) -> None:
+        text = "#a 1\ntext\n#b x(1, 2)\n" * 10
+        expected = recorder.parse(text)
+        batches = list(recorder.iter_batches(text, 7))
+        self.assertEqual([len(i) for i in batches], [7, 7, 7, 7, 2])
+        self.assertEqual([j for i in batches for j in i], expected)
+        self.assertEqual(list(recorder.iter_batches(StringLexer(text), 30)), [expected])
+        with self.assertRaises(ValueError):
+            recorder.iter_batches(text, 0)
+
+        with patch.object(recorder, "FileLexer", TrackedLexer):
+            it = recorder.iter_batches(recorder.iter_parse_file("examples/example0.kola"), 2)
+            self.assertEqual(len(next(it)), 2)
+            lexer = TrackedLexer.instances[-1]
+            it.close()
+            self.assertTrue(lexer.closed)
+
+    def test_table(self) -> None:
+        text = "#a 1 2 k(1)\ntext\n#a 1.0 1 k(1)\n#b x(1, 2)\n#a True\n"
+        expected = recorder.parse(text)
+        table = InstructionTable.parse(text)
+        self.assertEqual(len(table), 5)
+        self.assertEqual(table.to_list(), expected)
+        self.assertEqual([type(i) for i in table[2].args], [float, int])
+        self.assertEqual(table[-1], Instruction("a", ("True",), {}))
+        self.assertEqual(list(table.lines), [1, 2, 3, 4, 5])
+        self.assertEqual(table.names, ["a", "@text", "b"])
+        self.assertEqual(list(table.rows("a")), [0, 2, 4])
+        self.assertEqual(list(table.rows("c")), [])
+        self.assertEqual(table.select("b"), [expected[3]])
+        # 1, 2, 'k', 'text', 1.0, 'x', [1, 2], 'True'
+        self.assertEqual(len(table.pool), 8)
+        mixed = InstructionTable([Instruction("a", (1, True, 1.0, 1), {})])
+        self.assertEqual([type(i) for i in mixed[0].args], [int, bool, float, int])
+        self.assertEqual(len(mixed.pool), 3)
+        zeros = InstructionTable([Instruction("a", (0.0, -0.0, 0.0, 0), {})])
+        self.assertEqual([str(i) for i in zeros[0].args], ["0.0", "-0.0", "0.0", "0"])
+        self.assertEqual(len(zeros.pool), 3)
+
+        copy = InstructionTable(expected, lines=table.lines)
+        self.assertEqual(list(copy), expected)
+        self.assertEqual(copy.lines, table.lines)
+        self.assertEqual(
+            InstructionTable.parse_file("examples/example0.kola").to_list(),
+            recorder.parse_file("examples/example0.kola")
+        )
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_table_numpy(self) -> None:
+        table = InstructionTable.parse("#a 1 2 k(1)\ntext\n#b\n")
+        array = table.to_numpy()
+        self.assertEqual(array["code"].tolist(), [0, 1, 2])
+        self.assertEqual(array["lineno"].tolist(), [1, 2, 3])
+        self.assertEqual(array["size"].tolist(), [4, 1, 0])
+        self.assertEqual(array["nargs"].tolist(), [2, 1, 0])
+
+    def test_replay(self) -> None:
+        text = "#cmd 1\n#cmd 2 k(3)\n#enter\n#cmd 3\n#cmd 4\n#exit\n#cmd 5\ntext\nfail\n#unknown\n## note\n#cmd 6\n"
+        expected = ReplayTest()
+        expected.parse(text)
+        self.assertEqual(len(expected.log), 9)
+        self.assertEqual(len(expected.errors), 2)
+
+        for recording in (recorder.parse(text), InstructionTable.parse(text)):
+            vm = ReplayTest()
+            recorder.replay(recording, vm)
+            self.assertEqual(vm.log, expected.log)
+            self.assertEqual([i[0] for i in vm.errors], [i[0] for i in expected.errors])
+        self.assertEqual(vm.errors, expected.errors)
+
+        class StrictTest(ReplayTest):
+            def on_exception(self, exc_type: Type[KoiLangError], exc_ins: KoiLangError, traceback: TracebackType) -> bool:
+                return False
+
+        vm = StrictTest()
+        with self.assertRaises(KoiLangCommandError) as ctx:
+            recorder.replay(recorder.iter_parse(text), vm)
+        self.assertIsInstance(ctx.exception.__cause__, ValueError)
+        self.assertEqual(len(vm.log), 8)
+
+    def test_dump(self) -> None:
+        text = '#cmd 1 "str x" lit k(2) l(1, 2) d(a: 1, b: "s t")\ntext line\n## note\n#3 a b\n#e\n'
+        instructions = recorder.parse(text)
+        self.assertEqual(recorder.dumps(instructions), text)
+        self.assertEqual(recorder.dumps(InstructionTable(instructions)), text)
+        output = recorder.dumps(instructions, command_threshold=2)
+        self.assertIn("\n##### note\n", output)
+        self.assertEqual(
+            [i for i in recorder.parse(output, command_threshold=2) if i.name != "@annotation"],
+            [i for i in instructions if i.name != "@annotation"]
+        )
+
+        expected = recorder.parse_file("examples/example0.kola")
+        writer = StringWriter()
+        recorder.dump(recorder.iter_parse_file("examples/example0.kola"), writer)
+        self.assertFalse(writer.closed)
+        self.assertEqual(recorder.parse(writer.getvalue()), expected)
+
+        self.assertEqual(recorder.dumps([Instruction("@annotation", ("note",), {})]), "##note\n")
+        with self.assertRaises(ValueError):
+            recorder.dumps([Instruction("@text", ("#text",), {})])
+        with self.assertRaises(ValueError):
+            recorder.dumps([Instruction("bad name", (), {})])
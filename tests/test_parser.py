@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+from traceback import extract_tb
 from unittest import TestCase
-from kola.exception import KoiLangSyntaxError
+from kola.exception import KoiLangCommandError, KoiLangSyntaxError
 from kola.lexer import FileLexer, StringLexer
-from kola.parser import Parser
+from kola.parser import Parser, TextParts, validate
 from kola.lib.recorder import recorder
 
 
@@ -39,6 +41,181 @@ class TestParser(TestCase):
         )
         Parser(lexer, recorder).exec()
     
+    def test_text_parts(self) -> None:
+        texts = []
+
+        def text(parts: TextParts) -> None:
+            self.assertIsInstance(parts, TextParts)
+            texts.append(list(parts))
+
+        lexer = StringLexer("long text\\\n line\n#cmd 1\n", max_text_size=4)
+        parser = Parser(lexer, {"@text": text, "cmd": lambda i: i})
+        self.assertEqual(list(parser), [None, 1])
+        self.assertEqual("".join(texts[0]), "long text line")
+        self.assertTrue(all(len(i) <= 4 for i in texts[0]))
+
+        parser = Parser(StringLexer("long text\n#cmd 1\n", max_text_size=4), {"@text": lambda parts: parts})
+        parts = next(parser)
+        self.assertTrue(parts.closed)
+        with self.assertRaises(OSError):
+            next(parts)
+
+    def test_reset(self) -> None:
+        lexer = StringLexer("#a 1\n#b [")
+        parser = Parser(lexer, recorder)
+        with self.assertRaises(KoiLangSyntaxError):
+            parser.exec()
+        lexer.reset("#c 2\n#d 3")
+        parser.reset()
+        self.assertEqual([i[0] for i in parser], ["c", "d"])
+        parser.rebind(StringLexer("#e"))
+        self.assertEqual([i[0] for i in parser], ["e"])
+
+    def test_ignore(self) -> None:
+        lexer = StringLexer("#a 1\ntext\n## annotation\n#b \"x\"\n#a 2")
+        parser = Parser(lexer, {"a": lambda i: i, "@text": str}, ignore=["@annotation", "b"])
+        self.assertEqual(lexer.config.ignore, {"@annotation", "b"})
+        self.assertEqual(list(parser), [1, "text", 2])
+        parser.rebind(StringLexer("#a 3"))
+        self.assertEqual(lexer.config.ignore, set())
+        del parser
+        lexer = StringLexer("#a 1", ignore=["b"])
+        Parser(lexer, {}, ignore=["c"])
+        self.assertEqual(lexer.config.ignore, {"b"})
+
+        parser = Parser(StringLexer("## annotation\n#c"), {"a": lambda i: i})
+        with self.assertRaises(KoiLangCommandError):
+            parser.exec()
+
+    def test_arguments(self) -> None:
+        calls = []
+        parser: Parser
+
+        def command(*args, **kwds):
+            calls.append((args, kwds))
+
+        def nested(*args, **kwds):
+            # parse the next statement before returning
+            parser.exec_once()
+            calls.append((args, kwds))
+
+        args = " ".join(map(str, range(40)))
+        parser = Parser(
+            StringLexer(f"#cmd 1 k(2) 3 k(4) x(1, 2)\n#cmd k(1) y(a: 1)\n#nested 1 k(x)\n#cmd {args} z(1)\n#5 a\n#sum 1 2"),
+            {"cmd": command, "nested": nested, "@number": command, "sum": max}
+        )
+        self.assertEqual(parser.parse_args(), ((1, 3), {"k": 4, "x": [1, 2]}))
+        self.assertEqual(list(parser), [None] * 3 + [2])
+        self.assertEqual(calls, [
+            ((), {"k": 1, "y": {"a": 1}}),
+            (tuple(range(40)), {"z": 1}),
+            ((1,), {"k": "x"}),
+            ((5, "a"), {})
+        ])
+
+    def test_diagnostics(self) -> None:
+        def bad(i: int) -> None:
+            raise ValueError(i)
+
+        diagnostics = []
+        lexer = StringLexer("#a 1\n#a x-\n#a [1\n#missing\n#a k:1\n#bad 2\n#a \"\\x4\"\n#a 3")
+        parser = Parser(lexer, {"a": lambda i: i, "bad": bad}, diagnostics=diagnostics)
+        self.assertIs(lexer.diagnostics, diagnostics)
+        self.assertEqual([i for i in parser if i is not None], [1, 3])
+        self.assertEqual(
+            [(i.code, i.lineno, i.column, i.text) for i in diagnostics],
+            [
+                (1, 2, 4, b"-"), (1, 3, 3, b"["), (2, 4, 0, b"missing"),
+                (42, 5, 4, b":"), (3, 6, 0, b"bad"), (5, 7, 3, b'"\\x4"')
+            ]
+        )
+        self.assertEqual(diagnostics[0].filename, "<string>")
+        self.assertEqual(diagnostics[0].message, "[1] unknown symbol '-'")
+        self.assertIsInstance(diagnostics[4].cause, ValueError)
+
+        exc = diagnostics[4].exception()
+        self.assertIsInstance(exc, KoiLangCommandError)
+        self.assertIs(exc.__cause__, diagnostics[4].cause)
+        frame = extract_tb(exc.__traceback__)[-1]
+        self.assertEqual((frame.filename, frame.name, frame.lineno), ("<string>", "<kola>", 6))
+        self.assertIsInstance(diagnostics[0].exception(), KoiLangSyntaxError)
+
+        parser.rebind(StringLexer("#a ["))
+        parser.exec()
+        self.assertEqual(len(diagnostics), 7)
+
+    def test_check(self) -> None:
+        text = "#a 1 x(1, 2) y(k: 1)\n#a x-\n#a [1\n#a k:1\ntext\n#a (\n#a 2\n#a f(1"
+        for fast in (False, True):
+            expected = []
+            Parser(StringLexer(text, fast=fast), {"a": lambda *args, **kwds: None, "@text": str}, diagnostics=expected).exec()
+            parser = Parser(StringLexer(text, fast=fast), {})
+            diagnostics = parser.check()
+            self.assertTrue(parser.eof())
+            self.assertEqual(
+                [(i.code, i.lineno, i.column) for i in diagnostics],
+                [(1, 2, 4), (1, 3, 3), (42, 4, 4), (28, 6, 3), (16, 8, 6)]
+            )
+            self.assertEqual(
+                [(i.code, i.lineno, i.column) for i in diagnostics],
+                [(i.code, i.lineno, i.column) for i in expected]
+            )
+
+        text = "#a \"\\x4\"\n#a \"\\u00e9\" \"\u4e2d\"\n#a a ( ) (\n"
+        expected = []
+        Parser(StringLexer(text), {"a": lambda *args, **kwds: None}, diagnostics=expected).exec()
+        diagnostics = Parser(StringLexer(text), {}).check()
+        self.assertEqual([(i.code, i.text) for i in diagnostics], [(5, b'"\\x4"'), (210, b")")])
+        self.assertEqual(
+            [(i.code, i.lineno, i.column, i.text) for i in diagnostics],
+            [(i.code, i.lineno, i.column, i.text) for i in expected]
+        )
+
+        self.assertEqual(validate("examples/example0.kola"), [])
+        with ThreadPoolExecutor(4) as executor:
+            self.assertEqual(list(executor.map(validate, ["examples/example0.kola"] * 8)), [[]] * 8)
+
+    def test_pipeline(self) -> None:
+        text = "#a 1 x(1, 2) y(k: 1)\n#a x-\ntext\n#a \"\\x4\"\n#a [1\n## note\n#a 2\n" * 2000
+        for fast in (False, True):
+            expected = []
+            diagnostics = []
+            Parser(StringLexer(text, fast=fast), recorder, diagnostics=expected).exec()
+            parser = Parser(StringLexer(text, fast=fast), recorder, diagnostics=diagnostics, pipeline=2)
+            self.assertEqual(parser.lexer.pipeline, 2)
+            self.assertEqual(list(parser), list(Parser(StringLexer(text, fast=fast), recorder, diagnostics=[])))
+            self.assertEqual(
+                [(i.code, i.lineno, i.column, i.text) for i in diagnostics],
+                [(i.code, i.lineno, i.column, i.text) for i in expected]
+            )
+            self.assertTrue(parser.eof())
+
+        parser = Parser(StringLexer(text), recorder, pipeline=1)
+        self.assertEqual(parser.exec_once(), ("a", (1,), {"x": [1, 2], "y": {"k": 1}}))
+        try:
+            parser.exec()
+        except KoiLangSyntaxError as e:
+            self.assertEqual(extract_tb(e.__traceback__)[-1].lineno, 2)
+        else:
+            self.fail("KoiLangSyntaxError not raised")
+        self.assertEqual(parser.exec_once(), ("@text", ("text",), {}))
+
+        lexer = FileLexer("examples/example0.kola", read_ahead=2, block_size=7)
+        lexer.start_pipeline(4)
+        self.assertEqual(
+            [(i.syn, i.val, i.lineno) for i in lexer],
+            [(i.syn, i.val, i.lineno) for i in FileLexer("examples/example0.kola")]
+        )
+        lexer.rebind("examples/example0.kola")
+        self.assertEqual(lexer.pipeline, 0)
+        lexer.start_pipeline(1)
+        next(lexer)
+        with self.assertRaises(RuntimeError):
+            lexer.config.ignore = ["@text"]
+        lexer.close()
+        self.assertTrue(lexer.closed)
+        self.assertEqual(lexer.pipeline, 0)
+
     def test_recovery(self) -> None:
         lexer = StringLexer(
             """
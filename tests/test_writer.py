@@ -1,9 +1,17 @@
+import asyncio
+import bz2
+import gzip
+import hashlib
+import lzma
 import os
+from io import BytesIO, StringIO
 from shutil import rmtree
 from unittest import TestCase
 
 from kola.klvm import KoiLang, kola_command
-from kola.writer import WF_COMPLEX_ITEM, WI_NEWLINE, BaseWriter, ComplexArg, FileWriter, StringWriter, WF_ARG_ITEM
+from kola.writer import (
+    WF_ARG_ITEM, WF_COMPLEX_ITEM, WI_NEWLINE, AsyncStreamWriter, BaseWriter, ComplexArg, FileWriter, StringWriter, TeeWriter
+)
 
 
 class TestWriter(TestCase):
@@ -37,6 +45,147 @@ class TestWriter(TestCase):
                 "Hello world\n"
             )
     
+    def test_compression(self) -> None:
+        text = "".join(f"#line {i} \"Hello world\"\n" for i in range(10000))
+        for path, opener in [
+            ("test-tmp/02.kola.gz", gzip.open),
+            ("test-tmp/02.kola.bz2", bz2.open),
+            ("test-tmp/02.kola.xz", lzma.open)
+        ]:
+            with FileWriter(path) as w:
+                self.assertIsNotNone(w.compression)
+                for i in range(10000):
+                    w.write_command("line", i, "Hello world")
+            with opener(path, "rt", encoding="utf-8") as fr:
+                self.assertEqual(fr.read(), text)
+        
+        with FileWriter("test-tmp/03.kola", compression="gzip") as w:
+            self.assertEqual(w.compression, "gzip")
+            w.write_text("Hello world")
+        with gzip.open("test-tmp/03.kola", "rt") as fr:
+            self.assertEqual(fr.read(), "Hello world\n")
+        with FileWriter("test-tmp/03.kola.gz", compression=None) as w:
+            self.assertIsNone(w.compression)
+            w.write_text("Hello world")
+        with open("test-tmp/03.kola.gz") as fr:
+            self.assertEqual(fr.read(), "Hello world\n")
+        with self.assertRaises(ValueError):
+            FileWriter("test-tmp/03.kola", compression="zip")
+        # the file is released without running the compressor
+        w = FileWriter("test-tmp/04.kola.gz")
+        w.write_text("Hello world")
+        del w
+        with open("test-tmp/04.kola.gz", "rb") as fr:
+            self.assertEqual(fr.read(), b"")
+
+    def test_tee(self) -> None:
+        class Vm(KoiLang):
+            @kola_command
+            def echo(self, text: str) -> None:
+                ...
+        
+        text = "".join(f"#echo \"你好，世界 {i}\"\n" for i in range(100))
+        digest = hashlib.sha256()
+        bio = BytesIO()
+        sio = StringIO()
+        sw = StringWriter()
+        with FileWriter("test-tmp/05.kola.gz") as fw:
+            with TeeWriter(fw, sw, bio, sio, digest.update, buffer_size=64) as tee:
+                wr = Vm.writer(tee)
+                for i in range(100):
+                    wr.echo(f"你好，世界 {i}")
+                tee.flush()
+                self.assertEqual(sio.getvalue(), text)
+            self.assertFalse(fw.closed)
+        self.assertEqual(sw.getvalue(), text)
+        self.assertEqual(bio.getvalue(), text.encode())
+        self.assertEqual(digest.hexdigest(), hashlib.sha256(text.encode()).hexdigest())
+        with gzip.open("test-tmp/05.kola.gz", "rt", encoding="utf-8") as fr:
+            self.assertEqual(fr.read(), text)
+        
+        with TeeWriter(FileWriter("test-tmp/06.kola"), close_sinks=True) as tee:
+            tee.write_text("Hello")
+        self.assertTrue(tee.sinks[0].closed)
+        with self.assertRaises(TypeError):
+            TeeWriter(None)
+
+        # the sinks are only written by an explicit flush or close
+        chunks = []
+        tee = TeeWriter(chunks.append)
+        tee.write_text("Hello")
+        del tee
+        self.assertEqual(chunks, [])
+
+    def test_drain(self) -> None:
+        with StringWriter(chunk_size=16) as w:
+            self.assertEqual(w.chunk_size, 16)
+            w.write_text("Hello world")
+            w.write_command("echo", "Hello world")
+            self.assertEqual(w.getvalue(), "Hello world\n#echo \"Hello world\"\n")
+            self.assertIs(w.getvalue(), w.getvalue())
+            self.assertEqual(w.drain(), "Hello world\n#echo \"Hello world\"\n")
+            self.assertEqual(w.drain(), "")
+
+            for i in range(8):
+                w.write_command("line", i)
+            chunks = list(w.iter_chunks())
+            self.assertEqual(len(chunks), 4)
+            self.assertTrue(all(len(i) <= 16 for i in chunks))
+            self.assertEqual("".join(chunks), "".join(f"#line {i}\n" for i in range(8)))
+            self.assertEqual(w.getvalue(), "")
+
+            for i in range(1, 9):
+                w.write_command("cmd", "x" * i)
+            chunks = list(w.iter_chunks())
+            self.assertTrue(all(len(i) <= 16 for i in chunks))
+            self.assertEqual("".join(chunks), "".join(f"#cmd {'x' * i}\n" for i in range(1, 9)))
+        with self.assertRaises(ValueError):
+            StringWriter(chunk_size=-1)
+        with StringWriter(chunk_size=4) as w:
+            w.write_text("Hello world")
+            self.assertIn("Hello world", list(w.iter_chunks()))
+    
+    def test_async_stream(self) -> None:
+        class Vm(KoiLang):
+            @kola_command
+            def line(self, i: int) -> None:
+                ...
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            received.set_result(await reader.read())
+            writer.close()
+
+        async def main() -> bytes:
+            nonlocal received
+            received = asyncio.get_running_loop().create_future()
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            _, stream = await asyncio.open_connection("127.0.0.1", port)
+            async with AsyncStreamWriter(stream, high_water=16) as w:
+                self.assertEqual(w.high_water, 16)
+                wr = Vm.writer(w)
+                for i in range(8):
+                    wr.line(i)
+                    await wr.adrain()
+                wr.line(114514)
+            self.assertTrue(w.closed)
+            with self.assertRaises(OSError):
+                w.write_text("Hello")
+            data = await received
+            server.close()
+            await server.wait_closed()
+            return data
+
+        received: "asyncio.Future[bytes]"
+        self.assertEqual(
+            asyncio.run(main()).decode(),
+            "".join(f"#line {i}\n" for i in range(8)) + "#line 114514\n"
+        )
+        with Vm.writer() as wr:
+            wr.line(1)
+            self.assertEqual(wr.drain(), "#line 1\n")
+            self.assertEqual(wr.drain(), "")
+    
     def test_command(self) -> None:
         with StringWriter() as w:
             w.write_command(1)
@@ -94,6 +243,28 @@ class TestWriter(TestCase):
             def raw_write(self) -> None:
                 ...
         
+        with Vm.writer() as w:
+            with self.assertRaises(TypeError):
+                w.echo()
+            with self.assertRaises(TypeError):
+                w.echo("Hello", "world")
+            with self.assertRaises(TypeError):
+                w.echo("Hello", text="world")
+            with self.assertRaises(TypeError):
+                w.echo(txt="Hello")
+            with self.assertRaises(TypeError):
+                w.echo(["Hello"])
+            w.echo(text="Hello")
+            self.assertEqual(w.getvalue(), "#echo text(Hello)\n")
+        with Vm.writer(validate=False) as w:
+            w.echo()
+            self.assertEqual(w.getvalue(), "#echo\n")
+        
+        with Vm.writer("test-tmp/04.kola.gz") as w:
+            w.echo("Hello")
+        with gzip.open("test-tmp/04.kola.gz", "rt") as fr:
+            self.assertEqual(fr.read(), "#echo Hello\n")
+        
         with Vm.writer() as w:
             w.echo("Hello")
             with self.assertRaises(AttributeError):